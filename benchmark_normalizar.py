@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark de core.utils.normalizar em um texto de ~1 MB.
+Compara a remoção de acentos por tabela (str.translate) com a implementação anterior
+(NFD + filtro caractere a caractere) e o cache LRU de strings curtas.
+"""
+
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.append(str(Path(__file__).parent))
+
+from core.utils import normalizar, _normalizar_texto_curto
+
+TAMANHO_TEXTO = 1024 * 1024
+REPETICOES = 5
+
+TRECHO_CCT = (
+    "CERTIFICADO DE CONFORMIDADE TÉCNICA - Certificação Inicial\n"
+    "Solicitante: Indústria e Comércio de Eletrônicos Ltda. - São Paulo/SP\n"
+    "Equipamento: Transceptor de Radiação Restrita; Modelo: XR-1000\n"
+    "Normas: Ato nº 14448, de 4 de dezembro de 2017; Resolução nº 680 da Anatel\n"
+    "Relatório de ensaio emitido por laboratório acreditado (avaliação da conformidade)\n"
+)
+
+NOMES_CURTOS = [
+    "Fundação CPqD", "Associação LMP Certificações", "Transceptor de Radiação Restrita",
+    "Indústria e Comércio de Eletrônicos Ltda.", "XR-1000", "Telefone Móvel Celular"
+]
+
+
+def normalizar_anterior(s: str) -> str:
+    """Implementação anterior de normalizar (referência do benchmark)."""
+    s = s.strip().lower()
+    return ''.join(
+        c for c in unicodedata.normalize('NFD', s)
+        if unicodedata.category(c) != 'Mn'
+    )
+
+
+def medir(funcao, argumento, repeticoes: int = REPETICOES) -> float:
+    """Retorna o menor tempo (segundos) entre as repetições."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao(argumento)
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+def main():
+    texto = (TRECHO_CCT * (TAMANHO_TEXTO // len(TRECHO_CCT) + 1))[:TAMANHO_TEXTO]
+
+    # Primeira chamada fora da medição: monta a tabela de remoção de acentos
+    assert normalizar(texto) == normalizar_anterior(texto)
+
+    tempo_anterior = medir(normalizar_anterior, texto)
+    tempo_atual = medir(normalizar, texto)
+    print(f"Texto de {len(texto) / 1024:.0f} KB ({REPETICOES} repetições, menor tempo):")
+    print(f"  NFD + filtro por caractere: {tempo_anterior * 1000:8.1f} ms")
+    print(f"  Tabela (str.translate):     {tempo_atual * 1000:8.1f} ms  ({tempo_anterior / tempo_atual:.1f}x)")
+
+    # Strings curtas repetidas (nomes de solicitante, laboratório, equipamentos)
+    consultas = NOMES_CURTOS * 20000
+    _normalizar_texto_curto.cache_clear()
+    inicio = time.perf_counter()
+    for nome in consultas:
+        normalizar_anterior(nome)
+    tempo_curtas_anterior = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    for nome in consultas:
+        normalizar(nome)
+    tempo_curtas_atual = time.perf_counter() - inicio
+    print(f"{len(consultas)} strings curtas:")
+    print(f"  NFD + filtro por caractere: {tempo_curtas_anterior * 1000:8.1f} ms")
+    print(f"  Cache LRU:                  {tempo_curtas_atual * 1000:8.1f} ms  "
+          f"({tempo_curtas_anterior / tempo_curtas_atual:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,33 @@
 from pdf2image import convert_from_path
-import pymupdf as fitz
 import pytesseract
+import hashlib
 import json
 import re
 import unicodedata
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set#, Any 
+from typing import Dict, List, Optional, Tuple, Set, TextIO#, Any 
+import shutil
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 from core.utils import (
-    extrair_normas_por_padrao, processar_requerimentos_excel, extract_pdf_content_from_ocr,
-    carregar_json_com_fallback
+    extrair_normas_por_padrao, AtualizadorPlanilhaExcel, normalizar_ids_normas, estatisticas_normalizacao_normas,
+    carregar_json_com_fallback, DocumentoExtraido, CacheExtracaoPDF, AutomatoPalavrasChave,
+    obter_dados_referencia, CacheResultadosAnalise, compilar_latex, mesclar_pdfs, ArquivoResultadosJSONL
 )
 from core.log_print import log_info, log_erro, log_erro_critico
 from core.const import (
     TESSERACT_PATH, JSON_FILES, GIT_COMMANDS, GIT_TIMEOUT, VERSAO_PADRAO,
     TBN_FILES_FOLDER, SEPARADOR_LINHA, SEPARADOR_MENOR, REQUERIMENTOS_DIR_INBOX, REQUERIMENTOS_DIR_REPORT,
-    UTILS_DIR, EXT_PDF, EXT_JSON, EXT_TEX, GLOB_PDF,
+    UTILS_DIR, EXT_PDF, EXT_JSONL, GLOB_PDF,
     STATUS_CONFORME, STATUS_NAO_CONFORME, STATUS_INCONCLUSIVO, STATUS_ERRO, STATUS_PROCESSADO,
     VALOR_NAO_DISPONIVEL, ENCODING_UTF8, PALAVRAS_CHAVE_MANUAL,
-    TIPOS_DOCUMENTOS, MIN_FILE_SIZE
+    TIPOS_DOCUMENTOS, CACHE_DIR, CACHE_EXTRACAO_DIR, WORKERS_ANALISE_PADRAO,
+    PALAVRAS_CHAVE_LIMITE_PALAVRA, CACHE_RESULTADOS_DIR, CACHE_RESULTADOS_VERSAO, CACHE_EXTRACAO_VERSAO,
+    DIAS_ARQUIVO_RECENTE, LATEX_BUILD_DIR, LATEX_FRAGMENTOS_DIR, LATEX_FRAGMENTOS_VERSAO,
+    LATEX_INDIVIDUAIS_DIR, LATEX_COMPILACOES_PARALELAS, LATEX_TIMEOUT_COMPILACAO,
+    PADROES_OCD, EXTRACAO_CCT_POR_SECAO
 )
 
 # Constantes para tipos de documento (chaves da estrutura TIPOS_DOCUMENTOS)
@@ -32,14 +39,24 @@ TIPO_ART = 'art'
 TIPO_FOTOS = 'fotos'
 TIPO_CONTRATO_SOCIAL = 'contrato_social'
 TIPO_OUTROS = 'outros'
+
+# Itens da análise de RACT que dependem da idade do arquivo (recalculados ao reaproveitar o cache)
+CONFORMIDADE_ARQUIVO_RECENTE = "Arquivo relativamente recente"
+PREFIXO_OBSERVACAO_ARQUIVO_ANTIGO = "Arquivo modificado há"
+
+# Tipos cuja análise usa apenas o texto nativo do PDF (sem OCR das páginas escaneadas)
+TIPOS_SEM_OCR = {TIPO_MANUAL, TIPO_OUTROS}
+
+# Palavras-chave de PALAVRAS_CHAVE_MANUAL em minúsculas e ordenadas, e autômato compilado
+# uma única vez para contá-las em uma só passada pelo texto de cada documento
+PALAVRAS_CHAVE_ORDENADAS = sorted(palavra.lower() for palavra in PALAVRAS_CHAVE_MANUAL.keys())
+AUTOMATO_PALAVRAS_CHAVE = AutomatoPalavrasChave(PALAVRAS_CHAVE_ORDENADAS, PALAVRAS_CHAVE_LIMITE_PALAVRA)
 from core.utils import (
-    formatar_cnpj, desformatar_cnpj, latex_escape_path, escapar_latex, buscar_valor,
+    formatar_cnpj, desformatar_cnpj, latex_escape_path, escapar_latex,
     normalizar, normalizar_dados, obter_versao_git, carregar_json, salvar_json, validar_cnpj, fullpath_para_req
 )
 
 
-PYMUPDF_DISPONIVEL = True
-
 try:    
     OCR_DISPONIVEL = True
     # Configurar caminho do Tesseract se necessário
@@ -55,6 +72,22 @@ except ImportError:
 # ================================
 
 
+# Padrões de início/fim da seção de normas de cada OCD, compilados uma única vez
+PADROES_OCD_COMPILADOS = {
+    cnpj: {
+        **config,
+        'inicio': re.compile(config['start_pattern'], re.IGNORECASE),
+        'fim': re.compile(config['end_pattern'], re.IGNORECASE)
+    }
+    for cnpj, config in PADROES_OCD.items()
+}
+
+# Hash dos padrões de seção dos OCDs: alterá-los invalida os resultados em cache
+ASSINATURA_PADROES_OCD = hashlib.sha256(
+    json.dumps(PADROES_OCD, sort_keys=True, ensure_ascii=False).encode('utf-8')
+).hexdigest()
+
+
 class CCTAnalyzerIntegrado:
     """
     Versão integrada do CCTAnalyzer com todas as funcionalidades necessárias.
@@ -63,32 +96,9 @@ class CCTAnalyzerIntegrado:
     
     def __init__(self, utils_dir: Path):
         self.utils_dir = utils_dir
+        # Registro de dados de referência (ocds, normas, equipamentos, requisitos) do processo
+        self.dados_referencia = obter_dados_referencia(utils_dir)
         
-    def extract_pdf_content(self, pdf_path: Path) -> Optional[str]:
-        """
-        Extrai conteúdo de PDF usando PyMuPDF ou OCR como fallback.
-        """
-        try:
-            if not PYMUPDF_DISPONIVEL:
-                log_erro("PyMuPDF não disponível. Tentando OCR...")
-                return extract_pdf_content_from_ocr(pdf_path)
-            
-            #log_info(f"Extraindo conteúdo de: {pdf_path.name}")
-            
-            with fitz.open(pdf_path) as pdf:
-                content = ""                              
-                for pagina in pdf:
-                    content += str(pagina.get_text("text")) + "\n"
-                if len(content.strip()) < MIN_FILE_SIZE:
-                    #log_info(f"PDF aparentemente vazio, tentando OCR: {pdf_path.name}")
-                    content = extract_pdf_content_from_ocr(pdf_path)
-                
-            return content
-            
-        except Exception as e:
-            log_erro(f"Falha ao extrair {pdf_path.name}: {e}")
-            return None
-
     '''def extract_ocd_from_content(self, content: str) -> Optional[str]:
         """
         Identifica o OCD baseado no conteúdo do certificado.
@@ -122,28 +132,15 @@ class CCTAnalyzerIntegrado:
         return None
     '''
     def get_ocd_name(self, cnpj: Optional[str]) -> str:
-        """Obtém nome do OCD a partir do CNPJ consultando ocds.json"""
+        """Obtém nome do OCD a partir do CNPJ consultando o índice de ocds.json"""
         if not cnpj:
             return "[ERRO] CNPJ não informado"
         
-        ocds_file = self.utils_dir / "ocds.json"
-        
         try:
-            if ocds_file.exists():
-                with open(ocds_file, 'r', encoding='utf-8') as f:
-                    ocds_data = json.load(f)
-                
-                # Normalizar CNPJ de entrada (remover formatação se houver)
-                cnpj_numeros = desformatar_cnpj(cnpj)
-                cnpj_formatado = formatar_cnpj(cnpj_numeros)
-                
-                # Buscar por CNPJ formatado ou por números
-                for ocd in ocds_data:
-                    cnpj_ocd = ocd.get('cnpj')
-                    if cnpj_ocd:
-                        # Comparar tanto com formato quanto com números
-                        if cnpj_ocd == cnpj_formatado or desformatar_cnpj(cnpj_ocd) == cnpj_numeros:
-                            return ocd.get('nome', f"[ERRO] Nome não encontrado para CNPJ: {cnpj}")
+            # Busca pelo CNPJ normalizado (apenas números), com ou sem formatação
+            ocd = self.dados_referencia.ocd_por_cnpj(cnpj)
+            if ocd is not None:
+                return ocd.get('nome', f"[ERRO] Nome não encontrado para CNPJ: {cnpj}")
 
             return f"[ERRO] OCD não cadastrado (CNPJ: {cnpj})"
             
@@ -151,39 +148,18 @@ class CCTAnalyzerIntegrado:
             log_erro(f"Falha ao consultar ocds.json: {e}")
             return f"[ERRO] OCD não cadastrado (CNPJ: {cnpj})"
 
-    def extract_tipo_equipamento(self, content: str) -> List[Dict]:
+    def extract_tipo_equipamento(self, content: str, ja_normalizado: bool = False) -> List[Dict]:
         """
         Extrai tipos de equipamento consultando equipamentos.json e buscando matches no conteúdo.
+        Usa o índice de equipamentos do processo (reconstruído apenas se o JSON mudar).
+        Com ja_normalizado, o conteúdo é o texto já normalizado do documento.
         """
-        equipamentos_encontrados = []
-        equipamentos_file = self.utils_dir / "equipamentos.json"
-        
         try:
-            if not equipamentos_file.exists():
-                log_erro(f"Arquivo {equipamentos_file} não encontrado")
+            if not self.dados_referencia.arquivo_existe('equipamentos'):
+                log_erro(f"Arquivo {self.dados_referencia.caminhos['equipamentos']} não encontrado")
                 return []
-                
-            with open(equipamentos_file, 'r', encoding='utf-8') as f:
-                equipamentos_data = json.load(f)
-            
-            content_normalizado = normalizar(content)
-            content_normalizado = content_normalizado.replace("\n", " ")
-            content_normalizado = re.sub(r'\s+', ' ', content_normalizado).strip()
-            for equipamento in equipamentos_data:
-                if isinstance(equipamento, dict) and 'nome' in equipamento:
-                    nome_equipamento = equipamento['nome']
-                    nome_normalizado = normalizar(nome_equipamento)
-                    
-                    if nome_normalizado in content_normalizado:
-                        ja_existe = any(
-                            eq.get('nome') == nome_equipamento 
-                            for eq in equipamentos_encontrados
-                        )
-                        
-                        if not ja_existe:
-                            equipamentos_encontrados.append(equipamento)
             
-            return equipamentos_encontrados
+            return self.dados_referencia.equipamentos_no_texto(content, ja_normalizado)
             
         except Exception as e:
             log_erro(f"Falha ao consultar equipamentos.json: {e}")
@@ -191,151 +167,29 @@ class CCTAnalyzerIntegrado:
 
     def _get_ocd_patterns(self) -> Dict[str, Dict]:
         """
-        Define os padrões de extração para cada OCD usando CNPJ como chave.
+        Retorna os padrões de extração de cada OCD (CNPJ como chave), com os padrões de
+        início/fim da seção já compilados uma única vez na carga do módulo.
         """
-        return {
-            #DEKRA CERTIFICATION B.V.
-            "26.600.714/0001-24": {
-                "start_pattern": r"Reference\s+Standards",
-                "end_pattern": r"Certificação\s+Inicial",
-                "processing_type": "custom",
-                "custom_patterns": ['ATO', 'RESOLUÇÃO']
-            },
-            #PCN DO BRASIL TELECOMUNICAÇÕES
-            "32.193.729/0001-18": {
-                "start_pattern": r"Regulation\s+applied\s+to\s+the\s+product",
-                "end_pattern": r"5\s*-\s*RELAÇÃO\s+DE\s+LABORATÓRIO",
-                "processing_type": "custom",
-                "custom_patterns": ['ATO', 'RESOLUÇÃO']
-            },
-            # Moderna Tecnologia LTDA
-            "44.458.010/0001-40": {
-                "start_pattern": r'Fabricante',
-                "end_pattern": r'Diretor\s+de\s+Tecnologia',
-                "processing_type": "custom",
-                "custom_patterns": ['ATO', 'RESOLUÇÃO']
-            },
-            # Associação NCC Certificações do Brasil
-            "04.192.889/0001-07": {
-                "start_pattern": r'Regulation\s+Applicable',
-                "end_pattern": r'Conforme\s+os\s+termos\s+do\s+Ato\s+de\s+Designação\s+nº\s+16\.955',
-                "processing_type": "custom",
-                "custom_patterns": ['ATO', 'RESOLUÇÃO']
-            },
-            # Brics Certificacoes de Sistemas de Gestao e Produtos Ltda
-            "16.884.899/0001-92": {
-                "start_pattern": r'Documento\s+Normativo:',
-                "end_pattern": r'Tipo\s+de\s+Produto',
-                "processing_type": "custom",
-                "custom_patterns": ['ATO', 'RESOLUÇÃO']
-            },
-            # ABCP Certificadora de Produtos LTDA (estimativa baseada no nome)
-            "00.000.000/0001-01": {
-                "start_pattern": r'Normas?\s+Verificadas?',
-                "end_pattern": r'ABCP\s+Certificadora',
-                "processing_type": "regex_patterns"
-            },
-            # ACERT ORGANISMO DE CERTIFICACAO (estimativa baseada no nome)
-            "00.000.000/0001-02": {
-                "start_pattern": r'Standards?\s+(?:Applied|Verified)',
-                "end_pattern": r'ACERT\s+ORGANISMO',
-                "processing_type": "regex_patterns"
-            },
-            # SGS do Brasil Ltda (estimativa baseada no nome)
-            "00.000.000/0001-03": {
-                "start_pattern": r'Technical\s+Standards?',
-                "end_pattern": r'SGS\s+do\s+Brasil',
-                "processing_type": "regex_patterns"
-            },
-            # BraCert – BRASIL CERTIFICAÇÕES LTDA (estimativa baseada no nome)
-            "00.000.000/0001-04": {
-                "start_pattern": r'Normas?\s+Aplicadas?',
-                "end_pattern": r'BraCert.*BRASIL\s+CERTIFICAÇÕES',
-                "processing_type": "regex_patterns"
-            },
-            # CCPE – CENTRO DE CERTIFICAÇÃO (estimativa baseada no nome)
-            "00.000.000/0001-05": {
-                "start_pattern": r'Technical\s+Standards?',
-                "end_pattern": r'CCPE.*CENTRO\s+DE\s+CERTIFICAÇÃO',
-                "processing_type": "regex_patterns"
-            },
-            # OCD-Eldorado (estimativa baseada no nome)
-            "00.000.000/0001-06": {
-                "start_pattern": r'NORMAS\s+APLICÁVEIS/\s+APPLICABLE\s+STANDARDS',
-                "end_pattern": r'O\s+OCD-Eldorado\s+atribui\s+a\s+certificação\s-aos\s+produtos\s+mencionados\s+acima',
-                "processing_type": "custom",
-                "custom_patterns": ['ATO', 'RESOLUÇÃO']
-            },
-            # Organismo ICC (estimativa baseada no nome)
-            "00.000.000/0001-07": {
-                "start_pattern": r'Regulation\s+Applicable',
-                "end_pattern": r'O\s+organismo\s+ICC\s+no\s+uso\s+das\s+atribuições\s+que\s+lhe\s+confere\s+o\s+Ato\s+de\s+Designação',
-                "processing_type": "custom",
-                "custom_patterns": ['ATO', 'RESOLUÇÃO']
-            },
-            # Master Associação de Avaliação de Conformidade
-            "07.832.680/0001-59": {
-                "start_pattern": r'Reference\s+Standards',
-                "end_pattern": r'LABORATÓRIOS\s+DE\s+ENSAIOS',
-                "processing_type": "custom",
-                "custom_patterns": ['ATO', 'RESOLUÇÃO']
-            },
-            # OCP-TELI - ORGANIZAÇÃO CERTIFICADORA DE PRODUTOS DE TELECOMUNICAÇÕES E INFORMÁTICA
-            "04.538.402/0001-03": {
-                "start_pattern": r'Regulamentos\s+Aplicáveis:',
-                "end_pattern": r'OCD\s+designado\s+pelo\s+Ato\s+nº\s+19\.434',
-                "processing_type": "custom",
-                "custom_patterns": ['ATO', 'RESOLUÇÃO']
-            },
-            # TÜV (estimativa baseada no nome)
-            "00.000.000/0001-08": {
-                "start_pattern": r'Standards?\s+Applied',
-                "end_pattern": r'TÜV',
-                "processing_type": "regex_patterns"
-            },
-            # UL do Brasil Ltda
-            "02.839.483/0001-48": {
-                "start_pattern": r'normative\s+documents',
-                "end_pattern": r'e\s+atesta\s+que\s+o\s+produto\s+para\s+telecomunicações\s+está\s+em\s+conformidade',
-                "processing_type": "custom",
-                "custom_patterns": ['ATO', 'RESOLUÇÃO']
-            },
-            # UL do Brasil Certificações
-            "04.830.102/0001-95": {
-                "start_pattern": r'normative\s+documents',
-                "end_pattern": r'e\s+atesta\s+que\s+o\s+produto\s+para\s+telecomunicações\s+está\s+em\s+conformidade',
-                "processing_type": "custom",
-                "custom_patterns": ['ATO', 'RESOLUÇÃO']
-            },
-            # QC Certificações (estimativa baseada no nome)
-            "00.000.000/0001-09": {
-                "start_pattern": r'Certification\s+programor\s+regulation',
-                "end_pattern": r'Emissão',
-                "processing_type": "custom",
-                "custom_patterns": ['ATO', 'RESOLUÇÃO']
-            },
-            # Associação Versys de Tecnologia
-            "26.352.661/0001-70": {
-                "start_pattern": r'Applicable\s+Standards:',
-                "end_pattern": r'Data\s+Certificação',
-                "processing_type": "custom",
-                "custom_patterns": ['ATO', 'RESOLUÇÃO']
-            },
-            # FUNDACAO CENTRO DE PESQUISA E DESENVOLVIMENTO DE TELECOMUNICACOES- CPQD.
-            "02.641.663/0001-10": {
-                "start_pattern": r'Technical\s+Standards:',
-                "end_pattern": r'Relatório\s+de\s+Conformidade\s',
-                "processing_type": "custom",
-                "custom_patterns": ['ATO', 'RESOLUÇÃO']
-            },
-            # Associação LMP Certificações (estimativa baseada no nome)
-            "00.000.000/0001-10": {
-                "start_pattern": r'Certificamos\s+que\s+o\s+produto\s+está\s+em\s+conformidade\s+com\s+as\s+seguintes\s+referências:',
-                "end_pattern": r'Organismo\s+de\s+Certificação\s+Designado\s+pela\s+ANATEL\s+—\s+Agência\s+Nacional\s+de\s+Telecomunicações',
-                "processing_type": "custom",
-                "custom_patterns": ['ATO', 'RESOLUÇÃO'] 
-            }
-        }
+        return PADROES_OCD_COMPILADOS
+
+    def extrair_secao_ocd(self, content: str, cnpj_ocd: str) -> Optional[str]:
+        """
+        Recorta do CCT a seção entre start_pattern e end_pattern do OCD.
+        
+        Returns:
+            Texto da seção (até o fim do documento se o fim não for encontrado) ou None
+            se o OCD não tem padrões cadastrados ou o início da seção não foi encontrado
+        """
+        cnpj_normalizado = desformatar_cnpj(cnpj_ocd) if cnpj_ocd else ""
+        ocd_config = self._get_ocd_patterns().get(formatar_cnpj(cnpj_normalizado) if cnpj_normalizado else "")
+        if not ocd_config:
+            return None
+        
+        inicio = ocd_config['inicio'].search(content)
+        if not inicio:
+            return None
+        fim = ocd_config['fim'].search(content, inicio.end())
+        return content[inicio.end():fim.start() if fim else len(content)]
 
     def _extract_normas_by_pattern(self, content: str) -> List[str]:
         """
@@ -372,14 +226,27 @@ class CCTAnalyzerIntegrado:
         
         return list(set(normas))  # Remove duplicatas
 
-    def extract_data_from_cct(self, content: str, cnpj_ocd: str, nome_ocd: str | None) -> Dict:
+    def extract_data_from_cct(self, content: str, cnpj_ocd: str, nome_ocd: str | None,
+                              documento: Optional[DocumentoExtraido] = None) -> Dict:
         """
         Extrai todas as variáveis necessárias do CCT.
+        
+        Com EXTRACAO_CCT_POR_SECAO, as normas são buscadas apenas na seção delimitada pelos
+        padrões do OCD (menos falsos positivos); o texto completo só é usado se a seção não
+        for localizada ou nenhuma norma for encontrada nela. Os equipamentos são sempre
+        buscados no texto completo, pois a seção das normas nem sempre os contém.
+        Com o documento de origem, essa busca reaproveita o texto já normalizado do documento.
         """
-        tipo_equipamento = self.extract_tipo_equipamento(content)
+        if documento is not None:
+            tipo_equipamento = self.extract_tipo_equipamento(documento.texto_normalizado, ja_normalizado=True)
+        else:
+            tipo_equipamento = self.extract_tipo_equipamento(content)
         
+        secao = self.extrair_secao_ocd(content, cnpj_ocd) if EXTRACAO_CCT_POR_SECAO else None
         if cnpj_ocd:
-            normas_verificadas = self._extract_normas_by_pattern(content)#, cnpj_ocd)
+            normas_verificadas = self._extract_normas_by_pattern(secao) if secao else []
+            if not normas_verificadas:
+                normas_verificadas = self._extract_normas_by_pattern(content)#, cnpj_ocd)
         else:
             normas_verificadas = []
             
@@ -388,6 +255,7 @@ class CCTAnalyzerIntegrado:
             'nome_ocd': nome_ocd or 'N/A',
             'tipo_equipamento': tipo_equipamento,
             'normas_verificadas': normas_verificadas,
+            'secao_ocd_localizada': secao is not None,
             'conteudo_extraido': len(content) > 0,
             'timestamp_extracao': datetime.now().isoformat()
         }
@@ -408,15 +276,9 @@ class CCTAnalyzerIntegrado:
             if not normas_verificadas:
                 return False, ["Nenhuma norma verificada encontrada"]
             
-            # Carregar requisitos
-            requisitos_file = self.utils_dir / "requisitos.json"
-            
-            if not requisitos_file.exists():
+            if not self.dados_referencia.arquivo_existe('requisitos'):
                 return True, []  # Se não há arquivo de requisitos, considera válido
             
-            with open(requisitos_file, 'r', encoding='utf-8') as f:
-                requisitos_data = json.load(f)
-            
             normas_nao_verificadas = []
             
             for equipamento in tipo_equipamento:
@@ -424,22 +286,18 @@ class CCTAnalyzerIntegrado:
                 if not equipamento_id:
                     continue
                 
-                # Buscar normas necessárias para este equipamento
-                for req in requisitos_data:
-                    if req.get('equipamento') == equipamento_id:
-                        normas_necessarias = req.get('norma', [])
-                        
-                        for norma_necessaria in normas_necessarias:
-                            # Verificar se a norma está nas verificadas
-                            norma_encontrada = False
-                            for norma_verificada in normas_verificadas:
-                                if norma_necessaria.lower() in norma_verificada.lower():
-                                    norma_encontrada = True
-                                    break
-                            
-                            if not norma_encontrada:
-                                if norma_necessaria not in normas_nao_verificadas:
-                                    normas_nao_verificadas.append(norma_necessaria)
+                # Normas necessárias para este equipamento (todos os registros de requisitos.json)
+                for norma_necessaria in self.dados_referencia.normas_requeridas(equipamento_id, todos_registros=True):
+                    # Verificar se a norma está nas verificadas
+                    norma_encontrada = False
+                    for norma_verificada in normas_verificadas:
+                        if norma_necessaria.lower() in norma_verificada.lower():
+                            norma_encontrada = True
+                            break
+                    
+                    if not norma_encontrada:
+                        if norma_necessaria not in normas_nao_verificadas:
+                            normas_nao_verificadas.append(norma_necessaria)
             
             return len(normas_nao_verificadas) == 0, normas_nao_verificadas
             
@@ -454,7 +312,8 @@ class AnalisadorRequerimentos:
     Gerencia a análise de documentos e geração de relatórios.
     """
     
-    def __init__(self):
+    def __init__(self, workers: int = WORKERS_ANALISE_PADRAO, incremental: bool = False, rascunho: bool = False,
+                 por_requerimento: bool = False, retomar: bool = False):
         # Usar constante centralizada para diretório base
         self.pasta_base = Path(TBN_FILES_FOLDER) / REQUERIMENTOS_DIR_INBOX
         self.pasta_resultados = Path(TBN_FILES_FOLDER) / REQUERIMENTOS_DIR_REPORT
@@ -462,21 +321,225 @@ class AnalisadorRequerimentos:
         
         # Carregar configurações
         self.regras = carregar_json_com_fallback(JSON_FILES['regras'])
-        self.equipamentos = carregar_json_com_fallback(JSON_FILES['equipamentos'])
-        self.requisitos = carregar_json_com_fallback(JSON_FILES['requisitos'])
-        self.normas = carregar_json_com_fallback(JSON_FILES['normas'])
-        self.ocds = carregar_json_com_fallback(JSON_FILES['ocds'])
+        
+        # Registro de dados de referência (ocds, normas, equipamentos, requisitos) do processo
+        self.dados_referencia = obter_dados_referencia()
         
         # Resultados da análise
         self.resultados_analise = []
         
+        # Cache persistente do texto extraído dos PDFs, compartilhado por todas as análises
+        self.cache_extracao = CacheExtracaoPDF(Path(TBN_FILES_FOLDER) / CACHE_DIR / CACHE_EXTRACAO_DIR)
+        
         # Cache para CCTAnalyzer (instanciado sob demanda)
         self._cct_analyzer = None
         
+        # Número de processos na análise de todos os requerimentos (1 = serial)
+        self.workers = max(1, workers)
+        
+        # Modo incremental: reaproveita resultados de requerimentos cujas entradas não mudaram
+        self.incremental = incremental
+        self.cache_resultados = CacheResultadosAnalise(Path(TBN_FILES_FOLDER) / CACHE_DIR / CACHE_RESULTADOS_DIR)
+        
+        # Modo rascunho: relatório LaTeX compilado em uma única passada (pré-visualização rápida)
+        self.rascunho = rascunho
+        
+        # Modo de relatório por requerimento: documentos independentes compilados em paralelo
+        self.por_requerimento = por_requerimento
+        
+        # Registro JSONL dos resultados, gravado à medida que cada requerimento termina;
+        # com `retomar`, a análise de todos continua o registro mais recente
+        self.retomar = retomar
+        self.arquivo_resultados: Optional[ArquivoResultadosJSONL] = None
+        
         # Variáveis de timing
         self.tempo_inicio_analise = None
         self.tempo_fim_analise = None
     
+    def _obter_cct_analyzer(self) -> CCTAnalyzerIntegrado:
+        """Retorna o CCTAnalyzer integrado, instanciado sob demanda."""
+        if self._cct_analyzer is None:
+            utils_dir = Path(__file__).parent.parent / UTILS_DIR
+            self._cct_analyzer = CCTAnalyzerIntegrado(utils_dir)
+        return self._cct_analyzer
+    
+    def _finalizar_cache_extracao(self) -> None:
+        """
+        Expurga entradas órfãs, persiste o índice e registra as estatísticas do cache de extração
+        e do cache de normalização de IDs de normas.
+        """
+        removidas = self.cache_extracao.remover_orfaos()
+        self.cache_extracao.salvar()
+        estatisticas = self.cache_extracao.estatisticas()
+        log_info(f"🗃️ Cache de extração: {estatisticas['acertos']} acerto(s), {estatisticas['falhas']} falha(s) "
+                 f"({estatisticas['taxa_acerto']*100:.1f}%), {removidas} entrada(s) expurgada(s)")
+        estatisticas_normas = estatisticas_normalizacao_normas()
+        if estatisticas_normas['acertos'] or estatisticas_normas['falhas']:
+            log_info(f"🗃️ Cache de normalização de normas: {estatisticas_normas['acertos']} acerto(s), "
+                     f"{estatisticas_normas['falhas']} falha(s) ({estatisticas_normas['taxa_acerto']*100:.1f}%)")
+    
+    def _abrir_arquivo_resultados(self, permitir_retomada: bool) -> ArquivoResultadosJSONL:
+        """
+        Retorna o registro JSONL da execução: o mais recente da pasta de resultados quando
+        a retomada foi solicitada (e permitida para o escopo), ou um novo com timestamp.
+        """
+        if self.retomar and permitir_retomada:
+            caminho_existente = ArquivoResultadosJSONL.mais_recente(self.pasta_resultados)
+            if caminho_existente is not None:
+                log_info(f"⏯️ Retomando a partir de {caminho_existente.name}")
+                return ArquivoResultadosJSONL(caminho_existente)
+            log_info("⏯️ Nenhum registro de resultados anterior encontrado - iniciando do zero")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return ArquivoResultadosJSONL(self.pasta_resultados / f"resultados_analise_{timestamp}{EXT_JSONL}")
+    
+    def _registrar_resultado(self, req: str, resultado: Optional[Dict]) -> None:
+        """Grava o resultado de um requerimento no registro JSONL assim que ele fica disponível."""
+        if resultado and self.arquivo_resultados is not None:
+            self.arquivo_resultados.adicionar(req, resultado)
+    
+    def _analisar_requerimentos_em_serie(self, requerimentos: List[str]) -> Dict[str, Dict]:
+        """
+        Analisa os requerimentos um a um no processo principal.
+        
+        Args:
+            requerimentos: Lista de números de requerimento, na ordem de análise
+            
+        Returns:
+            Dict número do requerimento -> resultado da análise
+        """
+        resultados = {}
+        # Planilha Excel: linhas acumuladas e gravadas uma única vez, mesmo se a análise for interrompida
+        planilha = AtualizadorPlanilhaExcel()
+        try:
+            for req in requerimentos:
+                log_info(f"  🔍 Analisando: {req}")
+                # só para debug
+                #if req not in ["25.07808"]:
+                #    continue
+                planilha.adicionar(req)
+                resultados[req] = self._analisar_requerimento_individual(req)
+                self._registrar_resultado(req, resultados[req])
+        finally:
+            planilha.salvar()
+        return resultados
+    
+    def _analisar_requerimentos_em_paralelo(self, requerimentos: List[str]) -> Dict[str, Dict]:
+        """
+        Distribui a análise dos requerimentos entre processos auxiliares.
+        
+        As escritas em arquivos compartilhados (planilha Excel, índice do cache de extração
+        e, na geração do relatório, normas.json) permanecem serializadas no processo principal.
+        Cada resultado é gravado no registro JSONL assim que termina; a ordem dos requerimentos
+        é restabelecida depois, na incorporação feita por _analisar_todos_requerimentos.
+        
+        Args:
+            requerimentos: Lista de números de requerimento, na ordem de análise
+            
+        Returns:
+            Dict número do requerimento -> resultado da análise
+        """
+        # Planilha Excel: atualizada em lote, numa única gravação, antes de distribuir as análises
+        planilha = AtualizadorPlanilhaExcel()
+        for req in requerimentos:
+            planilha.adicionar(req)
+        planilha.salvar()
+        
+        workers = min(self.workers, len(requerimentos))
+        log_info(f"⚙️ Distribuindo a análise entre {workers} processos...")
+        
+        resultados = {}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_inicializar_worker_analise) as executor:
+            futuros = {executor.submit(_analisar_requerimento_worker, req): req for req in requerimentos}
+            # Registro em ordem de conclusão: uma interrupção não perde os já terminados
+            for futuro in as_completed(futuros):
+                req = futuros[futuro]
+                resultado, alteracoes_cache = futuro.result()
+                log_info(f"  🔍 Analisado: {req}")
+                self.cache_extracao.incorporar_alteracoes(alteracoes_cache)
+                resultados[req] = resultado
+                self._registrar_resultado(req, resultado)
+        # Ordem dos requerimentos restabelecida ao final (resultado determinístico)
+        return {req: resultados[req] for req in requerimentos}
+    
+    def _calcular_impressao_requerimento(self, nome_requerimento: str) -> str:
+        """
+        Calcula a impressão digital das entradas da análise de um requerimento: PDFs
+        (nome, tamanho, mtime), JSON do requerimento, versão dos dados de referência,
+        palavras-chave e versões da lógica de extração/análise (inclusive a configuração da
+        extração por seção do CCT).
+        
+        A idade dos documentos não entra na impressão: os itens que dependem dela são
+        recalculados ao reaproveitar um resultado (ver _atualizar_atualidade_documentos).
+        
+        Args:
+            nome_requerimento: Número do requerimento (ex: "25.06969")
+            
+        Returns:
+            str com o hash SHA-256 das entradas
+        """
+        pasta_requerimento = self.pasta_base / ("_" + nome_requerimento)
+        
+        arquivos = []
+        for arquivo in sorted(pasta_requerimento.glob(GLOB_PDF)) + [pasta_requerimento / f"{nome_requerimento}.json"]:
+            if not arquivo.exists():
+                continue
+            estado = arquivo.stat()
+            arquivos.append([arquivo.name, estado.st_size, estado.st_mtime_ns])
+        
+        componentes = {
+            'arquivos': arquivos,
+            'referencia': self.dados_referencia.assinatura(('ocds', 'equipamentos', 'requisitos')),
+            'palavras_chave': [PALAVRAS_CHAVE_MANUAL, PALAVRAS_CHAVE_LIMITE_PALAVRA],
+            'versoes': [CACHE_RESULTADOS_VERSAO, CACHE_EXTRACAO_VERSAO,
+                        EXTRACAO_CCT_POR_SECAO, ASSINATURA_PADROES_OCD]
+        }
+        return hashlib.sha256(json.dumps(componentes, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+    
+    def _analisar_todos_requerimentos(self, requerimentos: List[str]) -> None:
+        """
+        Analisa todos os requerimentos (em série ou em paralelo), pulando na retomada os
+        já gravados no registro JSONL e reaproveitando no modo incremental os resultados em
+        cache dos requerimentos cujas entradas não mudaram.
+        Os resultados são incorporados na ordem de `requerimentos`.
+        
+        Args:
+            requerimentos: Lista de números de requerimento, na ordem de análise
+        """
+        impressoes = {req: self._calcular_impressao_requerimento(req) for req in requerimentos}
+        
+        # Retomada: resultados já gravados no registro JSONL continuado
+        reaproveitados = {}
+        if self.retomar:
+            concluidos = self.arquivo_resultados.carregar()
+            reaproveitados = {req: concluidos[req] for req in requerimentos if req in concluidos}
+            log_info(f"⏯️ {len(reaproveitados)} requerimento(s) já concluído(s) no registro de resultados")
+        
+        if self.incremental:
+            reaproveitados_cache = 0
+            for req in requerimentos:
+                if req in reaproveitados:
+                    continue
+                resultado_cache = self.cache_resultados.obter(req, impressoes[req])
+                if resultado_cache is not None:
+                    resultado_cache = self._atualizar_atualidade_documentos(resultado_cache)
+                    reaproveitados[req] = resultado_cache
+                    self._registrar_resultado(req, resultado_cache)
+                    reaproveitados_cache += 1
+            log_info(f"♻️ {reaproveitados_cache} requerimento(s) sem alterações reaproveitado(s) do cache")
+        
+        pendentes = [req for req in requerimentos if req not in reaproveitados]
+        if self.workers > 1 and len(pendentes) > 1:
+            novos = self._analisar_requerimentos_em_paralelo(pendentes)
+        else:
+            novos = self._analisar_requerimentos_em_serie(pendentes)
+        
+        for req in requerimentos:
+            if req in novos and novos[req]:
+                self.cache_resultados.armazenar(req, impressoes[req], novos[req])
+            resultado = reaproveitados.get(req) or novos.get(req)
+            if resultado:
+                self.resultados_analise.append(resultado)
+    
     def _obter_escopo_analise(self) -> str:
         """
         Pergunta ao usuário se a análise será de um requerimento específico ou todos.
@@ -565,10 +628,17 @@ class AnalisadorRequerimentos:
         
         return sorted(requerimentos)
 
-    def _analisar_documento(self, caminho_documento: Path, tipo_documento: str, dados_ocd: Dict) -> Dict:
+    def _analisar_documento(self, documento: DocumentoExtraido, tipo_documento: str,
+                            dados_req: Optional[Dict]) -> Dict:
         """
         Analisa um documento específico baseado no seu tipo.
+        
+        Args:
+            documento: PDF já extraído, compartilhado pelas verificações do tipo
+            tipo_documento: Tipo do documento (TIPO_*)
+            dados_req: JSON do requerimento, carregado uma vez por requerimento (ou None)
         """
+        caminho_documento = documento.caminho
         #info = re.findall(r'\[(.*?)\]', caminho_documento.name)
         #log_info(f"Analisando documento: {info[:2]}")
         
@@ -586,21 +656,22 @@ class AnalisadorRequerimentos:
         try:
             # Análise baseada no tipo de documento usando constantes unificadas
             if tipo_documento == TIPO_CCT:
-                resultado = self._analisar_cct(caminho_documento, resultado, dados_ocd)
+                dados_ocd = dados_req.get('ocd', {}) if dados_req else {}
+                resultado = self._analisar_cct(documento, resultado, dados_ocd)
             elif tipo_documento == TIPO_RACT:
-                resultado = self._analisar_ract(caminho_documento, resultado)
+                resultado = self._analisar_ract(documento, resultado)
             elif tipo_documento == TIPO_MANUAL:
-                resultado = self._analisar_keywords(caminho_documento, resultado)
+                resultado = self._analisar_keywords(documento, resultado)
             elif tipo_documento == TIPO_RELATORIO_ENSAIO:
-                resultado = self._analisar_relatorio_ensaio(caminho_documento, resultado)
+                resultado = self._analisar_relatorio_ensaio(documento, resultado, dados_req)
             elif tipo_documento == TIPO_ART:
-                resultado = self._analisar_art(caminho_documento, resultado)
+                resultado = self._analisar_art(documento, resultado)
             elif tipo_documento == TIPO_FOTOS:
-                resultado = self._analisar_fotos(caminho_documento, resultado)
+                resultado = self._analisar_fotos(documento, resultado)
             elif tipo_documento == TIPO_CONTRATO_SOCIAL:
-                resultado = self._analisar_contrato_social(caminho_documento, resultado)
+                resultado = self._analisar_contrato_social(documento, resultado)
             elif tipo_documento == TIPO_OUTROS:
-                resultado = self._analisar_keywords(caminho_documento, resultado)    
+                resultado = self._analisar_keywords(documento, resultado)    
             else:
                 resultado["observacoes"].append(f"Tipo de documento não reconhecido: {tipo_documento}")
                 
@@ -643,17 +714,16 @@ class AnalisadorRequerimentos:
         # Fallback final para "outros" se não encontrar correspondência
         return TIPO_OUTROS, data_documento
     
-    def _analisar_cct(self, caminho: Path, resultado: Dict, dados_ocd: Dict) -> Dict:
+    def _analisar_cct(self, documento: DocumentoExtraido, resultado: Dict, dados_ocd: Dict) -> Dict:
         """Análise específica para Certificado de Conformidade Técnica."""
         try:
-            #log_info(f"Iniciando análise detalhada de CCT: {caminho.name}")
+            #log_info(f"Iniciando análise detalhada de CCT: {documento.caminho.name}")
             
-            # Instanciar CCTAnalyzer integrado
-            utils_dir = Path(__file__).parent.parent / UTILS_DIR
-            cct_analyzer = CCTAnalyzerIntegrado(utils_dir)
+            # CCTAnalyzer integrado
+            cct_analyzer = self._obter_cct_analyzer()
             
-            # Extrair conteúdo do PDF
-            conteudo = cct_analyzer.extract_pdf_content(caminho)
+            # Conteúdo do PDF já extraído (com OCR das páginas escaneadas)
+            conteudo = documento.texto if documento.conteudo_disponivel else None
             
             if not conteudo:
                 resultado["status"] = STATUS_ERRO
@@ -664,7 +734,7 @@ class AnalisadorRequerimentos:
             # Extrair dados do CCT usando a lógica especializada
             cnpj_ocd = dados_ocd.get('CNPJ', '') if dados_ocd else ''
             nome_ocd = dados_ocd.get('Nome', 'N/A') if dados_ocd else 'N/A'
-            dados_cct = cct_analyzer.extract_data_from_cct(conteudo, cnpj_ocd, nome_ocd)
+            dados_cct = cct_analyzer.extract_data_from_cct(conteudo, cnpj_ocd, nome_ocd, documento)
             
             if not dados_cct:
                 resultado["status"] = STATUS_ERRO
@@ -783,8 +853,9 @@ class AnalisadorRequerimentos:
         """
         return extrair_normas_por_padrao(content)
 
-    def _analisar_ract(self, caminho: Path, resultado: Dict) -> Dict:
+    def _analisar_ract(self, documento: DocumentoExtraido, resultado: Dict) -> Dict:
         """Análise específica para Relatório de Avaliação da Conformidade Técnica."""
+        caminho = documento.caminho
         try:
             #log_info(f"Iniciando análise de RACT: {caminho.name}")
             
@@ -819,85 +890,48 @@ class AnalisadorRequerimentos:
             else:
                 nao_conformidades.append("Arquivo não está em formato PDF")
             
-            # Tentar extrair conteúdo básico do PDF para validações adicionais
-            try:
+            # Validações adicionais sobre o conteúdo já extraído (com OCR se necessário)
+            if documento.erro is not None:
+                nao_conformidades.append(f"Erro na análise do conteúdo PDF: {str(documento.erro)}")
+            else:
+                total_paginas = documento.paginas
+                resultado["observacoes"].append(f"Total de páginas: {total_paginas}")
                 
-                with fitz.open(caminho) as doc:
-                    total_paginas = len(doc)
-                    resultado["observacoes"].append(f"Total de páginas: {total_paginas}")
+                if total_paginas > 0:
+                    conformidades.append(f"Documento contém {total_paginas} página(s)")
                     
-                    if total_paginas > 0:
-                        conformidades.append(f"Documento contém {total_paginas} página(s)")
-                        
-                        # Extrair texto completo do manual para análise
-                        texto_completo = ""
-                        for pagina_num in range(total_paginas):  # Analisar todas as páginas
-                            texto_completo += str(doc[pagina_num].get_text()).lower() + "\n"
-                        
-                        if len(texto_completo.strip()) < MIN_FILE_SIZE:
-                            #log_info(f"PDF aparentemente vazio, tentando OCR: {pdf_path.name}")
-                            texto_ocr = extract_pdf_content_from_ocr(caminho)
-                            if texto_ocr:
-                                texto_completo = texto_ocr.lower()
-
-                        # Usar palavras-chave definidas em const.py
-                        palavras_chave_manual = [palavra.lower() for palavra in PALAVRAS_CHAVE_MANUAL.keys()]
-                        palavras_chave_manual = sorted(palavras_chave_manual)                           
-                        
-                        # Contar ocorrências de cada palavra-chave
-                        palavras_encontradas = {}
-                        palavras_nao_encontradas = []
-                        palavras_encontradas_com_normas = {}  # Nova estrutura para palavras com normas
-                        
-                        for palavra in palavras_chave_manual:
-                            contador = texto_completo.count(palavra)
-                            if contador > 0:
-                                palavras_encontradas[palavra] = contador
-                                # Buscar normas associadas à palavra
-                                normas_associadas = PALAVRAS_CHAVE_MANUAL.get(palavra, {}).get("normas", [])
-                                if normas_associadas:
-                                    palavras_encontradas_com_normas[palavra] = {
-                                        "contador": contador,
-                                        "normas": normas_associadas
-                                    }
-                            else:
-                                palavras_nao_encontradas.append(palavra)
-                        
-                        # Extrair normas verificadas do conteúdo completo
-                        normas_verificadas = self._extract_normas_from_ract(texto_completo)
-                        resultado["normas_verificadas"] = normas_verificadas
-                        
-                        # CORREÇÃO: Adicionar também ao dados_extraidos para consistência
-                        resultado["dados_extraidos"] = {
-                            "normas_verificadas": normas_verificadas,
-                            "quantidade_normas": len(normas_verificadas),
-                            "palavras_encontradas": palavras_encontradas,
-                            "palavras_nao_encontradas": palavras_nao_encontradas,
-                            "palavras_encontradas_com_normas": palavras_encontradas_com_normas
-                        }
-                        
-                        if normas_verificadas:
-                            conformidades.append(f"{len(normas_verificadas)} norma(s) verificada(s) encontrada(s)")
-                            #log_info(f"Normas encontradas no RACT: {normas_verificadas}")                        
-                            
-                    else:
-                        nao_conformidades.append("Documento PDF vazio ou corrompido")
+                    # Texto completo do documento para análise
+                    texto_completo = documento.texto.lower()
+
+                    # Contar ocorrências das palavras-chave definidas em const.py (passada única)
+                    palavras_encontradas, palavras_nao_encontradas, palavras_encontradas_com_normas = \
+                        self._contar_palavras_chave(texto_completo)
+                    
+                    # Extrair normas verificadas do conteúdo completo
+                    normas_verificadas = self._extract_normas_from_ract(texto_completo)
+                    resultado["normas_verificadas"] = normas_verificadas
+                    
+                    # CORREÇÃO: Adicionar também ao dados_extraidos para consistência
+                    resultado["dados_extraidos"] = {
+                        "normas_verificadas": normas_verificadas,
+                        "quantidade_normas": len(normas_verificadas),
+                        "palavras_encontradas": palavras_encontradas,
+                        "palavras_nao_encontradas": palavras_nao_encontradas,
+                        "palavras_encontradas_com_normas": palavras_encontradas_com_normas
+                    }
+                    
+                    if normas_verificadas:
+                        conformidades.append(f"{len(normas_verificadas)} norma(s) verificada(s) encontrada(s)")
+                        #log_info(f"Normas encontradas no RACT: {normas_verificadas}")                        
                         
-            except ImportError:
-                resultado["observacoes"].append("PyMuPDF não disponível - análise de conteúdo limitada")
-            except Exception as e:
-                nao_conformidades.append(f"Erro na análise do conteúdo PDF: {str(e)}")
+                else:
+                    nao_conformidades.append("Documento PDF vazio ou corrompido")
             
             # Verificar data de modificação do arquivo (freshness)
-            data_modificacao = datetime.fromtimestamp(caminho.stat().st_mtime)
-            dias_desde_modificacao = (datetime.now() - data_modificacao).days
+            data_modificacao = documento.data_modificacao or datetime.fromtimestamp(caminho.stat().st_mtime)
             
             resultado["observacoes"].append(f"Última modificação: {data_modificacao.strftime('%d/%m/%Y %H:%M')}")
-            
-            if dias_desde_modificacao <= 365:  # Arquivo modificado no último ano
-                conformidades.append("Arquivo relativamente recente")
-            else:
-                resultado["observacoes"].append(f"Arquivo modificado há {dias_desde_modificacao} dias - verificar se está atualizado")
+            self._avaliar_atualidade_arquivo(data_modificacao, conformidades, resultado["observacoes"])
             
             # Atualizar listas de conformidade
             resultado["conformidades"].extend(conformidades)
@@ -924,8 +958,69 @@ class AnalisadorRequerimentos:
         
         return resultado
     
-    def _analisar_keywords(self, caminho: Path, resultado: Dict) -> Dict:
+    def _avaliar_atualidade_arquivo(self, data_modificacao: datetime, conformidades: List[str],
+                                    observacoes: List[str]) -> None:
+        """Registra se o arquivo é recente (até DIAS_ARQUIVO_RECENTE) ou há quantos dias foi modificado."""
+        dias_desde_modificacao = (datetime.now() - data_modificacao).days
+        if dias_desde_modificacao <= DIAS_ARQUIVO_RECENTE:  # Arquivo modificado no último ano
+            conformidades.append(CONFORMIDADE_ARQUIVO_RECENTE)
+        else:
+            observacoes.append(f"{PREFIXO_OBSERVACAO_ARQUIVO_ANTIGO} {dias_desde_modificacao} dias - verificar se está atualizado")
+    
+    def _atualizar_atualidade_documentos(self, resultado_requerimento: Dict) -> Dict:
+        """
+        Recalcula, em um resultado reaproveitado do cache, os itens que dependem da idade
+        dos arquivos (RACT), que muda a cada dia sem que nada mude em disco.
+        """
+        for doc in resultado_requerimento.get("documentos_analisados", []):
+            if doc.get("tipo") != TIPO_RACT:
+                continue
+            caminho = Path(doc.get("caminho", ""))
+            if not caminho.exists():
+                continue
+            doc["conformidades"] = [c for c in doc.get("conformidades", []) if c != CONFORMIDADE_ARQUIVO_RECENTE]
+            doc["observacoes"] = [o for o in doc.get("observacoes", [])
+                                  if not o.startswith(PREFIXO_OBSERVACAO_ARQUIVO_ANTIGO)]
+            data_modificacao = datetime.fromtimestamp(caminho.stat().st_mtime)
+            self._avaliar_atualidade_arquivo(data_modificacao, doc["conformidades"], doc["observacoes"])
+        return resultado_requerimento
+    
+    def _contar_palavras_chave(self, texto: str) -> Tuple[Dict[str, int], List[str], Dict[str, Dict]]:
+        """
+        Conta as palavras-chave de PALAVRAS_CHAVE_MANUAL no texto em uma única passada.
+        
+        Args:
+            texto: Texto do documento em minúsculas
+            
+        Returns:
+            Tuple com (palavras encontradas -> contador, palavras não encontradas,
+            palavras encontradas com normas associadas -> {contador, normas})
+        """
+        contagens = AUTOMATO_PALAVRAS_CHAVE.contar(texto)
+        
+        palavras_encontradas = {}
+        palavras_nao_encontradas = []
+        palavras_encontradas_com_normas = {}
+        
+        for palavra in PALAVRAS_CHAVE_ORDENADAS:
+            contador = contagens.get(palavra, 0)
+            if contador > 0:
+                palavras_encontradas[palavra] = contador
+                # Buscar normas associadas à palavra
+                normas_associadas = PALAVRAS_CHAVE_MANUAL.get(palavra, {}).get("normas", [])
+                if normas_associadas:
+                    palavras_encontradas_com_normas[palavra] = {
+                        "contador": contador,
+                        "normas": normas_associadas
+                    }
+            else:
+                palavras_nao_encontradas.append(palavra)
+        
+        return palavras_encontradas, palavras_nao_encontradas, palavras_encontradas_com_normas
+    
+    def _analisar_keywords(self, documento: DocumentoExtraido, resultado: Dict) -> Dict:
         """Análise específica para Manual do Produto."""
+        caminho = documento.caminho
         try:
             #log_info(f"Iniciando análise de Manual: {caminho.name}")
             
@@ -938,58 +1033,33 @@ class AnalisadorRequerimentos:
             conformidades = []
             nao_conformidades = []
           
-            # Análise de conteúdo do PDF
-            try:                
-                with fitz.open(caminho) as doc:
-                    total_paginas = len(doc)
-                    resultado["observacoes"].append(f"Total de páginas: {total_paginas}")
-                    
-                    if total_paginas == 0:
-                        nao_conformidades.append("Manual vazio ou corrompido")
-                        return resultado
-                    
-                    # Extrair texto completo do manual para análise
-                    texto_completo = ""
-                    for pagina_num in range(total_paginas):  # Analisar todas as páginas
-                        texto_completo += str(doc[pagina_num].get_text()).lower() + "\n"
-                    
-                    # Usar palavras-chave definidas em const.py
-                    palavras_chave_manual = [palavra.lower() for palavra in PALAVRAS_CHAVE_MANUAL.keys()]
-                    palavras_chave_manual = sorted(palavras_chave_manual)                    
-                    
-                    # Contar ocorrências de cada palavra-chave
-                    palavras_encontradas = {}
-                    palavras_nao_encontradas = []
-                    palavras_encontradas_com_normas = {}  # Nova estrutura para palavras com normas
-                    
-                    for palavra in palavras_chave_manual:
-                        contador = texto_completo.count(palavra)
-                        if contador > 0:
-                            palavras_encontradas[palavra] = contador
-                            # Buscar normas associadas à palavra
-                            normas_associadas = PALAVRAS_CHAVE_MANUAL.get(palavra, {}).get("normas", [])
-                            if normas_associadas:
-                                palavras_encontradas_com_normas[palavra] = {
-                                    "contador": contador,
-                                    "normas": normas_associadas
-                                }
-                        else:
-                            palavras_nao_encontradas.append(palavra)
-                    
-                    # Armazenar resultados da análise de palavras-chave nos dados extraídos
-                    resultado["dados_extraidos"] = {
-                        "palavras_encontradas": palavras_encontradas,
-                        "palavras_nao_encontradas": palavras_nao_encontradas,
-                        "palavras_encontradas_com_normas": palavras_encontradas_com_normas
-                    }
-                        
-            except ImportError:
-                resultado["observacoes"].append("PyMuPDF não disponível - análise de conteúdo limitada")
-            except Exception as e:
-                nao_conformidades.append(f"Erro na análise do conteúdo: {str(e)}")
+            # Análise do conteúdo já extraído (somente texto nativo, sem OCR)
+            if documento.erro is not None:
+                nao_conformidades.append(f"Erro na análise do conteúdo: {str(documento.erro)}")
+            else:
+                total_paginas = documento.paginas
+                resultado["observacoes"].append(f"Total de páginas: {total_paginas}")
+                
+                if total_paginas == 0:
+                    nao_conformidades.append("Manual vazio ou corrompido")
+                    return resultado
+                
+                # Texto completo do manual para análise
+                texto_completo = documento.texto.lower()
+                
+                # Contar ocorrências das palavras-chave definidas em const.py (passada única)
+                palavras_encontradas, palavras_nao_encontradas, palavras_encontradas_com_normas = \
+                    self._contar_palavras_chave(texto_completo)
+                
+                # Armazenar resultados da análise de palavras-chave nos dados extraídos
+                resultado["dados_extraidos"] = {
+                    "palavras_encontradas": palavras_encontradas,
+                    "palavras_nao_encontradas": palavras_nao_encontradas,
+                    "palavras_encontradas_com_normas": palavras_encontradas_com_normas
+                }
             
             # Verificar data do arquivo
-            data_modificacao = datetime.fromtimestamp(caminho.stat().st_mtime)
+            data_modificacao = documento.data_modificacao or datetime.fromtimestamp(caminho.stat().st_mtime)
             resultado["observacoes"].append(f"Data de modificação: {data_modificacao.strftime('%d/%m/%Y %H:%M')}")
             
             # Atualizar listas
@@ -1012,7 +1082,8 @@ class AnalisadorRequerimentos:
         
         return resultado
     
-    def _analisar_relatorio_ensaio(self, caminho: Path, resultado: Dict) -> Dict:
+    def _analisar_relatorio_ensaio(self, documento: DocumentoExtraido, resultado: Dict,
+                                   dados_req: Optional[Dict]) -> Dict:
         """
         Análise específica para Relatório de Ensaio.
         
@@ -1022,31 +1093,22 @@ class AnalisadorRequerimentos:
         3. Lista as normas encontradas no PDF
         
         Args:
-            caminho: Path para o arquivo PDF do relatório
+            documento: PDF do relatório já extraído
             resultado: Dicionário com resultado parcial da análise
+            dados_req: JSON do requerimento, carregado uma vez por requerimento (ou None)
             
         Returns:
             Dict atualizado com resultado da análise
         """
         try:
-            # Instanciar CCTAnalyzer integrado para extração de PDF
-            utils_dir = Path(__file__).parent.parent / UTILS_DIR
-            cct_analyzer = CCTAnalyzerIntegrado(utils_dir)
-            
-            # Extrai o conteúdo do PDF usando extract_pdf_content (com fallback OCR)
-            texto_pdf = cct_analyzer.extract_pdf_content(caminho)
-            if not texto_pdf:
+            # Conteúdo do PDF já extraído (com OCR das páginas escaneadas)
+            if not documento.conteudo_disponivel or not documento.texto:
                 resultado["status"] = STATUS_ERRO
                 resultado["observacoes"].append("❌ Erro ao extrair conteúdo do PDF")
                 return resultado
             
-            # Normaliza o texto para comparações
-            texto_normalizado = normalizar(texto_pdf)
-            
-            # Obtém dados do JSON do requerimento
-            nome_requerimento = str(caminho.parent.name)
-            pasta_requerimento = caminho.parent
-            dados_req = self._processar_dados_requerimento_json(nome_requerimento, pasta_requerimento)
+            # Texto normalizado do documento para comparações
+            texto_normalizado = documento.texto_normalizado
             
             if not dados_req:
                 resultado["observacoes"].append("⚠️ Dados do requerimento não disponíveis para validação")
@@ -1194,24 +1256,24 @@ class AnalisadorRequerimentos:
             return resultado
             
         except Exception as e:
-            log_erro(f"Erro ao analisar relatório de ensaio {caminho.name}: {str(e)}")
+            log_erro(f"Erro ao analisar relatório de ensaio {documento.caminho.name}: {str(e)}")
             resultado["status"] = STATUS_ERRO
             resultado["observacoes"].append(f"❌ Erro durante análise: {str(e)[:100]}")
             return resultado
     
-    def _analisar_art(self, caminho: Path, resultado: Dict) -> Dict:
+    def _analisar_art(self, documento: DocumentoExtraido, resultado: Dict) -> Dict:
         """Análise específica para ART."""
         resultado["observacoes"].append("Análise de ART: Verificando responsáveis técnicos")
         resultado["status"] = "CONFORME"  # Temporário
         return resultado
     
-    def _analisar_fotos(self, caminho: Path, resultado: Dict) -> Dict:
+    def _analisar_fotos(self, documento: DocumentoExtraido, resultado: Dict) -> Dict:
         """Análise específica para Fotos do Produto."""
         resultado["observacoes"].append("Análise de Fotos: Verificando conformidade visual")
         resultado["status"] = "CONFORME"  # Temporário
         return resultado
     
-    def _analisar_contrato_social(self, caminho: Path, resultado: Dict) -> Dict:
+    def _analisar_contrato_social(self, documento: DocumentoExtraido, resultado: Dict) -> Dict:
         """Análise específica para Contrato Social."""
         resultado["observacoes"].append("Análise de Contrato Social: Validando dados da empresa")
         resultado["status"] = "CONFORME"  # Temporário
@@ -1429,9 +1491,10 @@ class AnalisadorRequerimentos:
         for doc_info in docs_para_processar:
             arquivo, tipo_doc, _ = doc_info
 
-            # Extrair dados do OCD do JSON do requerimento
-            dados_ocd = dados_req_json.get('ocd', {}) if dados_req_json else {}
-            resultado_doc = self._analisar_documento(arquivo, tipo_doc, dados_ocd)
+            # Cada PDF é lido uma única vez; o documento e o JSON do requerimento
+            # são compartilhados pelas verificações do tipo
+            documento = DocumentoExtraido(arquivo, self.cache_extracao, permitir_ocr=tipo_doc not in TIPOS_SEM_OCR)
+            resultado_doc = self._analisar_documento(documento, tipo_doc, dados_req_json)
             resultado_requerimento["documentos_analisados"].append(resultado_doc)
 
             # Atualizar contadores de status
@@ -1450,50 +1513,16 @@ class AnalisadorRequerimentos:
         return resultado_requerimento
     
     def _obter_nome_completo_ocd(self, nome_ocd_extraido: str) -> str:
-        """Obtém o nome completo do OCD consultando ocds.json."""
+        """Obtém o nome completo do OCD consultando o registro de ocds.json."""
         if not nome_ocd_extraido or nome_ocd_extraido == 'N/A' or nome_ocd_extraido.startswith('[ERRO]'):
             return "OCD não identificado"
         
         try:
-            ocds_file = Path(__file__).parent.parent / UTILS_DIR / "ocds.json"
-            
-            if not ocds_file.exists():
+            if not self.dados_referencia.arquivo_existe('ocds'):
                 return nome_ocd_extraido
             
-            with open(ocds_file, 'r', encoding='utf-8') as f:
-                ocds_data = json.load(f)
-            
-            # Normalizar o nome extraído para comparação
-            nome_normalizado = nome_ocd_extraido.lower().strip()
-            
-            # Buscar por correspondência parcial no nome
-            for ocd in ocds_data:
-                nome_completo = ocd.get('nome', '')
-                if nome_completo:
-                    nome_completo_normalizado = nome_completo.lower().strip()
-                    
-                    # Verificar correspondências específicas primeiro
-                    if nome_normalizado == nome_completo_normalizado:
-                        return nome_completo
-                    
-                    # Verificar se o nome extraído está contido no nome completo
-                    if nome_normalizado in nome_completo_normalizado:
-                        return nome_completo
-            
-            # Segunda passada: buscar palavras-chave importantes (>= 4 caracteres)
-            # apenas se não encontrou correspondência direta
-            palavras_extraidas = [p for p in nome_normalizado.split() if len(p) >= 4]
-            if palavras_extraidas:
-                for ocd in ocds_data:
-                    nome_completo = ocd.get('nome', '')
-                    if nome_completo:
-                        nome_completo_normalizado = nome_completo.lower().strip()
-                        # Verificar se TODAS as palavras importantes estão presentes
-                        if all(palavra in nome_completo_normalizado for palavra in palavras_extraidas):
-                            return nome_completo
-            
             # Se não encontrou correspondência, retorna o nome extraído
-            return nome_ocd_extraido
+            return self.dados_referencia.nome_completo_ocd(nome_ocd_extraido) or nome_ocd_extraido
             
         except Exception as e:
             log_erro(f"Erro ao consultar ocds.json: {str(e)}")
@@ -1552,32 +1581,12 @@ class AnalisadorRequerimentos:
         return equipamentos_unicos
 
     def _buscar_id_equipamento_por_nome(self, nome_equipamento: str) -> Optional[str]:
-        """Busca o ID de um equipamento pelo seu nome no arquivo equipamentos.json."""
+        """Busca o ID de um equipamento pelo seu nome no registro de equipamentos.json."""
         try:
-            nome_normalizado = nome_equipamento.lower().strip()
-            
-            for equipamento in self.equipamentos:
-                nome_json = equipamento.get('nome', '').lower().strip()
-                if nome_normalizado == nome_json:
-                    return equipamento.get('id')
-                    
-            # Se não encontrou correspondência exata, buscar por similaridade
-            for equipamento in self.equipamentos:
-                nome_json = equipamento.get('nome', '').lower().strip()
-                # Verificar se o nome extraído está contido no nome do JSON ou vice-versa
-                if (nome_normalizado in nome_json) or (nome_json in nome_normalizado):
-                    return equipamento.get('id')
-                    
-            # Se ainda não encontrou, tentar buscar por palavras-chave significativas
-            palavras_extraidas = [p for p in nome_normalizado.split() if len(p) >= 4]
-            if palavras_extraidas:
-                for equipamento in self.equipamentos:
-                    nome_json = equipamento.get('nome', '').lower().strip()
-                    if any(palavra in nome_json for palavra in palavras_extraidas):
-                        return equipamento.get('id')
-            
-            log_erro(f"ID não encontrado para equipamento: {nome_equipamento}")
-            return None
+            eq_id = self.dados_referencia.id_equipamento_por_nome(nome_equipamento)
+            if eq_id is None:
+                log_erro(f"ID não encontrado para equipamento: {nome_equipamento}")
+            return eq_id
             
         except Exception as e:
             log_erro(f"Erro ao buscar ID do equipamento '{nome_equipamento}': {str(e)}")
@@ -1588,24 +1597,16 @@ class AnalisadorRequerimentos:
         requisitos = []
         
         try:
-            # Buscar normas requeridas para o equipamento
-            normas_requeridas = []
-            for req in self.requisitos:
-                if req.get('equipamento') == equipamento_id:
-                    normas_requeridas = req.get('norma', [])
-                    break
-            
-            # Para cada norma requerida, buscar os detalhes no arquivo normas.json
-            for norma_id in normas_requeridas:
-                for norma in self.normas:
-                    if norma.get('id') == norma_id:
-                        requisitos.append({
-                            'id': norma.get('id', ''),
-                            'nome': norma.get('nome', ''),
-                            'descricao': norma.get('descricao', ''),
-                            'url': norma.get('url', '')
-                        })
-                        break
+            # Para cada norma requerida para o equipamento, buscar os detalhes no índice de normas.json
+            for norma_id in self.dados_referencia.normas_requeridas(equipamento_id):
+                norma = self.dados_referencia.norma(norma_id)
+                if norma is not None:
+                    requisitos.append({
+                        'id': norma.get('id', ''),
+                        'nome': norma.get('nome', ''),
+                        'descricao': norma.get('descricao', ''),
+                        'url': norma.get('url', '')
+                    })
         
         except Exception as e:
             log_erro(f"Erro ao obter requisitos para equipamento {equipamento_id}: {str(e)}")
@@ -1687,52 +1688,46 @@ class AnalisadorRequerimentos:
     def _coletar_normas_verificadas_requerimento(self, req_dados: Dict) -> Set[str]:
         """
         Coleta todas as normas que foram verificadas nos documentos do requerimento.
-        Automaticamente inclui no arquivo normas.json as normas que não estiverem cadastradas.
+        O cadastro das normas novas em normas.json é feito antes, por _registrar_normas_novas.
         
         Returns:
             Set[norma_id] das normas que foram efetivamente verificadas
         """
-        normas_verificadas = set()
-        novas_normas = {}
-        numero_requerimento = req_dados.get("numero_requerimento", "N/A")
-        
         try:
             documentos = req_dados.get("documentos_analisados", [])
             
-            # Criar set com IDs das normas já existentes para verificação rápida
-            normas_existentes_ids = {norma['id'] for norma in self.normas}
-            
-            for doc in documentos:
-                dados_extraidos = doc.get("dados_extraidos", {})
-                normas_doc = dados_extraidos.get("normas_verificadas", [])
-                
-                # Adicionar todas as normas verificadas deste documento
-                for norma_original in normas_doc:
-                    if isinstance(norma_original, str) and norma_original.strip():
-                        # Normalizar o ID da norma
-                        norma_id = self._normalizar_id_norma(norma_original.strip())
-                        
-                        if norma_id:
-                            normas_verificadas.add(norma_id)
-                            
-                            # Verificar se a norma não existe no arquivo normas.json
-                            if norma_id not in normas_existentes_ids and norma_id not in novas_normas:
-                                novas_normas[norma_id] = self._criar_entrada_norma(norma_id, numero_requerimento)
-                                log_info(f"Nova norma identificada: {norma_id} (do requerimento {numero_requerimento})")
-            
-            # Atualizar arquivo normas.json se há normas novas
-            if novas_normas:
-                log_info(f"Atualizando normas.json com {len(novas_normas)} nova(s) norma(s) do requerimento {numero_requerimento}")
-                if self._atualizar_arquivo_normas(novas_normas):
-                    # Atualizar o set de normas existentes
-                    normas_existentes_ids.update(novas_normas.keys())
-                else:
-                    log_erro(f"Falha ao atualizar normas.json com normas do requerimento {numero_requerimento}")
+            # Normas verificadas de todos os documentos, normalizadas de uma vez (com cache)
+            normas_originais = [
+                norma_original.strip()
+                for doc in documentos
+                for norma_original in doc.get("dados_extraidos", {}).get("normas_verificadas", [])
+                if isinstance(norma_original, str) and norma_original.strip()
+            ]
+            return {norma_id for norma_id in normalizar_ids_normas(normas_originais) if norma_id}
                     
         except Exception as e:
             log_erro(f"Erro ao coletar normas verificadas: {str(e)}")
-        
-        return normas_verificadas
+            return set()
+
+    def _registrar_normas_novas(self, resultados: List[Dict]) -> None:
+        """
+        Inclui em normas.json, em uma única gravação, as normas verificadas em qualquer
+        requerimento que ainda não estejam cadastradas. Executado para todos os requerimentos
+        antes da geração dos relatórios, inclusive os de fragmento reaproveitado.
+        """
+        normas_existentes_ids = self.dados_referencia.ids_normas()
+        novas_normas = {}
+        for req_dados in resultados:
+            numero_requerimento = req_dados.get("numero_requerimento", "N/A")
+            for norma_id in sorted(self._coletar_normas_verificadas_requerimento(req_dados)):
+                if norma_id not in normas_existentes_ids and norma_id not in novas_normas:
+                    novas_normas[norma_id] = self._criar_entrada_norma(norma_id, numero_requerimento)
+                    log_info(f"Nova norma identificada: {norma_id} (do requerimento {numero_requerimento})")
+        
+        if novas_normas:
+            log_info(f"Atualizando normas.json com {len(novas_normas)} nova(s) norma(s)")
+            if not self._atualizar_arquivo_normas(novas_normas):
+                log_erro("Falha ao atualizar normas.json com as normas novas dos requerimentos")
 
     def _coletar_palavras_chave_consolidadas(self, req_dados: Dict) -> Tuple[Dict[str, int], List[str]]:
         """
@@ -1768,73 +1763,6 @@ class AnalisadorRequerimentos:
         
         return palavras_consolidadas, sorted(list(palavras_nao_encontradas_set))
 
-    def _normalizar_id_norma(self, norma_original: str) -> Optional[str]:
-        """
-        Converte uma norma encontrada para o formato de ID usado no normas.json
-        
-        Exemplos:
-        - "Ato 1234" -> "ato1234"  
-        - "Resolução 715" -> "resolucao715"
-        - "ABNT NBR 7866" -> "abnt_nbr_7866"
-        - "IEC 61300" -> "iec61300"
-        """
-        
-        norma_clean = norma_original.strip()
-        
-        # Padrões para normalização
-        patterns = [
-            # Atos da ANATEL
-            (r'(?:ato|act)\s*n?°?\s*(\d+)', r'ato\1'),
-            
-            # Resoluções da ANATEL
-            (r'(?:resolução|resolution)\s*n?°?\s*(\d+)', r'resolucao\1'),
-            
-            # ABNT NBR
-            (r'abnt\s+nbr\s+(\d+)(?:\:?\d{4})?', r'abnt_nbr_\1'),
-            
-            # IEC
-            (r'iec\s+(\d+)(?:-\d+)?(?:\:?\d{4})?', r'iec\1'),
-            
-            # CISPR
-            (r'cispr\s+(\d+)(?:\:?\d{4})?', r'cispr\1'),
-            
-            # ITU-T G.xxx
-            (r'itu-?t\s+g\.?(\d+)', r'itu_g\1'),
-            
-            # ITU-R M.xxx
-            (r'itu-?r\s+m\.?(\d+)(?:-\d+)?', r'itu_r_m\1'),
-            
-            # ETSI TS
-            (r'etsi\s+ts\s+(\d+)\s+(\d+)-(\d+)', r'etsi_ts_\1_\2'),
-            
-            # IETF RFC
-            (r'(?:ietf\s+)?rfc\s*(\d+)', r'ietf_rfc\1'),
-            
-            # IEEE
-            (r'ieee\s+std\s+([\d\.]+)', r'ieee_std_\1'),
-        ]
-        
-        # Aplicar padrões de normalização
-        for pattern, replacement in patterns:
-            match = re.search(pattern, norma_clean, re.IGNORECASE)
-            if match:
-                resultado = re.sub(pattern, replacement, norma_clean, flags=re.IGNORECASE).lower()
-                # Limpar caracteres especiais e espaços
-                resultado = re.sub(r'[^\w]', '_', resultado)
-                resultado = re.sub(r'_+', '_', resultado)
-                resultado = resultado.strip('_')
-                return resultado
-        
-        # Se não encontrou padrão conhecido, criar ID genérico
-        id_generico = re.sub(r'[^\w\s]', '', norma_clean)  # Remove caracteres especiais
-        id_generico = re.sub(r'\s+', '_', id_generico)      # Substitui espaços por underscore
-        id_generico = id_generico.lower().strip('_')
-        
-        if id_generico and len(id_generico) > 2:
-            return id_generico
-        
-        return None
-
     def _criar_entrada_norma(self, norma_id: str, numero_requerimento: str) -> Dict:
         """Cria uma nova entrada de norma com os parâmetros solicitados"""
         return {
@@ -1856,7 +1784,7 @@ class AnalisadorRequerimentos:
             
         try:
             # Converter normas existentes para dicionário usando ID como chave
-            normas_existentes = {norma['id']: norma for norma in self.normas}
+            normas_existentes = {norma['id']: norma for norma in self.dados_referencia.normas}
             
             # Combinar normas existentes com novas
             todas_normas = {**normas_existentes, **novas_normas}
@@ -1866,14 +1794,14 @@ class AnalisadorRequerimentos:
             normas_lista.sort(key=lambda x: x['id'])
             
             # Fazer backup do arquivo original
-            normas_path = JSON_FILES['normas']        
+            normas_path = self.dados_referencia.caminhos['normas']
             
             # Salvar arquivo atualizado
             with open(normas_path, 'w', encoding='utf-8') as f:
                 json.dump(normas_lista, f, indent=2, ensure_ascii=False)
             
-            # Atualizar cache interno
-            self.normas = normas_lista
+            # Atualizar registro de dados de referência
+            self.dados_referencia.recarregar()
             
             #log_info(f"Arquivo normas.json atualizado com {len(novas_normas)} nova(s) norma(s)")
             #log_info(f"Total de normas no arquivo: {len(normas_lista)}")
@@ -1886,14 +1814,14 @@ class AnalisadorRequerimentos:
     def _obter_detalhes_norma(self, norma_id: str) -> Dict[str, str]:
         """Obtém detalhes de uma norma pelo seu ID do arquivo normas.json."""
         try:
-            for norma in self.normas:
-                if norma.get('id') == norma_id:
-                    return {
-                        'nome': norma.get('nome', norma_id),
-                        'descricao': norma.get('descricao', ''),
-                        'url': norma.get('url', ''),
-                        'status': norma.get('status', '')
-                    }
+            norma = self.dados_referencia.norma(norma_id)
+            if norma is not None:
+                return {
+                    'nome': norma.get('nome', norma_id),
+                    'descricao': norma.get('descricao', ''),
+                    'url': norma.get('url', ''),
+                    'status': norma.get('status', '')
+                }
         except Exception as e:
             log_erro(f"Erro ao buscar detalhes da norma {norma_id}: {str(e)}")
         
@@ -1944,49 +1872,119 @@ class AnalisadorRequerimentos:
         return secao_latex
 
     def _gerar_relatorio_latex(self) -> str:
-        """Gera relatório em LaTeX com todos os resultados da análise."""
+        """
+        Gera relatório em LaTeX com todos os resultados da análise.
+        
+        O documento é escrito em streaming: cada seção é emitida por um renderizador
+        diretamente no arquivo aberto, sem acumular o relatório inteiro em memória.
+        A seção de cada requerimento fica em um fragmento próprio (req_report/fragmentos),
+        incluído via \\input e regravado apenas quando seu conteúdo muda.
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         nome_arquivo = f"relatorio_analise_{timestamp}.tex"
         caminho_relatorio = self.pasta_resultados / nome_arquivo
+        pasta_fragmentos = self.pasta_resultados / LATEX_FRAGMENTOS_DIR
         
+        try:
+            pasta_fragmentos.mkdir(parents=True, exist_ok=True)
+            regravados = 0
+            with open(caminho_relatorio, 'w', encoding='utf-8') as f:
+                self._renderizar_preambulo_latex(f, self.resultados_analise, self._formatar_tempo_analise())
+                for req in self.resultados_analise:
+                    caminho_fragmento, regravado = self._escrever_fragmento_requerimento(pasta_fragmentos, req)
+                    regravados += regravado
+                    f.write(f"\\input{{{LATEX_FRAGMENTOS_DIR}/{caminho_fragmento.name}}}\n")
+                self._renderizar_palavras_chave_latex(f)
+                self._renderizar_referencias_latex(f)
+            log_info(f"📝 Fragmentos LaTeX: {regravados} regravado(s), {len(self.resultados_analise) - regravados} reaproveitado(s)")
+            log_info(f"Relatório LaTeX gerado: {caminho_relatorio}")
+            return str(caminho_relatorio)
+        except Exception as e:
+            log_erro(f"Erro ao gerar relatório LaTeX: {str(e)}")
+            return ""
+
+    def _escrever_fragmento_requerimento(self, pasta_fragmentos: Path, req: Dict) -> Tuple[Path, bool]:
+        """
+        Grava a seção LaTeX de um requerimento em req_<número>.tex, a menos que o fragmento
+        existente já tenha sido gerado a partir do mesmo resultado.
+        
+        A primeira linha do fragmento é um comentário com o hash do resultado, da versão
+        de ocds/equipamentos/requisitos, dos detalhes (normas.json) apenas das normas que o
+        fragmento cita e da versão do modelo (LATEX_FRAGMENTOS_VERSAO).
+        
+        Args:
+            pasta_fragmentos: Pasta onde os fragmentos são gravados
+            req: Resultado da análise do requerimento
+            
+        Returns:
+            Tuple com o caminho do fragmento e se ele foi (re)gravado
+        """
+        nome_req = re.sub(r'\W', '_', str(req.get("numero_requerimento", "")).lstrip('_'))
+        caminho_fragmento = pasta_fragmentos / f"req_{nome_req}.tex"
+        
+        normas_fragmento = set(self._coletar_normas_aplicaveis_requerimento(req)) | \
+            self._coletar_normas_verificadas_requerimento(req)
+        componentes = {
+            'resultado': req,
+            'referencia': self.dados_referencia.assinatura(('ocds', 'equipamentos', 'requisitos')),
+            'normas': {norma_id: self._obter_detalhes_norma(norma_id) for norma_id in sorted(normas_fragmento)},
+            'versao': LATEX_FRAGMENTOS_VERSAO
+        }
+        impressao = hashlib.sha256(
+            json.dumps(componentes, sort_keys=True, ensure_ascii=False, default=str).encode(ENCODING_UTF8)
+        ).hexdigest()
+        cabecalho = f"% impressao: {impressao}\n"
+        
+        if caminho_fragmento.exists():
+            with open(caminho_fragmento, 'r', encoding='utf-8') as f:
+                if f.readline() == cabecalho:
+                    return caminho_fragmento, False
+        
+        # Gravar em arquivo temporário e substituir, para não deixar fragmento truncado com hash válido
+        caminho_temporario = caminho_fragmento.with_suffix('.tmp')
+        with open(caminho_temporario, 'w', encoding='utf-8') as f:
+            f.write(cabecalho)
+            self._renderizar_secao_requerimento_latex(f, req)
+        caminho_temporario.replace(caminho_fragmento)
+        return caminho_fragmento, True
+
+    def _formatar_tempo_analise(self) -> str:
+        """Retorna o tempo total da análise formatado ou VALOR_NAO_DISPONIVEL."""
+        if self.tempo_inicio_analise and self.tempo_fim_analise:
+            tempo_total_analise = self.tempo_fim_analise - self.tempo_inicio_analise
+            return str(tempo_total_analise)#.split('.')[0]  # Remove microsegundos
+        return VALOR_NAO_DISPONIVEL
+
+    def _renderizar_preambulo_latex(self, f: TextIO, resultados: List[Dict], tempo_analise_formatado: str) -> None:
+        """
+        Escreve o preâmbulo do relatório LaTeX e o sumário com as estatísticas de `resultados`.
+        
+        Args:
+            f: Arquivo de saída
+            resultados: Resultados dos requerimentos cobertos pelo documento
+            tempo_analise_formatado: Tempo de processamento exibido no sumário
+        """
         # Calcular estatísticas gerais
-        total_requerimentos = len(self.resultados_analise)
-        total_documentos = sum(len(req.get("documentos_analisados", [])) for req in self.resultados_analise)
+        total_requerimentos = len(resultados)
+        total_documentos = sum(len(req.get("documentos_analisados", [])) for req in resultados)
         
         status_geral = {"CONFORME": 0, "NAO_CONFORME": 0, "INCONCLUSIVO": 0, "ERRO": 0, "PROCESSADO": 0}
-        for req in self.resultados_analise:
+        for req in resultados:
             for status, count in req.get("resumo_status", {}).items():
                 if status in status_geral:
                     status_geral[status] += count
         
-        # Calcular tempos de análise e compilação
-        tempo_analise_formatado = VALOR_NAO_DISPONIVEL
-        
-        if self.tempo_inicio_analise and self.tempo_fim_analise:
-            tempo_total_analise = self.tempo_fim_analise - self.tempo_inicio_analise
-            tempo_analise_formatado = str(tempo_total_analise)#.split('.')[0]  # Remove microsegundos
-        
-        # Preparar textos que precisam ser escapados
-        data_analise = escapar_latex(datetime.now().strftime("%d/%m/%Y às %H:%M:%S"))
-        
         # Preparar textos com acentos para LaTeX
         sumario_executivo = "Sumário"
         estatisticas_gerais = "Estatísticas Gerais"
-        analise_detalhada = "Análise Detalhada por Requerimento"
-        referencias = "Referências"
-        normas = "Dispositivos normativos"
-        requisitos_legais = "Lista de Requisitos"
         nao_conformes = "Não Conformes"
-        nao_conforme_rec = "Não Conforme"
-
         
-        # Conteúdo do relatório LaTeX
         agora = datetime.now().strftime("%H:%M:%S %d/%m/%Y")
         versao_git = 'v. 0.3.2'  # obter_versao_git()
         #utils_dir = Path(__file__).parent.parent / UTILS_DIR
         #classe_path = rf"{Path(__file__).parent.parent / UTILS_DIR / 'IEEEtran'}"
         #latex_content = f"""\\documentclass{{{classe_path}}}
-        latex_content = f"""\\documentclass[10pt,a4paper]{{article}}        
+        f.write(f"""\\documentclass[10pt,a4paper]{{article}}        
 \\usepackage[utf8]{{inputenc}} % interpreta o arquivo .tex como UTF-8 
 \\usepackage[T1]{{fontenc}}      % usa codificação de fonte T1 (suporta acentos latinos)
 \\usepackage{{lmodern}}          % usa uma fonte moderna com suporte a T1
@@ -2045,54 +2043,54 @@ SCH da ANATEL nos termos da Portaria Anatel nº 2257, de 03 de março de 2022 (S
     \\item \\textbf{{Data do processamento:}} {agora}
     \\item \\textbf{{Versão do script:}} {{\\textgreek{{θεoγενης - {versao_git}}}}}
 \\end{{itemize}}
-"""
-        
-        # Adicionar seção para cada requerimento
-        for i, req in enumerate(self.resultados_analise, 1):
-            numero_req = fullpath_para_req(req.get("numero_requerimento"))
-            documentos = req.get("documentos_analisados", [])
-            tempo_analise_req = req.get("tempo_total_analise_formatado", VALOR_NAO_DISPONIVEL)
-            #resumo = req.get("resumo_status", {})
-            #timestamp_analise = escapar_latex(req.get('timestamp_analise', 'N/A'))
-            
-            # Obter o nome do OCD e equipamentos do primeiro documento CCT encontrado
-            nome_ocd_completo = "OCD não identificado"
-            equipamentos_encontrados = []
-            
-            # Buscar o primeiro CCT com OCD válido
-            for doc in documentos:
-                if doc.get("tipo") == TIPO_CCT:
-                    dados_extraidos = doc.get("dados_extraidos", {})
-                    nome_ocd_extraido = dados_extraidos.get("nome_ocd", "N/A")
-                    equipamentos_doc = dados_extraidos.get("equipamentos", [])
-                    
-                    # Coletar equipamentos se disponíveis
-                    if equipamentos_doc:
-                        equipamentos_encontrados.extend(equipamentos_doc)
-                    
-                    if nome_ocd_extraido and nome_ocd_extraido != "N/A" and not nome_ocd_extraido.startswith('[ERRO]'):
-                        # Se o nome já parece completo (>= 15 caracteres), usar diretamente
-                        if len(nome_ocd_extraido) >= 15 and any(palavra in nome_ocd_extraido.lower() for palavra in ['ltda', 'sa', 'associação', 'fundação', 'organização', 'centro']):
-                            nome_ocd_completo = nome_ocd_extraido
-                        else:
-                            nome_ocd_completo = self._obter_nome_completo_ocd(nome_ocd_extraido)
-                        break  # Sair do loop após encontrar o primeiro OCD válido
-            
-            nome_ocd_escapado = escapar_latex(nome_ocd_completo)
-            
-            # Formatar lista de equipamentos
-            if equipamentos_encontrados:
-                # Remover duplicatas mantendo a ordem
-                equipamentos_unicos = []
-                for eq in equipamentos_encontrados:
-                    if eq not in equipamentos_unicos:
-                        equipamentos_unicos.append(eq)
-                equipamentos_texto = escapar_latex(", ".join(equipamentos_unicos))
-            else:
-                equipamentos_texto =  "\\textcolor{red}{\\textbf{Equipamento NÃO identificado}} na lista de requisitos ou nos nomes usados no Mosaico"
-                
-            
-            latex_content += f"""
+""")
+
+    def _renderizar_secao_requerimento_latex(self, f: TextIO, req: Dict) -> None:
+        """Escreve a seção de um requerimento (OCD, equipamentos, palavras-chave, normas e documentos)."""
+        numero_req = fullpath_para_req(req.get("numero_requerimento"))
+        documentos = req.get("documentos_analisados", [])
+        tempo_analise_req = req.get("tempo_total_analise_formatado", VALOR_NAO_DISPONIVEL)
+        #resumo = req.get("resumo_status", {})
+        #timestamp_analise = escapar_latex(req.get('timestamp_analise', 'N/A'))
+
+        # Obter o nome do OCD e equipamentos do primeiro documento CCT encontrado
+        nome_ocd_completo = "OCD não identificado"
+        equipamentos_encontrados = []
+
+        # Buscar o primeiro CCT com OCD válido
+        for doc in documentos:
+            if doc.get("tipo") == TIPO_CCT:
+                dados_extraidos = doc.get("dados_extraidos", {})
+                nome_ocd_extraido = dados_extraidos.get("nome_ocd", "N/A")
+                equipamentos_doc = dados_extraidos.get("equipamentos", [])
+
+                # Coletar equipamentos se disponíveis
+                if equipamentos_doc:
+                    equipamentos_encontrados.extend(equipamentos_doc)
+
+                if nome_ocd_extraido and nome_ocd_extraido != "N/A" and not nome_ocd_extraido.startswith('[ERRO]'):
+                    # Se o nome já parece completo (>= 15 caracteres), usar diretamente
+                    if len(nome_ocd_extraido) >= 15 and any(palavra in nome_ocd_extraido.lower() for palavra in ['ltda', 'sa', 'associação', 'fundação', 'organização', 'centro']):
+                        nome_ocd_completo = nome_ocd_extraido
+                    else:
+                        nome_ocd_completo = self._obter_nome_completo_ocd(nome_ocd_extraido)
+                    break  # Sair do loop após encontrar o primeiro OCD válido
+
+        nome_ocd_escapado = escapar_latex(nome_ocd_completo)
+
+        # Formatar lista de equipamentos
+        if equipamentos_encontrados:
+            # Remover duplicatas mantendo a ordem
+            equipamentos_unicos = []
+            for eq in equipamentos_encontrados:
+                if eq not in equipamentos_unicos:
+                    equipamentos_unicos.append(eq)
+            equipamentos_texto = escapar_latex(", ".join(equipamentos_unicos))
+        else:
+            equipamentos_texto =  "\\textcolor{red}{\\textbf{Equipamento NÃO identificado}} na lista de requisitos ou nos nomes usados no Mosaico"
+
+
+        f.write(f"""
             \\newpage            
             \\section{{Requerimento {numero_req}}}
             A seguir, os detalhes da análise dos documentos associados a este requerimento, cujo tempo de processamento foi: {tempo_analise_req}.
@@ -2100,240 +2098,249 @@ SCH da ANATEL nos termos da Portaria Anatel nº 2257, de 03 de março de 2022 (S
             \\item OCD: {nome_ocd_escapado}
             \\item Equipamento(s): {equipamentos_texto}
             \\end{{itemize}}
-            """
-            
-            # Coletar palavras-chave consolidadas
-            palavras_consolidadas, palavras_nao_encontradas = self._coletar_palavras_chave_consolidadas(req)
-            
-            latex_content += """
+            """)
+
+        # Coletar palavras-chave consolidadas
+        palavras_consolidadas, palavras_nao_encontradas = self._coletar_palavras_chave_consolidadas(req)
+
+        f.write("""
 Lista das palavras-chave \\textcolor{blue}{encontradas (multiplicidade)} neste requerimento: 
 
-"""            
-            
-            if palavras_consolidadas:
-                palavras_formatadas = []
-                
-                # Palavras encontradas em azul com contador
-                palavras_ordenadas = sorted(palavras_consolidadas.items(), key=lambda x: x[1], reverse=True)
-                for palavra, contador in palavras_ordenadas:
-                    palavra_escapada = escapar_latex(palavra)
-                    palavras_formatadas.append(f"\\textcolor{{blue}}{{{palavra_escapada} (x{contador})}}")
-                
-                latex_content += " ".join(palavras_formatadas)
-                latex_content += "\n\n"
-            else:
-                latex_content += "\\textit{Nenhuma palavra-chave específica foi encontrada neste requerimento.}\n\n"
-            
-            latex_content += """\\subsection{{Dispositivos Normativos}}
+""")
+
+        if palavras_consolidadas:
+            palavras_formatadas = []
+
+            # Palavras encontradas em azul com contador
+            palavras_ordenadas = sorted(palavras_consolidadas.items(), key=lambda x: x[1], reverse=True)
+            for palavra, contador in palavras_ordenadas:
+                palavra_escapada = escapar_latex(palavra)
+                palavras_formatadas.append(f"\\textcolor{{blue}}{{{palavra_escapada} (x{contador})}}")
+
+            f.write(" ".join(palavras_formatadas))
+            f.write("\n\n")
+        else:
+            f.write("\\textit{Nenhuma palavra-chave específica foi encontrada neste requerimento.}\n\n")
+
+        f.write("""\\subsection{{Dispositivos Normativos}}
             Abaixo estão listados os dispositivos normativos aplicáveis ao requerimento - dado(s) o(s) tipo(s) de equipamento(s) listado(s) nesse requerimento -, assim como normativos citados que estão revogados, ou que são apenas acessórios (apenas modificam itens de dispositivos aplicáveis) ou que estão obsoletos.
-            """           
-            # Coletar normas aplicáveis para este requerimento
-            normas_aplicaveis = self._coletar_normas_aplicaveis_requerimento(req)
-            normas_verificadas = self._coletar_normas_verificadas_requerimento(req)
-            
-            # Debug: Adicionar log para verificar se normas foram encontradas
-            #log_info(f"Normas aplicáveis encontradas para {numero_req}: {len(normas_aplicaveis)} normas")
-            #if normas_aplicaveis:
-                #log_info(f"Normas: {list(normas_aplicaveis.keys())}")
-            
-            # Subsubsection de dispositivos aplicáveis
-            latex_content += """\\subsubsection{{Normas aplicáveis}}
-"""
-            
-            if normas_aplicaveis:
-                latex_content += """\\begin{longtable}{p{0.15\\textwidth}p{0.45\\textwidth}p{0.3\\textwidth}}
+            """)
+        # Coletar normas aplicáveis para este requerimento
+        normas_aplicaveis = self._coletar_normas_aplicaveis_requerimento(req)
+        normas_verificadas = self._coletar_normas_verificadas_requerimento(req)
+
+        # Debug: Adicionar log para verificar se normas foram encontradas
+        #log_info(f"Normas aplicáveis encontradas para {numero_req}: {len(normas_aplicaveis)} normas")
+        #if normas_aplicaveis:
+            #log_info(f"Normas: {list(normas_aplicaveis.keys())}")
+
+        # Subsubsection de dispositivos aplicáveis
+        f.write("""\\subsubsection{{Normas aplicáveis}}
+""")
+
+        if normas_aplicaveis:
+            f.write("""\\begin{longtable}{p{0.15\\textwidth}p{0.45\\textwidth}p{0.3\\textwidth}}
 \\hline
 \\textbf{Status} & \\textbf{Norma} & \\textbf{Motivador(es)} \\\\
 \\hline
 \\endhead
-"""
-                
-                # Ordenar normas alfabeticamente
-                for norma_id in sorted(normas_aplicaveis.keys()):
-                    detalhes_norma = self._obter_detalhes_norma(norma_id)
-                    nome_norma = escapar_latex(detalhes_norma['nome'])
-                    url_norma = detalhes_norma['url']
-                    
-                    # Verificar se a norma foi verificada
-                    if norma_id in normas_verificadas:
-                        #status_norma = "\\textcolor{green}{OK}"
-                        status_norma = "\\textbf{\\textcolor{green}{$\\checkmark$}}"
-                    else:
-                        #status_norma = "\\textcolor{red}{Erro}"
-                        status_norma = "\\textcolor{red}{$\\times$}"
-                    
-                    motivadores = normas_aplicaveis[norma_id]
-                    motivadores_texto = escapar_latex("; ".join(motivadores))
-                    
-                    if url_norma:
-                        # Criar hyperlink para a norma
-                        latex_content += f"{status_norma} & \\href{{{url_norma}}}{{{nome_norma}}} & {motivadores_texto} \\\\ \\hline"
-                    else:
-                        # Sem hyperlink se não há URL
-                        latex_content += f"{status_norma} & {nome_norma} & {motivadores_texto} \\\\ \\hline"
-                
-                latex_content += """\\end{longtable}
-"""
-            else:
-                latex_content += f"\\textit{{Nenhuma norma específica identificada como requisito identificado para: {equipamentos_texto}}}\n\n"
+""")
 
-            # Verificar se há normativos revogados e gerar subsubsection específica
-            normativos_revogados = []
-            for norma_id in normas_verificadas:
+            # Ordenar normas alfabeticamente
+            for norma_id in sorted(normas_aplicaveis.keys()):
                 detalhes_norma = self._obter_detalhes_norma(norma_id)
-                status_norma = detalhes_norma.get('status', '').lower()
-                if status_norma and (status_norma in ['revogada', 'revogado', 'acessório', 'acessorio', 'acessoria', 'acessória', 'obsoleta', 'obsoleto']):
-                    normativos_revogados.append({
-                        'id': norma_id,
-                        'nome': detalhes_norma['nome'],
-                        'url': detalhes_norma['url'],
-                        'status': detalhes_norma['status']
-                    })
-            
-            if normativos_revogados:
-                latex_content += """\\subsubsection{Normas Problemáticas}
+                nome_norma = escapar_latex(detalhes_norma['nome'])
+                url_norma = detalhes_norma['url']
+
+                # Verificar se a norma foi verificada
+                if norma_id in normas_verificadas:
+                    #status_norma = "\\textcolor{green}{OK}"
+                    status_norma = "\\textbf{\\textcolor{green}{$\\checkmark$}}"
+                else:
+                    #status_norma = "\\textcolor{red}{Erro}"
+                    status_norma = "\\textcolor{red}{$\\times$}"
+
+                motivadores = normas_aplicaveis[norma_id]
+                motivadores_texto = escapar_latex("; ".join(motivadores))
+
+                if url_norma:
+                    # Criar hyperlink para a norma
+                    f.write(f"{status_norma} & \\href{{{url_norma}}}{{{nome_norma}}} & {motivadores_texto} \\\\ \\hline")
+                else:
+                    # Sem hyperlink se não há URL
+                    f.write(f"{status_norma} & {nome_norma} & {motivadores_texto} \\\\ \\hline")
+
+            f.write("""\\end{longtable}
+""")
+        else:
+            f.write(f"\\textit{{Nenhuma norma específica identificada como requisito identificado para: {equipamentos_texto}}}\n\n")
+
+        # Verificar se há normativos revogados e gerar subsubsection específica
+        normativos_revogados = []
+        for norma_id in normas_verificadas:
+            detalhes_norma = self._obter_detalhes_norma(norma_id)
+            status_norma = detalhes_norma.get('status', '').lower()
+            if status_norma and (status_norma in ['revogada', 'revogado', 'acessório', 'acessorio', 'acessoria', 'acessória', 'obsoleta', 'obsoleto']):
+                normativos_revogados.append({
+                    'id': norma_id,
+                    'nome': detalhes_norma['nome'],
+                    'url': detalhes_norma['url'],
+                    'status': detalhes_norma['status']
+                })
+
+        if normativos_revogados:
+            f.write("""\\subsubsection{Normas Problemáticas}
 Lista de normativos revogados, ou que apenas modificam um normativo vigente, identificados na análise deste requerimento:
 \\begin{itemize}
-"""
-                for normativo in sorted(normativos_revogados, key=lambda x: x['nome']):
-                    nome_normativo = escapar_latex(normativo['nome'])
-                    status_normativo = escapar_latex(normativo['status'])
-                    url_normativo = normativo['url']
-
-                    if status_normativo in ['revogada', 'revogado', 'obsoleta', 'obsoleto']:
-                        latex_content += f"    \\item \\textcolor{{red}}{{\\href{{{url_normativo}}}{{{nome_normativo}}} - {status_normativo}}}\n"
-                    else:
-                        latex_content += f"    \\item \\href{{{url_normativo}}}{{{nome_normativo}}} - {status_normativo}\n"
-                latex_content += """\\end{itemize}
-"""
+""")
+            for normativo in sorted(normativos_revogados, key=lambda x: x['nome']):
+                nome_normativo = escapar_latex(normativo['nome'])
+                status_normativo = escapar_latex(normativo['status'])
+                url_normativo = normativo['url']
+
+                if status_normativo in ['revogada', 'revogado', 'obsoleta', 'obsoleto']:
+                    f.write(f"    \\item \\textcolor{{red}}{{\\href{{{url_normativo}}}{{{nome_normativo}}} - {status_normativo}}}\n")
+                else:
+                    f.write(f"    \\item \\href{{{url_normativo}}}{{{nome_normativo}}} - {status_normativo}\n")
+            f.write("""\\end{itemize}
+""")
 
-            latex_content += f"""
+        f.write(f"""
 \\subsection{{Documentos Processados}}
 Apresenta-se a seguir a lista dos documentos processados neste requerimento, com os respectivos resultados da análise automatizada.
-"""
-            
-            # Separar relatórios de ensaio dos outros documentos
-            relatorios_ensaio = []
-            outros_documentos = []
-            
-            for doc in documentos:
-                if doc.get("tipo") == TIPO_RELATORIO_ENSAIO:
-                    relatorios_ensaio.append(doc)
-                else:
-                    outros_documentos.append(doc)
-            
-            # Seção específica para Relatórios de Ensaio (APENAS relatórios de ensaio)
-            if relatorios_ensaio:
-                latex_content += """\\subsubsection{Relatórios de Ensaios}
+""")
+
+        # Separar relatórios de ensaio dos outros documentos
+        relatorios_ensaio = []
+        outros_documentos = []
+
+        for doc in documentos:
+            if doc.get("tipo") == TIPO_RELATORIO_ENSAIO:
+                relatorios_ensaio.append(doc)
+            else:
+                outros_documentos.append(doc)
+
+        # Seção específica para Relatórios de Ensaio (APENAS relatórios de ensaio)
+        if relatorios_ensaio:
+            f.write("""\\subsubsection{Relatórios de Ensaios}
 Identificação do laboratório, solicitante, fabricante e modelo nos relatórios de ensaio processados:
 \\begin{longtable}{p{0.5\\textwidth}p{0.1\\textwidth}p{0.1\\textwidth}p{0.1\\textwidth}p{0.1\\textwidth}}
 \\hline
 \\textbf{Documento} & \\textbf{Lab} & \\textbf{Sol} & \\textbf{Fab} & \\textbf{Mod} \\\\
 \\hline
 \\endhead
-"""
-                
-                # Processar APENAS relatórios de ensaio na tabela
-                for doc in relatorios_ensaio:
-                    nome_completo = escapar_latex(doc.get("nome_arquivo", "N/A"))
-                    ocorrencias = re.findall(r'\[([^\]]+)\]', nome_completo)
-                    nome_item = nome_completo
-                    if len(ocorrencias) >= 2:
-                        nome_item = f"{ocorrencias[0]} ({ocorrencias[1]})"
-                    
-                    caminho = doc.get("caminho", "N/A")
-                    caminho_normalizado = latex_escape_path(caminho)
-                    nome_item_link = f"\\href{{file:{caminho_normalizado}}}{{{nome_item}}}"
-                    
-                    # Extrair status das avaliações
-                    dados_extraidos = doc.get("dados_extraidos", {})
-                    laboratorio_identificado = dados_extraidos.get("laboratorio_identificado", False)
-                    solicitante_identificado = dados_extraidos.get("solicitante_identificado", False)
-                    fabricante_identificado = dados_extraidos.get("fabricante_identificado", False)
-                    modelo_identificado = dados_extraidos.get("modelo_identificado", False)
-                    
-                    # Formatar status com símbolos coloridos
-                    status_lab = "\\textbf{\\textcolor{green}{$\\checkmark$}}" if laboratorio_identificado else "\\textcolor{red}{$\\times$}"
-                    status_sol = "\\textbf{\\textcolor{green}{$\\checkmark$}}" if solicitante_identificado else "\\textcolor{red}{$\\times$}"
-                    status_fab = "\\textbf{\\textcolor{green}{$\\checkmark$}}" if fabricante_identificado else "\\textcolor{red}{$\\times$}"
-                    status_mod = "\\textbf{\\textcolor{green}{$\\checkmark$}}" if modelo_identificado else "\\textcolor{red}{$\\times$}"
-                    
-                    latex_content += f"{nome_item_link} & {status_lab} & {status_sol} & {status_fab} & {status_mod} \\\\ \\hline\n"
-                
-                latex_content += """\\end{longtable}
+""")
 
-"""
-            
-            # Seção para outros documentos (NÃO relatórios de ensaio)
-            if outros_documentos:
-                latex_content += """\\subsubsection{Outros Documentos Processados}
+            # Processar APENAS relatórios de ensaio na tabela
+            for doc in relatorios_ensaio:
+                nome_completo = escapar_latex(doc.get("nome_arquivo", "N/A"))
+                ocorrencias = re.findall(r'\[([^\]]+)\]', nome_completo)
+                nome_item = nome_completo
+                if len(ocorrencias) >= 2:
+                    nome_item = f"{ocorrencias[0]} ({ocorrencias[1]})"
+
+                caminho = doc.get("caminho", "N/A")
+                caminho_normalizado = latex_escape_path(caminho)
+                nome_item_link = f"\\href{{file:{caminho_normalizado}}}{{{nome_item}}}"
+
+                # Extrair status das avaliações
+                dados_extraidos = doc.get("dados_extraidos", {})
+                laboratorio_identificado = dados_extraidos.get("laboratorio_identificado", False)
+                solicitante_identificado = dados_extraidos.get("solicitante_identificado", False)
+                fabricante_identificado = dados_extraidos.get("fabricante_identificado", False)
+                modelo_identificado = dados_extraidos.get("modelo_identificado", False)
+
+                # Formatar status com símbolos coloridos
+                status_lab = "\\textbf{\\textcolor{green}{$\\checkmark$}}" if laboratorio_identificado else "\\textcolor{red}{$\\times$}"
+                status_sol = "\\textbf{\\textcolor{green}{$\\checkmark$}}" if solicitante_identificado else "\\textcolor{red}{$\\times$}"
+                status_fab = "\\textbf{\\textcolor{green}{$\\checkmark$}}" if fabricante_identificado else "\\textcolor{red}{$\\times$}"
+                status_mod = "\\textbf{\\textcolor{green}{$\\checkmark$}}" if modelo_identificado else "\\textcolor{red}{$\\times$}"
+
+                f.write(f"{nome_item_link} & {status_lab} & {status_sol} & {status_fab} & {status_mod} \\\\ \\hline\n")
+
+            f.write("""\\end{longtable}
+
+""")
+
+        # Seção para outros documentos (NÃO relatórios de ensaio)
+        if outros_documentos:
+            f.write("""\\subsubsection{Outros Documentos Processados}
 
 \\begin{longtable}{p{0.9\\textwidth}}
 \\hline
 \\textbf{Documento} \\\\
 \\hline
 \\endhead
-"""
-                for doc in outros_documentos:
-                    nome_completo = escapar_latex(doc.get("nome_arquivo", "N/A"))
-                    ocorrencias = re.findall(r'\[([^\]]+)\]', nome_completo)
-                    nome_item = nome_completo
-                    if len(ocorrencias) >= 2:
-                        nome_item = f"{ocorrencias[0]} ({ocorrencias[1]})"
-                    
-                    caminho = doc.get("caminho", "N/A")
-                    caminho_normalizado = latex_escape_path(caminho)
-                    
-                    latex_content += f"\\href{{file:{caminho_normalizado}}}{{{nome_item}}} \\\\ \\hline\n"
-                
-                latex_content += """\\end{longtable}
+""")
+            for doc in outros_documentos:
+                nome_completo = escapar_latex(doc.get("nome_arquivo", "N/A"))
+                ocorrencias = re.findall(r'\[([^\]]+)\]', nome_completo)
+                nome_item = nome_completo
+                if len(ocorrencias) >= 2:
+                    nome_item = f"{ocorrencias[0]} ({ocorrencias[1]})"
 
-"""
-        
+                caminho = doc.get("caminho", "N/A")
+                caminho_normalizado = latex_escape_path(caminho)
+
+                f.write(f"\\href{{file:{caminho_normalizado}}}{{{nome_item}}} \\\\ \\hline\n")
+
+            f.write("""\\end{longtable}
+
+""")
+
+
+    def _renderizar_palavras_chave_latex(self, f: TextIO) -> None:
+        """Escreve a seção global de palavras-chave encontradas e não encontradas."""
         # Coletar todas as palavras-chave globais
         todas_palavras_encontradas, todas_palavras_nao_encontradas = self._coletar_todas_palavras_chave_globais()
-        
+
         # Adicionar seção global de palavras-chave
-        latex_content += f"""
+        f.write(f"""
 \\section{{Palavras-chave}}
 Lista completa de todas as palavras-chave identificadas durante a análise dos requerimentos processados.
 
 \\subsection{{Palavras-chave encontradas}}
-"""
-        
+""")
+
         if todas_palavras_encontradas:
             palavras_encontradas_ordenadas = sorted(todas_palavras_encontradas)
             palavras_encontradas_formatadas = []
             for palavra in palavras_encontradas_ordenadas:
                 palavra_escapada = escapar_latex(palavra)
                 palavras_encontradas_formatadas.append(palavra_escapada)
-            
-            latex_content += " ".join(palavras_encontradas_formatadas)
-            latex_content += "\n\n"
+
+            f.write(" ".join(palavras_encontradas_formatadas))
+            f.write("\n\n")
         else:
-            latex_content += "\\textit{Nenhuma palavra-chave foi encontrada nos documentos analisados.}\n\n"
-        
-        latex_content += """\\subsection{Palavras-chave não encontradas}
-"""
-        
+            f.write("\\textit{Nenhuma palavra-chave foi encontrada nos documentos analisados.}\n\n")
+
+        f.write("""\\subsection{Palavras-chave não encontradas}
+""")
+
         if todas_palavras_nao_encontradas:
             palavras_nao_encontradas_ordenadas = sorted(todas_palavras_nao_encontradas)
             palavras_nao_encontradas_formatadas = []
             for palavra in palavras_nao_encontradas_ordenadas:
                 palavra_escapada = escapar_latex(palavra)
                 palavras_nao_encontradas_formatadas.append(palavra_escapada)
-            
-            latex_content += " ".join(palavras_nao_encontradas_formatadas)
-            latex_content += "\n\n"
+
+            f.write(" ".join(palavras_nao_encontradas_formatadas))
+            f.write("\n\n")
         else:
-            latex_content += "\\textit{Não há palavras-chave não encontradas.}\n\n"
+            f.write("\\textit{Não há palavras-chave não encontradas.}\n\n")
+
+
+    def _renderizar_referencias_latex(self, f: TextIO) -> None:
+        """Escreve a seção de referências (requisitos legais por equipamento) e encerra o documento."""
+        referencias = "Referências"
+        requisitos_legais = "Lista de Requisitos"
         
         # Gerar seção de requisitos legais
         equipamentos_unicos = self._coletar_equipamentos_unicos()
         secao_requisitos = self._gerar_secao_requisitos_legais(equipamentos_unicos)
         
         # Finalizar o documento
-        latex_content += f"""
+        f.write(f"""
 \\section{{{referencias}}}
 A seguir são apresentados os requisitos legais e normas utilizados como referência na análise dos equipamentos identificados.
 
@@ -2341,20 +2348,16 @@ A seguir são apresentados os requisitos legais e normas utilizados como referê
 {secao_requisitos}
 
 \\end{{document}}
-"""
-        
-        # Salvar arquivo LaTeX
-        try:
-            with open(caminho_relatorio, 'w', encoding='utf-8') as f:
-                f.write(latex_content)
-            log_info(f"Relatório LaTeX gerado: {caminho_relatorio}")
-            return str(caminho_relatorio)
-        except Exception as e:
-            log_erro(f"Erro ao gerar relatório LaTeX: {str(e)}")
-            return ""
+""")
     
     def _compilar_latex_para_pdf(self, caminho_latex: str) -> str:
-        """Compila o arquivo LaTeX para PDF usando pdflatex."""
+        """
+        Compila o arquivo LaTeX para PDF.
+        
+        Os arquivos auxiliares ficam em req_report/build/<nome do relatório sem timestamp>,
+        preservados entre execuções para que a compilação seguinte reaproveite o .aux/.toc;
+        o PDF final é copiado para a pasta de resultados ao lado do .tex.
+        """
         caminho_pdf = ""
         caminho_latex_absoluto = ""
         try:
@@ -2362,78 +2365,139 @@ A seguir são apresentados os requisitos legais e normas utilizados como referê
             caminho_latex_path = Path(caminho_latex)
             if not caminho_latex_path.is_absolute():
                 caminho_latex_path = self.pasta_resultados / caminho_latex_path
-            caminho_latex_absoluto = str(caminho_latex_path.resolve())
-            
-            # Executar pdflatex
-            log_info(f"Compilando LaTeX: {caminho_latex_absoluto}")
-            resultado = subprocess.run([
-                "pdflatex", 
-                "-output-directory", str(self.pasta_resultados.resolve()),
-                caminho_latex_absoluto
-            ], capture_output=True, text=True, cwd=str(self.pasta_resultados.resolve()))
-            
-            if resultado.returncode == 0:
-                resultado = subprocess.run([
-                    "pdflatex", 
-                    "-output-directory", str(self.pasta_resultados.resolve()),
-                    caminho_latex_absoluto
-                ], capture_output=True, text=True, cwd=str(self.pasta_resultados.resolve()))
-
-                if resultado.returncode == 0:
-                    resultado = subprocess.run([
-                        "pdflatex", 
-                        "-output-directory", str(self.pasta_resultados.resolve()),
-                        caminho_latex_absoluto
-                    ], capture_output=True, text=True, cwd=str(self.pasta_resultados.resolve()))
-        
-                    if resultado.returncode == 0:
-                        caminho_pdf = caminho_latex_absoluto.replace(EXT_TEX, EXT_PDF)
-                        log_info(f"PDF gerado com sucesso: {caminho_pdf}")
-                        # Mantém apenas .tex, .pdf e .json
-                        exts_permitidas = {EXT_TEX, EXT_PDF, EXT_JSON}                    
-                        for arquivo in self.pasta_resultados.iterdir():
-                            if arquivo.is_file() and arquivo.suffix.lower() not in exts_permitidas:
-                                log_info(f"Apagando: {arquivo}")
-                                arquivo.unlink()  # apaga o arquivo
-
-                    # return caminho_pdf
-                else:
-                    log_erro(f"Erro na compilação LaTeX: {resultado.stderr}")
-                    #return caminho_latex_absoluto  # Retorna o .tex se falhar
+            caminho_latex_path = caminho_latex_path.resolve()
+            caminho_latex_absoluto = str(caminho_latex_path)
+            
+            log_info(f"Compilando LaTeX{' (rascunho)' if self.rascunho else ''}: {caminho_latex_absoluto}")
+            pdf_build = self._compilar_documento_latex(caminho_latex_path)
+            
+            if pdf_build is not None:
+                caminho_pdf = str(caminho_latex_path.with_suffix(EXT_PDF))
+                shutil.copyfile(pdf_build, caminho_pdf)
+                log_info(f"PDF gerado com sucesso: {caminho_pdf}")
        
         except FileNotFoundError:
             log_erro("pdflatex não encontrado. Instale uma distribuição LaTeX (TeX Live, MiKTeX)")
-            # Retornar caminho absoluto se disponível, senão o original
-            '''try:
-                return caminho_latex_absoluto
-            except NameError:
-                return caminho_latex'''
         except Exception as e:
             log_erro(f"Erro ao compilar LaTeX: {str(e)}")
-            # Retornar caminho absoluto se disponível, senão o original
-            '''try:
-                return caminho_latex_absoluto
-            except NameError:
-                return caminho_latex'''
         if caminho_pdf != "":
             return caminho_pdf
         else:
             return caminho_latex_absoluto
     
+    def _compilar_documento_latex(self, caminho_tex: Path, timeout: Optional[float] = None) -> Optional[Path]:
+        """
+        Compila um documento LaTeX em req_report/build/<nome sem timestamp>.
+        
+        O nome estável do job permite reaproveitar os auxiliares da execução anterior.
+        
+        Returns:
+            Path do PDF gerado na pasta de build ou None em caso de falha
+        """
+        nome_job = re.sub(r'_\d{8}_\d{6}$', '', caminho_tex.stem)
+        pasta_build = self.pasta_resultados.resolve() / LATEX_BUILD_DIR / nome_job
+        return compilar_latex(caminho_tex.resolve(), pasta_build, nome_job, self.rascunho, timeout)
+    
+    def _escrever_documento_requerimento(self, pasta_individuais: Path, caminho_fragmento: Path, req: Dict) -> Path:
+        """Grava o documento LaTeX independente de um requerimento, que inclui seu fragmento via \\input."""
+        caminho_documento = pasta_individuais / caminho_fragmento.name
+        with open(caminho_documento, 'w', encoding='utf-8') as f:
+            self._renderizar_preambulo_latex(f, [req], req.get("tempo_total_analise_formatado", VALOR_NAO_DISPONIVEL))
+            f.write(f"\\input{{../{LATEX_FRAGMENTOS_DIR}/{caminho_fragmento.name}}}\n")
+            f.write("\n\\end{document}\n")
+        return caminho_documento
+    
+    def _gerar_relatorios_por_requerimento(self) -> Tuple[str, str]:
+        """
+        Gera um documento LaTeX independente por requerimento (req_report/individuais) e um
+        documento índice com as estatísticas, palavras-chave e referências, compilando-os em
+        paralelo com até LATEX_COMPILACOES_PARALELAS processos e LATEX_TIMEOUT_COMPILACAO
+        segundos por execução, de modo que uma seção defeituosa não trave o lote.
+        
+        Requerimentos cujo fragmento não mudou e cujo PDF já existe não são recompilados; os
+        demais perdem o PDF anterior antes da compilação, de modo que só entram no relatório
+        final PDFs compilados nesta execução ou reaproveitados de um fragmento inalterado.
+        Os PDFs são mesclados, na ordem índice + requerimentos, em relatorio_analise_<timestamp>.pdf.
+        
+        Returns:
+            Tuple com o caminho do .tex índice e do PDF final ("" em caso de falha)
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        caminho_indice = self.pasta_resultados / f"relatorio_analise_{timestamp}.tex"
+        pasta_fragmentos = self.pasta_resultados / LATEX_FRAGMENTOS_DIR
+        pasta_individuais = self.pasta_resultados / LATEX_INDIVIDUAIS_DIR
+        
+        try:
+            pasta_fragmentos.mkdir(parents=True, exist_ok=True)
+            pasta_individuais.mkdir(parents=True, exist_ok=True)
+            
+            with open(caminho_indice, 'w', encoding='utf-8') as f:
+                self._renderizar_preambulo_latex(f, self.resultados_analise, self._formatar_tempo_analise())
+                self._renderizar_palavras_chave_latex(f)
+                self._renderizar_referencias_latex(f)
+            
+            # Documentos a compilar: o índice sempre; cada requerimento só se o fragmento mudou ou falta o PDF
+            pdfs_requerimentos = []
+            a_compilar = [caminho_indice]
+            for req in self.resultados_analise:
+                caminho_fragmento, regravado = self._escrever_fragmento_requerimento(pasta_fragmentos, req)
+                caminho_pdf_req = (pasta_individuais / caminho_fragmento.name).with_suffix(EXT_PDF)
+                if regravado or not caminho_pdf_req.exists():
+                    # Remove o PDF anterior: se a compilação falhar, o requerimento fica fora do
+                    # relatório final e volta a ser compilado na próxima execução
+                    caminho_pdf_req.unlink(missing_ok=True)
+                    a_compilar.append(self._escrever_documento_requerimento(pasta_individuais, caminho_fragmento, req))
+                pdfs_requerimentos.append(caminho_pdf_req)
+            
+            log_info(f"🔄 Compilando {len(a_compilar)} documento(s) LaTeX com até {LATEX_COMPILACOES_PARALELAS} processo(s)...")
+            pdfs_build = {}
+            with ThreadPoolExecutor(max_workers=LATEX_COMPILACOES_PARALELAS) as executor:
+                futuros = {caminho: executor.submit(self._compilar_documento_latex, caminho, LATEX_TIMEOUT_COMPILACAO)
+                           for caminho in a_compilar}
+                for caminho, futuro in futuros.items():
+                    try:
+                        pdfs_build[caminho] = futuro.result()
+                    except subprocess.TimeoutExpired:
+                        log_erro(f"Tempo limite de {LATEX_TIMEOUT_COMPILACAO}s excedido ao compilar {caminho.name}")
+                        pdfs_build[caminho] = None
+            
+            for caminho in a_compilar[1:]:
+                if pdfs_build[caminho] is not None:
+                    shutil.copyfile(pdfs_build[caminho], caminho.with_suffix(EXT_PDF))
+            
+            pdf_indice = pdfs_build[caminho_indice]
+            if pdf_indice is None:
+                return str(caminho_indice), ""
+            
+            pdfs_existentes = [caminho for caminho in pdfs_requerimentos if caminho.exists()]
+            if len(pdfs_existentes) < len(pdfs_requerimentos):
+                log_erro(f"{len(pdfs_requerimentos) - len(pdfs_existentes)} requerimento(s) sem PDF ficaram fora do relatório final")
+            
+            caminho_pdf = caminho_indice.with_suffix(EXT_PDF)
+            if not mesclar_pdfs([pdf_indice] + pdfs_existentes, caminho_pdf):
+                # Sem PyMuPDF: entregar o índice; os PDFs individuais ficam em req_report/individuais
+                shutil.copyfile(pdf_indice, caminho_pdf)
+            log_info(f"PDF gerado com sucesso: {caminho_pdf}")
+            return str(caminho_indice), str(caminho_pdf)
+        
+        except FileNotFoundError:
+            log_erro("pdflatex não encontrado. Instale uma distribuição LaTeX (TeX Live, MiKTeX)")
+        except Exception as e:
+            log_erro(f"Erro ao gerar relatórios por requerimento: {str(e)}")
+        return str(caminho_indice) if caminho_indice.exists() else "", ""
+    
     def _salvar_resultados_json(self) -> str:
-        """Salva os resultados da análise em formato JSON."""
+        """Salva os resultados da análise em formato JSON, compactando o registro JSONL da execução."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         nome_arquivo = f"resultados_analise_{timestamp}.json"
         caminho_json = self.pasta_resultados / nome_arquivo
         
-        try:
-            with open(caminho_json, 'w', encoding='utf-8') as f:
-                json.dump(self.resultados_analise, f, indent=2, ensure_ascii=False)
+        requerimentos = [req.get("numero_requerimento") for req in self.resultados_analise]
+        if self.arquivo_resultados.compactar(caminho_json, requerimentos):
             log_info(f"Resultados JSON salvos: {caminho_json}")
             return str(caminho_json)
-        except Exception as e:
-            log_erro(f"Erro ao salvar JSON: {str(e)}")
-            return ""
+        log_erro(f"Erro ao salvar JSON: {caminho_json}")
+        return ""
     
     def executar_analise(self):
         """Método principal para executar a análise completa."""
@@ -2448,6 +2512,7 @@ A seguir são apresentados os requisitos legais e normas utilizados como referê
             # Iniciar cronômetro da análise
             self.tempo_inicio_analise = datetime.now()
             log_info(f"\n🔄 Iniciando análise...")
+            self.arquivo_resultados = self._abrir_arquivo_resultados(escopo == "*")
             
             if escopo == "*":
                 # Analisar todos os requerimentos
@@ -2457,20 +2522,12 @@ A seguir são apresentados os requisitos legais e normas utilizados como referê
                     return
 
                 log_info(f"📊 Analisando {len(requerimentos)} requerimentos...")
-
-                for req in requerimentos:
-                    log_info(f"  🔍 Analisando: {req}")
-                    # só para debug
-                    #if req not in ["25.07808"]:
-                    #    continue
-                    processar_requerimentos_excel(req)                    
-                    resultado = self._analisar_requerimento_individual(req)
-                    if resultado:
-                        self.resultados_analise.append(resultado)
+                self._analisar_todos_requerimentos(requerimentos)
             else:
                 # Analisar requerimento específico
                 log_info(f"📊 Analisando requerimento: {escopo}")
                 resultado = self._analisar_requerimento_individual(escopo)
+                self._registrar_resultado(escopo, resultado)
                 if resultado:
                     self.resultados_analise.append(resultado)
             
@@ -2488,22 +2545,32 @@ A seguir são apresentados os requisitos legais e normas utilizados como referê
             log_info("💾 Salvando resultados JSON...")
             caminho_json = self._salvar_resultados_json()
             
-            # Gerar relatório LaTeX
-            log_info("📄 Gerando relatório LaTeX...")
-            caminho_latex = self._gerar_relatorio_latex()
+            # Cadastrar as normas novas antes de renderizar (fragmentos em cache não passam pelo renderizador)
+            self._registrar_normas_novas(self.resultados_analise)
             
-            if caminho_latex:
-                # Tentar compilar para PDF
-                log_info("🔄 Compilando relatório para PDF...")                
-                caminho_pdf = self._compilar_latex_para_pdf(caminho_latex)                
+            if self.por_requerimento:
+                # Documentos independentes por requerimento, compilados em paralelo e mesclados
+                log_info("📄 Gerando relatórios LaTeX por requerimento...")
+                caminho_latex, caminho_pdf = self._gerar_relatorios_por_requerimento()
+            else:
+                # Gerar relatório LaTeX
+                log_info("📄 Gerando relatório LaTeX...")
+                caminho_latex = self._gerar_relatorio_latex()
+                caminho_pdf = ""
                 
+                if caminho_latex:
+                    # Tentar compilar para PDF
+                    log_info("🔄 Compilando relatório para PDF...")                
+                    caminho_pdf = self._compilar_latex_para_pdf(caminho_latex)                
+            
+            if caminho_latex:
                 log_info(f"\n🎉 Análise finalizada com sucesso!")
                 log_info(f"📁 Resultados salvos em: {self.pasta_resultados}")
                 if caminho_json:
                     log_info(f"📊 JSON: {Path(caminho_json).name}")
                 if caminho_latex:
                     log_info(f"📄 LaTeX: {Path(caminho_latex).name}")
-                    if caminho_pdf != caminho_latex:
+                    if caminho_pdf and caminho_pdf != caminho_latex:
                         log_info(f"📋 PDF: {Path(caminho_pdf).name}")
             
         except KeyboardInterrupt:
@@ -2511,9 +2578,41 @@ A seguir são apresentados os requisitos legais e normas utilizados como referê
         except Exception as e:
             log_erro_critico(f"Erro crítico na análise: {str(e)}")
             log_info(f"❌ Erro crítico na análise. Verifique os logs.")
+        finally:
+            # Persistir o cache de extração mesmo em caso de interrupção
+            self._finalizar_cache_extracao()
+            if self.arquivo_resultados is not None:
+                self.arquivo_resultados.fechar()
+
+
+# ================================
+# ANÁLISE PARALELA - PROCESSOS AUXILIARES
+# ================================
+
+# Analisador de cada processo auxiliar, criado uma única vez pelo inicializador do pool
+_analisador_worker: Optional[AnalisadorRequerimentos] = None
+
+
+def _inicializar_worker_analise() -> None:
+    """Inicializador do ProcessPoolExecutor: carrega configurações e cache uma vez por processo."""
+    global _analisador_worker
+    _analisador_worker = AnalisadorRequerimentos()
+
+
+def _analisar_requerimento_worker(nome_requerimento: str) -> Tuple[Dict, Dict]:
+    """
+    Analisa um requerimento em um processo auxiliar.
+    
+    Returns:
+        Tuple com o resultado da análise e as alterações do cache de extração
+        a serem incorporadas pelo processo principal
+    """
+    resultado = _analisador_worker._analisar_requerimento_individual(nome_requerimento)
+    return resultado, _analisador_worker.cache_extracao.exportar_alteracoes()
 
 
-def analisar_requerimento():
+def analisar_requerimento(workers: int = WORKERS_ANALISE_PADRAO, incremental: bool = False, rascunho: bool = False,
+                          por_requerimento: bool = False, retomar: bool = False):
     """Função principal para análise de requerimentos - compatibilidade com main.py"""
-    analisador = AnalisadorRequerimentos()
+    analisador = AnalisadorRequerimentos(workers, incremental, rascunho, por_requerimento, retomar)
     analisador.executar_analise()
\ No newline at end of file
@@ -9,7 +9,6 @@ Centraliza todos os valores estáticos e configurações do sistema.
 # ================================
 
 # Caminhos de execução
-MIN_FILE_SIZE = 1000
 CHROME_PATH = r"C:\Program Files\Google\Chrome\Application\chrome.exe"
 TESSERACT_PATH = r"C:\Users\tbnobrega\AppData\Local\Programs\Tesseract-OCR\tesseract.exe"
 
@@ -23,12 +22,24 @@ REQUERIMENTOS_DIR_INBOX = "req_inbox"
 REQUERIMENTOS_DIR_OUTBOX = "req_outbox"
 REQUERIMENTOS_DIR_REPORT = "req_report"
 UTILS_DIR = "utils"
-DOWNLOAD_LOG_FILENAME = "download_status.json"
+DOWNLOAD_LOG_FILENAME = "download_status.db"
+# Log de downloads em JSON usado antes do SQLite (importado automaticamente)
+DOWNLOAD_LOG_JSON_LEGADO = "download_status.json"
 
 # Caminhos completos para planilha e requerimentos
 EXCEL_PATH = rf"{TBN_FILES_FOLDER}\ORCN.xlsx"
 REQUERIMENTOS_PATH = rf"{TBN_FILES_FOLDER}\{REQUERIMENTOS_DIR_INBOX}"
 
+# Cache persistente de extração de texto dos PDFs (relativo a TBN_FILES_FOLDER)
+CACHE_DIR = "cache"
+CACHE_EXTRACAO_DIR = "extracao_pdf"
+CACHE_EXTRACAO_INDICE = "indice.json"
+# Incrementar quando a lógica de extração mudar, invalidando as entradas antigas
+CACHE_EXTRACAO_VERSAO = 2
+CACHE_RESULTADOS_DIR = "resultados_analise"
+# Incrementar quando a lógica de análise mudar, invalidando os resultados em cache
+CACHE_RESULTADOS_VERSAO = 2
+
 # Arquivos JSON de configuração
 JSON_FILES = {
     'regras': f"{UTILS_DIR}/regras.json",
@@ -68,6 +79,7 @@ CSS_SELECTORS = {
     'tabela_analise': "table.analiseTable",
     'link_pdf': "a[href*='.pdf'], a[href*='download']",
     'paginator_options': "select.ui-paginator-rpp-options",
+    'paginator_atual': ".ui-paginator-current",
     'blockui': ".ui-blockui",
     'salvarFraseRR': "#formAnalise\\:j_idt666"
 }
@@ -80,6 +92,11 @@ CHROME_ARGS = [
     "--disable-blink-features=AutomationControlled"
 ]
 
+# Download em várias abas do mesmo navegador autenticado
+ABAS_DOWNLOAD_PADRAO = 1  # 1 = uma aba, processamento sequencial
+ABAS_DOWNLOAD_MAX = 4  # Limite de abas simultâneas para não sobrecarregar o servidor
+INTERVALO_ALTERNANCIA_ABAS = 200  # ms: espera curta com que uma aba ociosa devolve o controle às demais
+
 # ================================
 # TIMEOUTS E LIMITES
 # ================================
@@ -90,6 +107,7 @@ TIMEOUT_FORCE_CLICK = 2000
 TIMEOUT_LOAD_STATE = 10000
 TIMEOUT_BLOCKUI = 15000
 TIMEOUT_MENU_CLICK = 3600000
+TIMEOUT_ELEMENTO = 30000  # Espera por um elemento que surge após uma atualização AJAX
 
 # Timeouts em segundos para controle de sessão/MFA
 TIMEOUT_SESSAO_MFA = 30 * 60  # 30 minutos para solicitar re-autenticação MFA
@@ -98,12 +116,15 @@ TIMEOUT_SESSAO_MFA = 30 * 60  # 30 minutos para solicitar re-autenticação MFA
 MAX_TENTATIVAS_BOTAO = 5  # Máximo de tentativas por botão ao buscar PDFs
 MAX_TENTATIVAS_DOWNLOAD = 5  # Máximo de tentativas por arquivo individual
 
-# Delays
-SLEEP_AFTER_CLICK = 1
-SLEEP_AJAX_WAIT = 0.3
-SLEEP_SCROLL_WAIT = 0.3
-SLEEP_TABELA_RELOAD = 1
-SLEEP_ANEXOS_WAIT = 2
+# Intervalo (segundos) entre tentativas de um botão ou download que falhou
+ESPERA_NOVA_TENTATIVA = 2
+
+# Download direto (HTTP) dos anexos, reaproveitando os cookies da sessão do navegador
+DOWNLOADS_HTTP_SIMULTANEOS = 4  # Anexos baixados em paralelo por botão
+TIMEOUT_DOWNLOAD_HTTP = 120  # Segundos sem resposta antes de cair no download por clique
+TAMANHO_BLOCO_DOWNLOAD = 1024 * 1024  # Bytes gravados em disco a cada leitura da resposta
+TIPOS_CONTEUDO_ANEXO_HTTP = ("application/pdf", "application/octet-stream")  # Demais tipos caem no download por clique
+ASSINATURA_PDF = b"%PDF"  # Bytes iniciais de todo arquivo PDF
 
 # Limites de paginação
 ITEMS_PER_PAGE = "100"
@@ -307,6 +328,14 @@ FORMATO_NOME_SIMPLES = "[{categoria}] {nome}{ext}"
 CARACTERES_INVALIDOS = r'[<>:"/\\|?*]'
 SUBSTITUTO_CARACTERE = '_'
 
+# Formatos de "Data - Hora" da tabela de anexos: (padrão, ano vem primeiro)
+PADROES_DATA_ANEXO = [
+    (r"(\d{2})/(\d{2})/(\d{4})", False),  # dd/mm/yyyy
+    (r"(\d{4})-(\d{2})-(\d{2})", True),   # yyyy-mm-dd
+    (r"(\d{2})-(\d{2})-(\d{4})", False),  # dd-mm-yyyy
+]
+DATA_ANEXO_DESCONHECIDA = "0000.00.00"
+
 # ================================
 # CONFIGURAÇÕES DE OCR/PDF
 # ================================
@@ -315,10 +344,29 @@ SUBSTITUTO_CARACTERE = '_'
 EXTENSOES_PDF = ['.pdf']
 EXTENSOES_IMAGEM = ['.jpg', '.jpeg', '.png', '.tiff', '.bmp']
 
+# OCR paralelo por página: máximo de páginas rasterizadas/reconhecidas simultaneamente
+OCR_MAX_WORKERS = 4
+OCR_IDIOMA = 'por'
+
+# Extração híbrida: página vai para OCR se tiver pouco texto nativo e estiver coberta por imagens
+OCR_MIN_CARACTERES_PAGINA = 50
+OCR_MIN_COBERTURA_IMAGEM = 0.5
+
+# Métodos de extração de texto registrados no cache de extração
+METODO_EXTRACAO_NATIVO = "nativo"
+METODO_EXTRACAO_OCR = "ocr"
+METODO_EXTRACAO_HIBRIDO = "hibrido"
+
 # Configurações de processamento
 LIMITE_CARACTERES_ERRO = 50
 LIMITE_CARACTERES_LOG = 80
 
+# Idade máxima (em dias) para um documento ser considerado recente
+DIAS_ARQUIVO_RECENTE = 365
+
+# Processos paralelos na análise de todos os requerimentos (1 = execução serial)
+WORKERS_ANALISE_PADRAO = 1
+
 # ================================
 # VERSIONING
 # ================================
@@ -336,6 +384,25 @@ GIT_COMMANDS = {
 # Timeout para comandos Git
 GIT_TIMEOUT = 5
 
+# ================================
+# COMPILAÇÃO LATEX
+# ================================
+
+# Pasta (dentro de req_report) com os arquivos auxiliares de compilação, preservados entre execuções
+LATEX_BUILD_DIR = "build"
+# Máximo de execuções do pdflatex enquanto o .aux continuar mudando
+LATEX_MAX_PASSADAS = 4
+# Pasta (dentro de req_report) com as seções de cada requerimento, incluídas no relatório via \input
+LATEX_FRAGMENTOS_DIR = "fragmentos"
+# Versão do modelo das seções; incrementar ao alterar o layout para invalidar os fragmentos gravados
+LATEX_FRAGMENTOS_VERSAO = 1
+# Pasta (dentro de req_report) com os documentos independentes de cada requerimento e seus PDFs
+LATEX_INDIVIDUAIS_DIR = "individuais"
+# Máximo de compilações pdflatex simultâneas no modo de relatório por requerimento
+LATEX_COMPILACOES_PARALELAS = 4
+# Tempo máximo (segundos) de cada execução do compilador no modo de relatório por requerimento
+LATEX_TIMEOUT_COMPILACAO = 300
+
 # ================================
 # EXTENSÕES DE ARQUIVO
 # ================================
@@ -344,10 +411,12 @@ GIT_TIMEOUT = 5
 EXT_PDF = '.pdf'
 EXT_JSON = '.json'
 EXT_TEX = '.tex'
+EXT_JSONL = '.jsonl'
 
 # Padrões de glob
 GLOB_PDF = '*.pdf'
 GLOB_JSON = '*.json'
+GLOB_RESULTADOS_JSONL = 'resultados_analise_*.jsonl'
 
 # ================================
 # STATUS DE ANÁLISE
@@ -366,6 +435,9 @@ STATUS_PROCESSADO = "PROCESSADO"
 
 # Palavras-chave essenciais para análise de manuais
 # Estrutura: {"palavra_chave": {"normas": ["norma1", "norma2"]}}
+# Contar palavras-chave apenas como palavras inteiras (ex.: "tv" não casa dentro de "atividade")
+PALAVRAS_CHAVE_LIMITE_PALAVRA = False
+
 PALAVRAS_CHAVE_MANUAL = {
     "declaração em conformidade com os Requisitos de Segurança Cibernética": {"normas": []},
     "vinculada à vigência": {"normas": []},
@@ -412,6 +484,166 @@ PALAVRAS_CHAVE_MANUAL = {
     "satellite": {"normas": []}    
 }
 
+# Palavras removidas do texto antes da busca das normas citadas (ato/resolução + número)
+PALAVRAS_IGNORADAS_NORMAS = ["contato","Contato","Nº","N°","NO","nº","n°","n.","N.","no","de","do", "da", "anatel"]
+
+# Entradas do cache (LRU) de normalização de IDs de normas ("Ato nº 77" -> "ato77")
+TAMANHO_CACHE_NORMALIZACAO_NORMAS = 4096
+
+# Strings de até LIMITE_TEXTO_CURTO_NORMALIZACAO caracteres (nomes, modelos, equipamentos) passam
+# pelo cache (LRU) de normalizar(); textos de documentos são normalizados uma vez por documento
+TAMANHO_CACHE_NORMALIZACAO = 8192
+LIMITE_TEXTO_CURTO_NORMALIZACAO = 256
+
+# Padrões por OCD (CNPJ formatado) que delimitam a seção do CCT onde estão as normas
+# verificadas e os equipamentos certificados; a busca é feita só nesse recorte
+PADROES_OCD = {
+    #DEKRA CERTIFICATION B.V.
+    "26.600.714/0001-24": {
+        "start_pattern": r"Reference\s+Standards",
+        "end_pattern": r"Certificação\s+Inicial",
+        "processing_type": "custom",
+        "custom_patterns": ['ATO', 'RESOLUÇÃO']
+    },
+    #PCN DO BRASIL TELECOMUNICAÇÕES
+    "32.193.729/0001-18": {
+        "start_pattern": r"Regulation\s+applied\s+to\s+the\s+product",
+        "end_pattern": r"5\s*-\s*RELAÇÃO\s+DE\s+LABORATÓRIO",
+        "processing_type": "custom",
+        "custom_patterns": ['ATO', 'RESOLUÇÃO']
+    },
+    # Moderna Tecnologia LTDA
+    "44.458.010/0001-40": {
+        "start_pattern": r'Fabricante',
+        "end_pattern": r'Diretor\s+de\s+Tecnologia',
+        "processing_type": "custom",
+        "custom_patterns": ['ATO', 'RESOLUÇÃO']
+    },
+    # Associação NCC Certificações do Brasil
+    "04.192.889/0001-07": {
+        "start_pattern": r'Regulation\s+Applicable',
+        "end_pattern": r'Conforme\s+os\s+termos\s+do\s+Ato\s+de\s+Designação\s+nº\s+16\.955',
+        "processing_type": "custom",
+        "custom_patterns": ['ATO', 'RESOLUÇÃO']
+    },
+    # Brics Certificacoes de Sistemas de Gestao e Produtos Ltda
+    "16.884.899/0001-92": {
+        "start_pattern": r'Documento\s+Normativo:',
+        "end_pattern": r'Tipo\s+de\s+Produto',
+        "processing_type": "custom",
+        "custom_patterns": ['ATO', 'RESOLUÇÃO']
+    },
+    # ABCP Certificadora de Produtos LTDA (estimativa baseada no nome)
+    "00.000.000/0001-01": {
+        "start_pattern": r'Normas?\s+Verificadas?',
+        "end_pattern": r'ABCP\s+Certificadora',
+        "processing_type": "regex_patterns"
+    },
+    # ACERT ORGANISMO DE CERTIFICACAO (estimativa baseada no nome)
+    "00.000.000/0001-02": {
+        "start_pattern": r'Standards?\s+(?:Applied|Verified)',
+        "end_pattern": r'ACERT\s+ORGANISMO',
+        "processing_type": "regex_patterns"
+    },
+    # SGS do Brasil Ltda (estimativa baseada no nome)
+    "00.000.000/0001-03": {
+        "start_pattern": r'Technical\s+Standards?',
+        "end_pattern": r'SGS\s+do\s+Brasil',
+        "processing_type": "regex_patterns"
+    },
+    # BraCert – BRASIL CERTIFICAÇÕES LTDA (estimativa baseada no nome)
+    "00.000.000/0001-04": {
+        "start_pattern": r'Normas?\s+Aplicadas?',
+        "end_pattern": r'BraCert.*BRASIL\s+CERTIFICAÇÕES',
+        "processing_type": "regex_patterns"
+    },
+    # CCPE – CENTRO DE CERTIFICAÇÃO (estimativa baseada no nome)
+    "00.000.000/0001-05": {
+        "start_pattern": r'Technical\s+Standards?',
+        "end_pattern": r'CCPE.*CENTRO\s+DE\s+CERTIFICAÇÃO',
+        "processing_type": "regex_patterns"
+    },
+    # OCD-Eldorado (estimativa baseada no nome)
+    "00.000.000/0001-06": {
+        "start_pattern": r'NORMAS\s+APLICÁVEIS/\s+APPLICABLE\s+STANDARDS',
+        "end_pattern": r'O\s+OCD-Eldorado\s+atribui\s+a\s+certificação\s-aos\s+produtos\s+mencionados\s+acima',
+        "processing_type": "custom",
+        "custom_patterns": ['ATO', 'RESOLUÇÃO']
+    },
+    # Organismo ICC (estimativa baseada no nome)
+    "00.000.000/0001-07": {
+        "start_pattern": r'Regulation\s+Applicable',
+        "end_pattern": r'O\s+organismo\s+ICC\s+no\s+uso\s+das\s+atribuições\s+que\s+lhe\s+confere\s+o\s+Ato\s+de\s+Designação',
+        "processing_type": "custom",
+        "custom_patterns": ['ATO', 'RESOLUÇÃO']
+    },
+    # Master Associação de Avaliação de Conformidade
+    "07.832.680/0001-59": {
+        "start_pattern": r'Reference\s+Standards',
+        "end_pattern": r'LABORATÓRIOS\s+DE\s+ENSAIOS',
+        "processing_type": "custom",
+        "custom_patterns": ['ATO', 'RESOLUÇÃO']
+    },
+    # OCP-TELI - ORGANIZAÇÃO CERTIFICADORA DE PRODUTOS DE TELECOMUNICAÇÕES E INFORMÁTICA
+    "04.538.402/0001-03": {
+        "start_pattern": r'Regulamentos\s+Aplicáveis:',
+        "end_pattern": r'OCD\s+designado\s+pelo\s+Ato\s+nº\s+19\.434',
+        "processing_type": "custom",
+        "custom_patterns": ['ATO', 'RESOLUÇÃO']
+    },
+    # TÜV (estimativa baseada no nome)
+    "00.000.000/0001-08": {
+        "start_pattern": r'Standards?\s+Applied',
+        "end_pattern": r'TÜV',
+        "processing_type": "regex_patterns"
+    },
+    # UL do Brasil Ltda
+    "02.839.483/0001-48": {
+        "start_pattern": r'normative\s+documents',
+        "end_pattern": r'e\s+atesta\s+que\s+o\s+produto\s+para\s+telecomunicações\s+está\s+em\s+conformidade',
+        "processing_type": "custom",
+        "custom_patterns": ['ATO', 'RESOLUÇÃO']
+    },
+    # UL do Brasil Certificações
+    "04.830.102/0001-95": {
+        "start_pattern": r'normative\s+documents',
+        "end_pattern": r'e\s+atesta\s+que\s+o\s+produto\s+para\s+telecomunicações\s+está\s+em\s+conformidade',
+        "processing_type": "custom",
+        "custom_patterns": ['ATO', 'RESOLUÇÃO']
+    },
+    # QC Certificações (estimativa baseada no nome)
+    "00.000.000/0001-09": {
+        "start_pattern": r'Certification\s+programor\s+regulation',
+        "end_pattern": r'Emissão',
+        "processing_type": "custom",
+        "custom_patterns": ['ATO', 'RESOLUÇÃO']
+    },
+    # Associação Versys de Tecnologia
+    "26.352.661/0001-70": {
+        "start_pattern": r'Applicable\s+Standards:',
+        "end_pattern": r'Data\s+Certificação',
+        "processing_type": "custom",
+        "custom_patterns": ['ATO', 'RESOLUÇÃO']
+    },
+    # FUNDACAO CENTRO DE PESQUISA E DESENVOLVIMENTO DE TELECOMUNICACOES- CPQD.
+    "02.641.663/0001-10": {
+        "start_pattern": r'Technical\s+Standards:',
+        "end_pattern": r'Relatório\s+de\s+Conformidade\s',
+        "processing_type": "custom",
+        "custom_patterns": ['ATO', 'RESOLUÇÃO']
+    },
+    # Associação LMP Certificações (estimativa baseada no nome)
+    "00.000.000/0001-10": {
+        "start_pattern": r'Certificamos\s+que\s+o\s+produto\s+está\s+em\s+conformidade\s+com\s+as\s+seguintes\s+referências:',
+        "end_pattern": r'Organismo\s+de\s+Certificação\s+Designado\s+pela\s+ANATEL\s+—\s+Agência\s+Nacional\s+de\s+Telecomunicações',
+        "processing_type": "custom",
+        "custom_patterns": ['ATO', 'RESOLUÇÃO'] 
+    }
+}
+
+# Restringe a extração de normas do CCT à seção delimitada em PADROES_OCD (equipamentos usam o texto completo)
+EXTRACAO_CCT_POR_SECAO = True
+
 # ================================
 # VALORES PADRÃO E PLACEHOLDERS
 # ================================
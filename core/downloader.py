@@ -3,8 +3,15 @@ from pathlib import Path
 import sys, json
 import time
 import re
+import threading
+import shutil
+import urllib.request
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote, urlparse
+from typing import Callable, Dict, List
 from openpyxl import load_workbook
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 from datetime import datetime
 from core.utils import carregar_log_downloads
 from core.log_print import log_info, log_erro, log_erro_critico
@@ -12,9 +19,14 @@ from core.const import (
     BOTOES, CHROME_PATH, TBN_FILES_FOLDER, CHROME_PROFILE_DIR, 
     REQUERIMENTOS_DIR_INBOX, MOSAICO_BASE_URL, BOTOES_PDF, CHROME_ARGS,
     TIMEOUT_SESSAO_MFA, MAX_TENTATIVAS_BOTAO, MAX_TENTATIVAS_DOWNLOAD,
+    TIMEOUT_PRIMEFACES_AJAX, TIMEOUT_BLOCKUI, TIMEOUT_ELEMENTO, TIMEOUT_LOAD_STATE, ESPERA_NOVA_TENTATIVA,
+    ABAS_DOWNLOAD_PADRAO, ABAS_DOWNLOAD_MAX, INTERVALO_ALTERNANCIA_ABAS,
+    DOWNLOADS_HTTP_SIMULTANEOS, TIMEOUT_DOWNLOAD_HTTP, TAMANHO_BLOCO_DOWNLOAD,
+    TIPOS_CONTEUDO_ANEXO_HTTP, ASSINATURA_PDF,
     EXCEL_SHEET_NAME, EXCEL_TABLE_NAME, STATUS_EM_ANALISE, STATUS_AUTOMATICO, 
-    SEPARADOR_LINHA, MENSAGENS_STATUS, MENSAGENS_ERRO, CARACTERES_INVALIDOS, 
-    FORMATO_NOME_ARQUIVO, CSS_SELECTORS, TAB_REQUERIMENTOS, TIPOS_DOCUMENTOS, FRASES
+    SEPARADOR_LINHA, MENSAGENS_STATUS, MENSAGENS_ERRO, CARACTERES_INVALIDOS, SUBSTITUTO_CARACTERE,
+    PADROES_DATA_ANEXO, DATA_ANEXO_DESCONHECIDA,
+    FORMATO_NOME_ARQUIVO, CSS_SELECTORS, TAB_REQUERIMENTOS, TIPOS_DOCUMENTOS, FRASES, ITEMS_PER_PAGE
 )
 from core.utils import (
     is_bundled, get_files_folder, get_profile_dir, req_para_fullpath, 
@@ -30,12 +42,38 @@ FILES_FOLDER = get_files_folder()
 PROFILE_DIR = get_profile_dir()
 
 
-def criar_json_dos_novos_requerimentos(rows):
-    """Cria arquivos JSON para novos requerimentos"""
-    for i, row in enumerate(rows, start=1):
+# ================================
+# CAPTURA DE TABELAS
+# ================================
+
+# Serializa as linhas num único evaluate, evitando um round-trip CDP por célula
+JS_CAPTURA_LINHAS = """(linhas, seletorCelulas) => linhas.map(tr => ({
+    id: tr.id || null,
+    rk: tr.getAttribute('data-rk'),
+    celulas: Array.from(tr.querySelectorAll(seletorCelulas)).map(c => c.innerText),
+    links: Array.from(tr.querySelectorAll('a[href]')).map(a => a.href)
+}))"""
+
+
+def capturar_linhas_tabela(page, seletor_linhas, seletor_celulas="td") -> List[Dict]:
+    """
+    Captura, numa única chamada ao navegador, as linhas que casam com `seletor_linhas`
+    
+    Returns:
+        list: Um dicionário por linha com 'id', 'rk' (data-rk do PrimeFaces),
+        'celulas' (texto de cada célula, sem espaços nas pontas) e 'links' (hrefs)
+    """
+    linhas = page.eval_on_selector_all(seletor_linhas, JS_CAPTURA_LINHAS, seletor_celulas)
+    for linha in linhas:
+        linha['celulas'] = [texto.strip() for texto in linha['celulas']]
+    return linhas
+
+
+def criar_json_dos_novos_requerimentos(linhas):
+    """Cria arquivos JSON para novos requerimentos a partir das linhas capturadas da caixa de entrada"""
+    for i, linha in enumerate(linhas, start=1):
         try:
-            cols = row.query_selector_all("td") 
-            dados = [col.inner_text().strip() for col in cols]
+            dados = linha['celulas']
             # if dados[TAB_REQUERIMENTOS['status']] in STATUS_EM_ANALISE:
             if type(dados) == list and len(dados) > 0:
                 # Cria um dicionário com os dados do requerimento usando TAB_REQUERIMENTOS
@@ -75,8 +113,43 @@ def criar_json_dos_novos_requerimentos(rows):
     log_info(f"Total de requerimentos processados e arquivos JSON salvos!")
 
 
-def wait_primefaces_ajax(page, timeout=15000):
-    """Espera todas as requisições AJAX do PrimeFaces terminarem"""
+# ================================
+# ESPERAS ORIENTADAS A EVENTOS
+# ================================
+
+# Métricas das esperas da sessão por rótulo: [quantidade, tempo total (s), maior tempo (s)]
+_metricas_espera: Dict[str, List[float]] = {}
+_lock_metricas_espera = threading.Lock()
+
+
+def registrar_metrica_espera(rotulo: str, inicio: float):
+    """Acumula a duração (desde `inicio`, em time.perf_counter) de uma espera do tipo `rotulo`"""
+    duracao = time.perf_counter() - inicio
+    with _lock_metricas_espera:
+        metrica = _metricas_espera.setdefault(rotulo, [0, 0.0, 0.0])
+        metrica[0] += 1
+        metrica[1] += duracao
+        metrica[2] = max(metrica[2], duracao)
+
+
+def exibir_metricas_espera():
+    """Exibe quantidade, tempo total, médio e máximo de cada tipo de espera da sessão"""
+    with _lock_metricas_espera:
+        metricas = sorted(_metricas_espera.items(), key=lambda item: item[1][1], reverse=True)
+    if not metricas:
+        return
+    log_info("⏱️ Tempos de espera da sessão:")
+    for rotulo, (quantidade, total, maximo) in metricas:
+        log_info(f"   {rotulo}: {quantidade}x, total {total:.1f}s, média {total / quantidade:.2f}s, máx {maximo:.2f}s")
+
+
+def _eh_resposta_parcial_primefaces(resposta) -> bool:
+    """Indica se a resposta é o partial-response de uma requisição AJAX do JSF/PrimeFaces"""
+    return resposta.request.headers.get("faces-request") == "partial/ajax"
+
+
+def _aguardar_fila_ajax(page, timeout):
+    """Espera a fila AJAX do PrimeFaces esvaziar (retorna imediatamente se já estiver vazia)"""
     try:
         page.wait_for_function(
             """() => {
@@ -87,9 +160,50 @@ def wait_primefaces_ajax(page, timeout=15000):
             }""",
             timeout=timeout
         )
-    except:
+    except Exception:
         pass
-    time.sleep(0.3)
+
+
+def wait_primefaces_ajax(page, timeout=TIMEOUT_PRIMEFACES_AJAX, rotulo="fila AJAX"):
+    """Espera todas as requisições AJAX do PrimeFaces terminarem"""
+    inicio = time.perf_counter()
+    _aguardar_fila_ajax(page, timeout)
+    registrar_metrica_espera(rotulo, inicio)
+
+
+def aguardar_elemento(page, seletor, rotulo, estado="visible", timeout=TIMEOUT_ELEMENTO):
+    """
+    Espera um elemento atingir `estado` (visible, attached, detached...) e o retorna.
+    Propaga PlaywrightTimeoutError se o prazo for excedido.
+    """
+    inicio = time.perf_counter()
+    try:
+        return page.wait_for_selector(seletor, state=estado, timeout=timeout)
+    finally:
+        registrar_metrica_espera(rotulo, inicio)
+
+
+def executar_e_aguardar_ajax(page, acao: Callable[[], object], rotulo, timeout=TIMEOUT_PRIMEFACES_AJAX):
+    """
+    Executa `acao` (ex.: clique em um botão PrimeFaces) e espera a resposta parcial que ela
+    dispara, o esvaziamento da fila AJAX e a saída do overlay .ui-blockui, retornando assim
+    que a página fica pronta.
+    
+    Returns:
+        bool: True se a resposta AJAX chegou dentro do prazo
+    """
+    inicio = time.perf_counter()
+    resposta_recebida = True
+    try:
+        with page.expect_response(_eh_resposta_parcial_primefaces, timeout=timeout):
+            acao()
+    except PlaywrightTimeoutError:
+        resposta_recebida = False
+        log_info(f"⚠️ Nenhuma resposta AJAX para '{rotulo}' em {timeout} ms")
+    _aguardar_fila_ajax(page, timeout)
+    page.wait_for_selector(CSS_SELECTORS['blockui'], state="detached", timeout=TIMEOUT_BLOCKUI)
+    registrar_metrica_espera(rotulo, inicio)
+    return resposta_recebida
 
 
 def primefaces_click(page, element, description="elemento"):
@@ -98,10 +212,9 @@ def primefaces_click(page, element, description="elemento"):
     Esses botões precisam submeter o formulário via AJAX.
     """
     
-    # Scroll até o elemento
+    # Scroll até o elemento (o Playwright só retorna após o scroll estabilizar)
     try:
         element.scroll_into_view_if_needed()
-        time.sleep(0.3)
     except:
         pass
     
@@ -124,7 +237,8 @@ def primefaces_click(page, element, description="elemento"):
         
         if onclick_executed:
             log_info("✅ Onclick executado diretamente")
-            time.sleep(1)
+            # O onclick enfileira a requisição AJAX de forma síncrona: basta aguardar a fila esvaziar
+            wait_primefaces_ajax(page, rotulo=description)
             return True
     except Exception as e:
         X = 1#log_erro(f"Onclick falhou: {str(e)[:50]}")
@@ -189,7 +303,7 @@ def primefaces_click(page, element, description="elemento"):
         
         if success:
             log_info("✅ Aguardando resposta do Mosaico...")
-            time.sleep(1)
+            wait_primefaces_ajax(page, rotulo=description)
             return True
         else:
             log_erro("Submit falhou")
@@ -201,7 +315,7 @@ def primefaces_click(page, element, description="elemento"):
         #log_info("🔄 Tentando force click...")
         element.click(force=True, timeout=15000)
         #log_info("✅ Force click funcionou")
-        time.sleep(1)
+        wait_primefaces_ajax(page, rotulo=description)
         return True
     except Exception as e:
         log_erro(f"Force click falhou: {str(e)[:50]}")
@@ -224,11 +338,8 @@ def preencher_minuta(page, rad_restrita: bool = True):
         # Clica no botão de características técnicas
         btn_carac = page.get_by_role("button", name=BOTOES['caracteristicas'])
         if btn_carac.count() > 0 and rad_restrita:
-            btn_carac.click(no_wait_after=True)            
-            # Aguarda carregamento
-            page.wait_for_selector(".ui-blockui", state="detached", timeout=15000)
-            wait_primefaces_ajax(page)
-            #time.sleep(1)            
+            # Clica e aguarda carregamento
+            executar_e_aguardar_ajax(page, lambda: btn_carac.click(no_wait_after=True), "características técnicas")
             # Busca e preenche o textarea
             try:
                 #observação sobre radiação restrita
@@ -239,13 +350,12 @@ def preencher_minuta(page, rad_restrita: bool = True):
                     elements = page.query_selector_all('[id^="formAnalise\\:j_idt"][title="Salvar"]')
                     el = elements[0]
                     btn_str = el.get_attribute("id")                                                                     
-                    page.evaluate(f"""
+                    executar_e_aguardar_ajax(page, lambda: page.evaluate(f"""
                         const btn = document.getElementById('{btn_str}');                        
                         btn.dispatchEvent(new MouseEvent('mousedown', {{ bubbles: true }}));
                         btn.dispatchEvent(new MouseEvent('mouseup', {{ bubbles: true }}));
                         btn.dispatchEvent(new MouseEvent('click', {{ bubbles: true }}));
-                    """)
-                    time.sleep(2)
+                    """), "salvar características")
                 else:
                     log_erro("❌ Botão salvar características não encontrado")
             except Exception as e:
@@ -256,27 +366,19 @@ def preencher_minuta(page, rad_restrita: bool = True):
         # ========================
         log_info("📋 Acessando Informações Adicionais...")
         
-        # Clica no botão de informações adicionais
-        time.sleep(3)
+        # Aguarda o botão de informações adicionais ficar visível, clica e aguarda carregamento
         btn_infos = page.get_by_role("button", name=BOTOES['infos_adicionais'])
-        
-        while btn_infos.count() == 0:
-            btn_infos = page.get_by_role("button", name=BOTOES['infos_adicionais'])
-
-        btn_infos.click(no_wait_after=True)
-        
-        # Aguarda carregamento
-        page.wait_for_selector(".ui-blockui", state="detached", timeout=15000)
-        wait_primefaces_ajax(page)
-        time.sleep(1)
+        inicio = time.perf_counter()
+        btn_infos.first.wait_for(state="visible", timeout=TIMEOUT_ELEMENTO)
+        registrar_metrica_espera("botão informações adicionais", inicio)
+        executar_e_aguardar_ajax(page, lambda: btn_infos.click(no_wait_after=True), "informações adicionais")
         
         log_info("✅ Página de Informações Adicionais carregada")
         
         # Ativa o checkbox
         try:            
-            checkbox_div = page.query_selector("#formAnalise\\:checkBoxAcompanharProcesso")
-            while not checkbox_div:
-                checkbox_div = page.query_selector("#formAnalise\\:checkBoxAcompanharProcesso")
+            checkbox_div = aguardar_elemento(page, "#formAnalise\\:checkBoxAcompanharProcesso", "checkbox acompanhar processo",
+                                             estado="attached")
             if checkbox_div:
                 # Clica na div do checkbox para ativá-lo
                 checkbox_box = checkbox_div.query_selector(".ui-chkbox-box")
@@ -285,7 +387,7 @@ def preencher_minuta(page, rad_restrita: bool = True):
                     if checkbox_box:
                         checkbox_box.click()
                         log_info("✅ Checkbox ativado")
-                        time.sleep(1)
+                        wait_primefaces_ajax(page, rotulo="checkbox acompanhar processo")
                     else:
                         log_erro("❌ Elemento checkbox-box não encontrado")
                     # Preenche o textarea das informações adicionais
@@ -297,10 +399,9 @@ def preencher_minuta(page, rad_restrita: bool = True):
                             # Clica no botão salvar informações adicionais
                             botao_salvar_infos = page.get_by_role("button", name="Salvar")
                             if botao_salvar_infos:
-                                botao_salvar_infos.click(force=True, timeout=18000)
+                                executar_e_aguardar_ajax(page, lambda: botao_salvar_infos.click(force=True, timeout=18000),
+                                                         "salvar informações adicionais")
                                 log_info("✅ Informações adicionais salvas")
-                                time.sleep(2)
-                                wait_primefaces_ajax(page)
                             else:
                                     log_erro("❌ Falha ao salvar informações adicionais")
                         else:
@@ -318,6 +419,34 @@ def preencher_minuta(page, rad_restrita: bool = True):
         log_erro(f"❌ Erro crítico no preenchimento de minuta: {str(e)[:80]}")
 
 
+class ControleSessaoMFA:
+    """
+    Controla o tempo decorrido desde o primeiro download para solicitar a reautenticação
+    MFA (TIMEOUT_SESSAO_MFA). É compartilhado entre as abas de download: como todas rodam na
+    mesma thread, a espera pela reautenticação pausa todas elas e apenas uma a solicita.
+    """
+    
+    def __init__(self):
+        self.tempo_primeiro_download = None
+    
+    def registrar_download(self):
+        """Inicia a contagem de tempo no primeiro download bem-sucedido"""
+        if self.tempo_primeiro_download is None:
+            self.tempo_primeiro_download = time.time()
+            log_info("⏱️ Primeiro download realizado - iniciando contagem de tempo")
+    
+    def verificar_reautenticacao(self):
+        """Solicita a reautenticação MFA se o tempo desde o primeiro download expirou"""
+        if self.tempo_primeiro_download is None:
+            return
+        tempo_decorrido = time.time() - self.tempo_primeiro_download
+        if tempo_decorrido > TIMEOUT_SESSAO_MFA:
+            log_info(f"⏰ Mais de 30 minutos desde o primeiro download ({int(tempo_decorrido // 60)} min)")
+            solicitar_reautenticacao_mfa()
+            # Zera o contador após re-autenticação
+            self.tempo_primeiro_download = time.time()
+
+
 def solicitar_reautenticacao_mfa():
     """
     Solicita ao usuário que faça re-autenticação MFA
@@ -334,20 +463,175 @@ def solicitar_reautenticacao_mfa():
     log_info("✅ Continuando processamento de downloads...")
 
 
-def baixar_pdfs(page, requerimento, tempo_primeiro_download):
+# ================================
+# NOMES E DOWNLOAD DIRETO DE ANEXOS
+# ================================
+
+# Coleta, numa única ida ao navegador, o href e a visibilidade de cada link de anexo.
+# Links com onclick ou href "#"/"javascript:" disparam postbacks JSF e não podem ser
+# baixados fora do navegador.
+JS_LINKS_ANEXOS = """els => els.map(a => {
+    const atributo = (a.getAttribute('href') || '').trim();
+    return {
+        href: a.href,
+        visivel: !!(a.offsetWidth || a.offsetHeight || a.getClientRects().length),
+        postback: !!a.getAttribute('onclick') || atributo === '' || atributo.startsWith('#')
+            || atributo.toLowerCase().startsWith('javascript:')
+    };
+})"""
+
+
+def formatar_data_anexo(data_hora: str) -> str:
+    """Converte a coluna "Data - Hora" da tabela de anexos para yyyy.mm.dd."""
+    data_parte = data_hora.split()[0] if data_hora else ""
+    for padrao, ano_primeiro in PADROES_DATA_ANEXO:
+        match = re.search(padrao, data_parte)
+        if match:
+            if ano_primeiro:
+                ano_data, mes, dia = match.groups()
+            else:
+                dia, mes, ano_data = match.groups()
+            return f"{ano_data}.{mes.zfill(2)}.{dia.zfill(2)}"
+    return DATA_ANEXO_DESCONHECIDA
+
+
+def montar_nome_anexo(linha_info, nome_botao, idx, requerimento, nome_original):
+    """Monta o nome local do anexo: [tipo][data - ID id] nome_original [req num de ano].ext
+
+    Sem informações da tabela, usa o nome simples [botão] nome_original.ext.
+    """
+    nome_base, extensao = os.path.splitext(nome_original)
+    if linha_info:
+        try:
+            num, ano = requerimento.split("/")
+            doc_id = linha_info.get("ID", f"#{idx + 1}")
+            tipo_doc = linha_info.get("Tipo de Documento", "Documento")
+            data_formatada = formatar_data_anexo(linha_info.get("Data - Hora", ""))
+
+            # Limpa caracteres inválidos para nome de arquivo
+            tipo_doc_limpo = re.sub(CARACTERES_INVALIDOS, SUBSTITUTO_CARACTERE, tipo_doc)
+            doc_id_limpo = re.sub(CARACTERES_INVALIDOS, SUBSTITUTO_CARACTERE, str(doc_id))
+
+            return f"[{tipo_doc_limpo}][{data_formatada} - ID {doc_id_limpo}] {nome_base} [req {num} de {ano}]{extensao}"
+        except Exception as e:
+            log_erro(f"Erro ao processar informações da tabela: {str(e)[:50]}")
+    return f"[{nome_botao}] {nome_base}{extensao}"
+
+
+def anexo_ja_baixado(pasta_destino, linha_info, nome_botao, idx, requerimento) -> bool:
+    """Indica se já existe na pasta um arquivo com o mesmo prefixo [tipo][data - ID id]."""
+    if not linha_info:
+        return False
+    nome_referencia = montar_nome_anexo(linha_info, nome_botao, idx, requerimento, "temp.pdf")
+    prefixo = nome_referencia.split('] temp [')[0] + ']'
+    return any(f.startswith(prefixo) for f in os.listdir(pasta_destino))
+
+
+def _baixar_anexo_http(url, cabecalhos, pasta_destino, linha_info, nome_botao, idx, requerimento):
+    """Baixa um anexo por GET com os cookies do navegador, gravando em disco à medida que chega.
+
+    Levanta exceção quando a resposta não é o anexo (status diferente de 200, tipo de
+    conteúdo fora de TIPOS_CONTEUDO_ANEXO_HTTP ou ".pdf" sem a assinatura de PDF, como a
+    página de login de uma sessão expirada), para que o chamador recorra ao download por clique.
+    """
+    with urllib.request.urlopen(urllib.request.Request(url, headers=cabecalhos), timeout=TIMEOUT_DOWNLOAD_HTTP) as resposta:
+        if resposta.status != 200:
+            raise ValueError(f"resposta HTTP {resposta.status} em vez do anexo")
+        tipo_conteudo = resposta.headers.get_content_type()
+        if tipo_conteudo not in TIPOS_CONTEUDO_ANEXO_HTTP:
+            raise ValueError(f"resposta {tipo_conteudo} em vez do anexo")
+
+        # Mesmo nome que o navegador sugeriria: Content-Disposition, senão o final da URL
+        nome_original = resposta.headers.get_filename() or unquote(os.path.basename(urlparse(url).path))
+        if not nome_original:
+            nome_original = f"anexo_{idx + 1}.pdf"
+        nome_arquivo_final = montar_nome_anexo(linha_info, nome_botao, idx, requerimento, nome_original)
+        caminho_completo = os.path.join(pasta_destino, nome_arquivo_final)
+
+        inicio = resposta.read(len(ASSINATURA_PDF))
+        if nome_original.lower().endswith(".pdf") and not inicio.startswith(ASSINATURA_PDF):
+            raise ValueError("conteúdo recebido não é um PDF")
+
+        # Grava num arquivo parcial e só o renomeia ao fim, para não deixar anexos truncados.
+        # O ponto inicial impede que anexo_ja_baixado confunda o parcial com um anexo pronto.
+        caminho_parcial = os.path.join(pasta_destino, f".{nome_arquivo_final}.part")
+        try:
+            with open(caminho_parcial, "wb") as arquivo:
+                arquivo.write(inicio)
+                shutil.copyfileobj(resposta, arquivo, TAMANHO_BLOCO_DOWNLOAD)
+        except Exception:
+            if os.path.exists(caminho_parcial):
+                os.remove(caminho_parcial)
+            raise
+    os.replace(caminho_parcial, caminho_completo)
+    return nome_arquivo_final
+
+
+def baixar_anexos_via_http(page, linhas_dados, pasta_destino, nome_botao, requerimento, sessao):
+    """Baixa em paralelo, fora do navegador, os anexos cujos links são URLs diretas.
+
+    Returns:
+        tuple: (índices resolvidos - baixados ou já existentes -, quantidade baixada)
+        Os demais índices devem seguir pelo download por clique.
+    """
+    links = page.eval_on_selector_all(CSS_SELECTORS['link_pdf'], JS_LINKS_ANEXOS)
+    resolvidos = set()
+    candidatos = {}
+    for idx, link in enumerate(links):
+        if not link["visivel"] or link["postback"] or not link["href"].lower().startswith("http"):
+            continue
+        linha_info = linhas_dados[idx] if idx < len(linhas_dados) else None
+        if anexo_ja_baixado(pasta_destino, linha_info, nome_botao, idx, requerimento):
+            resolvidos.add(idx)
+        else:
+            candidatos[idx] = (link["href"], linha_info)
+
+    if not candidatos:
+        return resolvidos, 0
+
+    # Os cookies do contexto carregam a sessão autenticada (inclusive MFA)
+    urls = [url for url, _ in candidatos.values()]
+    cookies = page.context.cookies(urls)
+    cabecalhos = {
+        "Cookie": "; ".join(f"{c['name']}={c['value']}" for c in cookies),
+        "User-Agent": page.evaluate("navigator.userAgent"),
+        "Referer": page.url,
+    }
+
+    baixados = 0
+    with ThreadPoolExecutor(max_workers=DOWNLOADS_HTTP_SIMULTANEOS) as executor:
+        futuros = {
+            executor.submit(_baixar_anexo_http, url, cabecalhos, pasta_destino, linha_info, nome_botao, idx, requerimento): idx
+            for idx, (url, linha_info) in candidatos.items()
+        }
+        # Aguarda os downloads devolvendo o controle ao Playwright, para que as outras abas avancem
+        while not all(futuro.done() for futuro in futuros):
+            page.wait_for_timeout(INTERVALO_ALTERNANCIA_ABAS)
+        for futuro, idx in futuros.items():
+            try:
+                nome_arquivo_final = futuro.result()
+            except Exception as e:
+                log_info(f"↩️ Anexo {idx + 1} de {nome_botao} será baixado por clique: {str(e)[:50]}")
+                continue
+            log_info(f"✅ Baixado: {nome_arquivo_final}")
+            resolvidos.add(idx)
+            baixados += 1
+            sessao.registrar_download()
+    return resolvidos, baixados
+
+
+def baixar_pdfs(page, requerimento, sessao):
     """
     Baixa todos os PDFs da página de anexos com retry inteligente
     
     Args:
         page: Objeto page do Playwright
         requerimento: Número do requerimento (formato XX/XXXXX)
-        tempo_primeiro_download: Tempo do primeiro download bem-sucedido (None se ainda não houve)
+        sessao: ControleSessaoMFA compartilhado entre as abas de download
     
     Returns:
-        tuple: (total_pdfs_baixados, tempo_primeiro_download_atualizado, downloads_sem_erro)
+        tuple: (total_pdfs_baixados, downloads_sem_erro)
     """
-    num, ano = requerimento.split("/")
-    
     # Cria a pasta do requerimento se não existir
     pasta_destino = criar_pasta_se_nao_existir(requerimento)
     
@@ -372,71 +656,55 @@ def baixar_pdfs(page, requerimento, tempo_primeiro_download):
                     log_erro(f"❌ Botão '{nome_botao}' não encontrado (tentativa {tentativa_botao}/{MAX_TENTATIVAS_BOTAO})")
                     
                     # Verifica se passou de 30 minutos desde o primeiro download
-                    if tempo_primeiro_download is not None:
-                        tempo_decorrido = time.time() - tempo_primeiro_download
-                        if tempo_decorrido > TIMEOUT_SESSAO_MFA:
-                            log_info(f"⏰ Mais de 30 minutos desde o primeiro download ({int(tempo_decorrido // 60)} min)")
-                            solicitar_reautenticacao_mfa()
-                            # Zera o contador após re-autenticação
-                            tempo_primeiro_download = time.time()
+                    sessao.verificar_reautenticacao()
                     
                     # Aguarda antes de tentar novamente
-                    time.sleep(2)
+                    page.wait_for_timeout(ESPERA_NOVA_TENTATIVA * 1000)
                     continue
                 
-                # Clica no botão para revelar PDFs
+                # Clica no botão para revelar PDFs e aguarda o carregamento
                 log_info(f"🎯 Buscando: {nome_botao}")
-                botao.first.click()
-                
-                # Aguarda o carregamento dos PDFs
-                time.sleep(1)
-                wait_primefaces_ajax(page)
+                executar_e_aguardar_ajax(page, botao.first.click, f"botão {nome_botao}")
                 
                 # Busca todos os links de PDF que foram revelados
-                pdf_links = page.query_selector_all("a[href*='.pdf'], a[href*='download']")
+                pdf_links = page.query_selector_all(CSS_SELECTORS['link_pdf'])
                 
-                # Extrai informações da tabela
-                tabela = page.query_selector("table.analiseTable")
+                # Extrai informações da primeira tabela de análise numa única captura
+                linhas = capturar_linhas_tabela(page, f"{CSS_SELECTORS['tabela_analise']} >> nth=0 >> tr", "th, td")
                 linhas_dados = []
                 
-                if tabela:
-                    # Pega todas as linhas da tabela (exceto cabeçalho)
-                    linhas = tabela.query_selector_all("tr")
+                # Identifica o cabeçalho (primeira linha)
+                if len(linhas) > 0:
+                    headers = linhas[0]['celulas']
+                    # Mantém o último registro válido para preencher linhas parciais da tabela.
+                    ultimo_dado = {}
                     
-                    # Identifica o cabeçalho (primeira linha)
-                    if len(linhas) > 0:
-                        cabecalho = linhas[0].query_selector_all("th, td")
-                        headers = [col.inner_text().strip() for col in cabecalho]
-                        # Mantém o último registro válido para preencher linhas parciais da tabela.
-                        ultimo_dado = {}
+                    # Processa as linhas de dados (exceto cabeçalho)
+                    for linha in linhas[1:]:
+                        dados = linha['celulas']
                         
-                        # Processa as linhas de dados (exceto cabeçalho)
-                        for linha in linhas[1:]:
-                            colunas = linha.query_selector_all("th, td")
-                            dados = [col.inner_text().strip() for col in colunas]
-                            
-                            if len(dados) >= len(headers):
-                                linha_info = {}
-                                for i, header in enumerate(headers):
-                                    if i < len(dados):
-                                        linha_info[header] = dados[i]
-                                linhas_dados.append(linha_info)
-                                ultimo_dado = linha_info.copy()
-                            else:
-                                linha_info = {}
-                                linha_info[headers[0]] = ultimo_dado.get(headers[0], "X")  # Usa o valor do último dado para a primeira coluna
-                                linha_info[headers[1]] = ultimo_dado.get(headers[1], "X")  # Usa o valor do último dado para a segunda coluna
-                                linha_info[headers[2]] = dados[0] if len(dados) > 0 else "X"  # Usa o valor da coluna atual se existir
-                                linha_info[headers[3]] = dados[1] if len(dados) > 1 else "X"  # Usa o valor da coluna atual se existir
-                                linha_info[headers[4]] = dados[2] if len(dados) > 2 else "X"  # Usa o valor da coluna atual se existir
-                                linha_info[headers[5]] = dados[3] if len(dados) > 3 else "X"  # Usa o valor da coluna atual se existir
-                                linha_info[headers[6]] = dados[4] if len(dados) > 4 else "X"  # Usa o valor da coluna atual se existir
-                                linha_info[headers[7]] = dados[5] if len(dados) > 5 else "X"  # Usa o valor da coluna atual se existir
-                                linha_info[headers[8]] = dados[6] if len(dados) > 6 else "X"  # Usa o valor da coluna atual se existir
-                                linha_info[headers[9]] = ultimo_dado.get(headers[9], "X")  # Usa o valor do último dado para a nona coluna
-                                linha_info[headers[10]] = dados[7] if len(dados) > 7 else "X"  # Usa o valor da coluna atual se existir
-                                linha_info[headers[11]] = dados[8] if len(dados) > 8 else "X"  # Usa o valor da coluna atual se existir                                
-                                linhas_dados.append(linha_info)
+                        if len(dados) >= len(headers):
+                            linha_info = {}
+                            for i, header in enumerate(headers):
+                                if i < len(dados):
+                                    linha_info[header] = dados[i]
+                            linhas_dados.append(linha_info)
+                            ultimo_dado = linha_info.copy()
+                        else:
+                            linha_info = {}
+                            linha_info[headers[0]] = ultimo_dado.get(headers[0], "X")  # Usa o valor do último dado para a primeira coluna
+                            linha_info[headers[1]] = ultimo_dado.get(headers[1], "X")  # Usa o valor do último dado para a segunda coluna
+                            linha_info[headers[2]] = dados[0] if len(dados) > 0 else "X"  # Usa o valor da coluna atual se existir
+                            linha_info[headers[3]] = dados[1] if len(dados) > 1 else "X"  # Usa o valor da coluna atual se existir
+                            linha_info[headers[4]] = dados[2] if len(dados) > 2 else "X"  # Usa o valor da coluna atual se existir
+                            linha_info[headers[5]] = dados[3] if len(dados) > 3 else "X"  # Usa o valor da coluna atual se existir
+                            linha_info[headers[6]] = dados[4] if len(dados) > 4 else "X"  # Usa o valor da coluna atual se existir
+                            linha_info[headers[7]] = dados[5] if len(dados) > 5 else "X"  # Usa o valor da coluna atual se existir
+                            linha_info[headers[8]] = dados[6] if len(dados) > 6 else "X"  # Usa o valor da coluna atual se existir
+                            linha_info[headers[9]] = ultimo_dado.get(headers[9], "X")  # Usa o valor do último dado para a nona coluna
+                            linha_info[headers[10]] = dados[7] if len(dados) > 7 else "X"  # Usa o valor da coluna atual se existir
+                            linha_info[headers[11]] = dados[8] if len(dados) > 8 else "X"  # Usa o valor da coluna atual se existir                                
+                            linhas_dados.append(linha_info)
                 
                 if pdf_links:
                     log_info(f"📄 {len(pdf_links)} PDF(s) encontrado(s) para {nome_botao}")
@@ -445,11 +713,19 @@ def baixar_pdfs(page, requerimento, tempo_primeiro_download):
                     if len(pdf_links) != len(linhas_dados):
                         log_info(f"⚠ AVISO: {len(pdf_links)} PDFs mas {len(linhas_dados)} linhas na tabela!")
                     
+                    # Caminho rápido: anexos com URL direta são baixados por HTTP, em paralelo
+                    anexos_resolvidos, baixados_http = baixar_anexos_via_http(
+                        page, linhas_dados, pasta_destino, nome_botao, requerimento, sessao
+                    )
+                    total_pdfs_baixados += baixados_http
+                    
                     # Conta quantos PDFs foram processados (baixados ou já existentes)
-                    pdfs_processados_neste_botao = 0
+                    pdfs_processados_neste_botao = len(anexos_resolvidos)
                     
-                    # Baixa cada PDF encontrado
+                    # Os demais (postbacks JSF ou falhas no HTTP) seguem pelo download por clique
                     for idx, link in enumerate(pdf_links):
+                        if idx in anexos_resolvidos:
+                            continue
                         tentativa_download = 0
                         download_bem_sucedido = False
                         
@@ -466,70 +742,7 @@ def baixar_pdfs(page, requerimento, tempo_primeiro_download):
                                 if idx < len(linhas_dados):
                                     linha_info = linhas_dados[idx]
                                 
-                                # Gera nome do arquivo baseado nas informações da tabela (ANTES do download)
-                                nome_arquivo_temp = f"anexo_{idx + 1}.pdf"  # Nome temporário padrão
-                                
-                                if linha_info:
-                                    try:
-                                        # Extrai informações da tabela
-                                        doc_id = linha_info.get("ID", f"#{idx + 1}")
-                                        tipo_doc = linha_info.get("Tipo de Documento", "Documento")
-                                        data_hora = linha_info.get("Data - Hora", "")
-                                        
-                                        # Processa a data para formato yyyy.mm.dd
-                                        data_formatada = ""
-                                        if data_hora:
-                                            try:
-                                                # Remove espaços extras e separa data da hora
-                                                data_parte = data_hora.split()[0] if data_hora else ""
-                                                
-                                                # Padrões de data comuns
-                                                padroes = [
-                                                    r"(\d{2})/(\d{2})/(\d{4})",  # dd/mm/yyyy
-                                                    r"(\d{4})-(\d{2})-(\d{2})",  # yyyy-mm-dd
-                                                    r"(\d{2})-(\d{2})-(\d{4})",  # dd-mm-yyyy
-                                                ]
-                                                
-                                                for padrao in padroes:
-                                                    match = re.search(padrao, data_parte)
-                                                    if match:
-                                                        if padrao == padroes[0] or padrao == padroes[2]:  # dd/mm/yyyy ou dd-mm-yyyy
-                                                            dia, mes, ano_data = match.groups()
-                                                        else:  # yyyy-mm-dd
-                                                            ano_data, mes, dia = match.groups()
-                                                        
-                                                        data_formatada = f"{ano_data}.{mes.zfill(2)}.{dia.zfill(2)}"
-                                                        break
-                                                
-                                                if not data_formatada:
-                                                    data_formatada = "0000.00.00"
-                                            except Exception as e:
-                                                data_formatada = "0000.00.00"
-                                                log_erro(f"Erro ao processar data: {str(e)[:50]}")
-                                        else:
-                                            data_formatada = "0000.00.00"
-                                        
-                                        # Limpa caracteres inválidos para nome de arquivo
-                                        tipo_doc_limpo = re.sub(CARACTERES_INVALIDOS, '_', tipo_doc)
-                                        doc_id_limpo = re.sub(CARACTERES_INVALIDOS, '_', str(doc_id))
-                                        
-                                        # Monta o novo nome: [tipo][data - ID id] nome_original [req num de ano].ext
-                                        nome_arquivo_temp = f"[{tipo_doc_limpo}][{data_formatada} - ID {doc_id_limpo}] temp [req {num} de {ano}].pdf"
-                                        
-                                    except Exception as e:
-                                        log_erro(f"Erro ao processar informações da tabela: {str(e)[:50]}")
-                                        # Fallback para nome simples
-                                        nome_arquivo_temp = f"[{nome_botao}] anexo_{idx + 1}.pdf"
-                                else:
-                                    # Fallback quando não há informação da tabela
-                                    nome_arquivo_temp = f"[{nome_botao}] anexo_{idx + 1}.pdf"
-                                
-                                # Procura por arquivos existentes que começem com o mesmo padrão
-                                nome_base_busca = nome_arquivo_temp.split('] temp [')[0] + ']'  # Remove "temp" e tudo depois
-                                arquivos_existentes = [f for f in os.listdir(pasta_destino) if f.startswith(nome_base_busca)]
-                                
-                                if arquivos_existentes:
-                                    #log_info(f"⏭️ Arquivo já existe, pulando: {arquivos_existentes[0]}")
+                                if anexo_ja_baixado(pasta_destino, linha_info, nome_botao, idx, requerimento):
                                     download_bem_sucedido = True  # Marca como sucesso para não tentar novamente
                                     pdfs_processados_neste_botao += 1  # Conta como processado
                                     break
@@ -545,43 +758,8 @@ def baixar_pdfs(page, requerimento, tempo_primeiro_download):
                                 if not nome_arquivo_real or nome_arquivo_real == "":
                                     nome_arquivo_real = f"anexo_{idx + 1}.pdf"
                                 
-                                # Extrai nome base e extensão do arquivo real
-                                nome_base_real, extensao_real = os.path.splitext(nome_arquivo_real)
-                                
                                 # Monta o nome final usando o nome real do arquivo
-                                if linha_info:
-                                    try:
-                                        doc_id = linha_info.get("ID", f"#{idx + 1}")
-                                        tipo_doc = linha_info.get("Tipo de Documento", "Documento")
-                                        data_hora = linha_info.get("Data - Hora", "")
-                                        
-                                        # Usa a mesma lógica de formatação de data
-                                        data_formatada = "0000.00.00"
-                                        if data_hora:
-                                            data_parte = data_hora.split()[0] if data_hora else ""
-                                            padroes = [
-                                                r"(\d{2})/(\d{2})/(\d{4})",
-                                                r"(\d{4})-(\d{2})-(\d{2})",
-                                                r"(\d{2})-(\d{2})-(\d{4})",
-                                            ]
-                                            for padrao in padroes:
-                                                match = re.search(padrao, data_parte)
-                                                if match:
-                                                    if padrao == padroes[0] or padrao == padroes[2]:
-                                                        dia, mes, ano_data = match.groups()
-                                                    else:
-                                                        ano_data, mes, dia = match.groups()
-                                                    data_formatada = f"{ano_data}.{mes.zfill(2)}.{dia.zfill(2)}"
-                                                    break
-                                        
-                                        tipo_doc_limpo = re.sub(CARACTERES_INVALIDOS, '_', tipo_doc)
-                                        doc_id_limpo = re.sub(CARACTERES_INVALIDOS, '_', str(doc_id))
-                                        
-                                        nome_arquivo_final = f"[{tipo_doc_limpo}][{data_formatada} - ID {doc_id_limpo}] {nome_base_real} [req {num} de {ano}]{extensao_real}"
-                                    except:
-                                        nome_arquivo_final = f"[{nome_botao}] {nome_base_real}{extensao_real}"
-                                else:
-                                    nome_arquivo_final = f"[{nome_botao}] {nome_base_real}{extensao_real}"
+                                nome_arquivo_final = montar_nome_anexo(linha_info, nome_botao, idx, requerimento, nome_arquivo_real)
                                 
                                 # Salva o arquivo com o nome final
                                 caminho_completo = os.path.join(pasta_destino, nome_arquivo_final)
@@ -593,25 +771,17 @@ def baixar_pdfs(page, requerimento, tempo_primeiro_download):
                                 download_bem_sucedido = True
                                 
                                 # Marca o tempo do primeiro download
-                                if tempo_primeiro_download is None:
-                                    tempo_primeiro_download = time.time()
-                                    log_info("⏱️ Primeiro download realizado - iniciando contagem de tempo")
+                                sessao.registrar_download()
                                 
                             except Exception as e:
                                 log_erro(f"❌ Erro ao baixar PDF {idx + 1} de {nome_botao} (tent {tentativa_download}/{MAX_TENTATIVAS_DOWNLOAD}): {str(e)[:50]}")
                                 
                                 # Verifica se passou de 30 minutos desde o primeiro download
-                                if tempo_primeiro_download is not None:
-                                    tempo_decorrido = time.time() - tempo_primeiro_download
-                                    if tempo_decorrido > TIMEOUT_SESSAO_MFA:
-                                        log_info(f"⏰ Mais de 30 minutos desde o primeiro download ({int(tempo_decorrido // 60)} min)")
-                                        solicitar_reautenticacao_mfa()
-                                        # Zera o contador após re-autenticação
-                                        tempo_primeiro_download = time.time()
+                                sessao.verificar_reautenticacao()
                                 
                                 if tentativa_download < MAX_TENTATIVAS_DOWNLOAD:
-                                    log_info(f"🔄 Tentando novamente em 2 segundos...")
-                                    time.sleep(2)
+                                    log_info(f"🔄 Tentando novamente em {ESPERA_NOVA_TENTATIVA} segundos...")
+                                    page.wait_for_timeout(ESPERA_NOVA_TENTATIVA * 1000)
                     
                     # Verifica se todos os PDFs esperados foram processados (baixados ou já existentes)
                     if len(pdf_links) > 0 and pdfs_processados_neste_botao == len(pdf_links):
@@ -632,17 +802,11 @@ def baixar_pdfs(page, requerimento, tempo_primeiro_download):
                 log_erro(f"❌ Erro ao processar botão {nome_botao} (tentativa {tentativa_botao}/{MAX_TENTATIVAS_BOTAO}): {str(e)[:50]}")
                 
                 # Verifica se passou de 30 minutos desde o primeiro download
-                if tempo_primeiro_download is not None:
-                    tempo_decorrido = time.time() - tempo_primeiro_download
-                    if tempo_decorrido > TIMEOUT_SESSAO_MFA:
-                        log_info(f"⏰ Mais de 30 minutos desde o primeiro download ({int(tempo_decorrido // 60)} min)")
-                        solicitar_reautenticacao_mfa()
-                        # Zera o contador após re-autenticação
-                        tempo_primeiro_download = time.time()
+                sessao.verificar_reautenticacao()
                 
                 if tentativa_botao < MAX_TENTATIVAS_BOTAO:
-                    log_info(f"🔄 Tentando botão novamente em 2 segundos...")
-                    time.sleep(2)
+                    log_info(f"🔄 Tentando botão novamente em {ESPERA_NOVA_TENTATIVA} segundos...")
+                    page.wait_for_timeout(ESPERA_NOVA_TENTATIVA * 1000)
 
         if not sucesso_botao:
             houve_erro_processamento = True
@@ -653,7 +817,7 @@ def baixar_pdfs(page, requerimento, tempo_primeiro_download):
         log_info(f"💾 Total de {total_pdfs_baixados} PDF(s) salvos em: {pasta_destino}")
     
     downloads_sem_erro = not houve_erro_processamento
-    return total_pdfs_baixados, tempo_primeiro_download, downloads_sem_erro
+    return total_pdfs_baixados, downloads_sem_erro
 
 
 def abrir_caixa_de_entrada(page_obj, retorno_para_estudo=False):
@@ -672,17 +836,478 @@ def abrir_caixa_de_entrada(page_obj, retorno_para_estudo=False):
 
     page_obj.wait_for_load_state("load")
     
-    # Seleciona 100 itens por página e aguarda atualização
-    page_obj.select_option("select.ui-paginator-rpp-options", value="100")
-    time.sleep(2) 
-    page_obj.wait_for_load_state("networkidle")  # Aguarda requisições AJAX terminarem
-    wait_primefaces_ajax(page_obj)    
+    # Seleciona 100 itens por página e aguarda a atualização AJAX da tabela
+    executar_e_aguardar_ajax(
+        page_obj, lambda: page_obj.select_option(CSS_SELECTORS['paginator_options'], value=ITEMS_PER_PAGE),
+        "itens por página"
+    )
 
     return page_obj
 
 
-def baixar_documentos(RETORNO_PARA_ESTUDO):
-    """Função principal que baixa documentos dos requerimentos ORCN"""
+class CaixaDeEntrada:
+    """
+    Modelo em cache da caixa de entrada, indexado pelo número do requerimento
+    
+    As linhas são capturadas uma única vez por sessão e depois relocalizadas pelo data-rk
+    (chave estável das linhas do PrimeFaces), sem varrer a tabela a cada requerimento.
+    A captura só é refeita quando o total informado pelo paginador muda ou quando uma
+    busca falha.
+    """
+    
+    # Texto da célula do número do requerimento, para confirmar a linha relocalizada
+    JS_NUMERO_REQUERIMENTO = "tr => { const c = tr.querySelectorAll('td'); return c.length >= 2 ? c[1].innerText.trim() : null; }"
+    JS_PAGINADOR = "els => els.length ? els[0].innerText.trim() : null"
+    
+    def __init__(self, retorno_para_estudo):
+        if retorno_para_estudo==False:
+            self.seletor_linhas = CSS_SELECTORS['tabela_dados_em_analise']
+        else:
+            self.seletor_linhas = CSS_SELECTORS['tabela_dados']
+        self.linhas = {}
+        self.total_paginador = None
+    
+    def _ler_total_paginador(self, page):
+        return page.eval_on_selector_all(CSS_SELECTORS['paginator_atual'], self.JS_PAGINADOR)
+    
+    def atualizar(self, page):
+        """Captura todas as linhas da caixa de entrada aberta em `page` e retorna a captura"""
+        linhas_tabela = capturar_linhas_tabela(page, self.seletor_linhas)
+        self.linhas = {}
+        for posicao, linha in enumerate(linhas_tabela):
+            if len(linha['celulas']) >= 2:
+                self.linhas[linha['celulas'][1]] = {'rk': linha['rk'], 'posicao': posicao}
+        self.total_paginador = self._ler_total_paginador(page)
+        return linhas_tabela
+    
+    def _relocalizar(self, page, requerimento):
+        """Obtém o ElementHandle da linha em cache, conferindo o número do requerimento"""
+        entrada = self.linhas.get(requerimento)
+        if not entrada:
+            return None
+        if entrada['rk']:
+            linha = page.query_selector(f"{self.seletor_linhas}[data-rk={json.dumps(entrada['rk'])}]")
+        else:
+            linha = page.query_selector(f"{self.seletor_linhas} >> nth={entrada['posicao']}")
+        if linha and linha.evaluate(self.JS_NUMERO_REQUERIMENTO) == requerimento:
+            return linha
+        return None
+    
+    def localizar(self, page, requerimento):
+        """
+        Retorna a linha do requerimento na caixa de entrada aberta em `page`
+        
+        Returns:
+            ElementHandle da linha ou None se o requerimento não estiver na lista
+        """
+        try:
+            # A lista mudou de tamanho (requerimentos entraram ou saíram): recaptura
+            if self._ler_total_paginador(page) != self.total_paginador:
+                self.atualizar(page)
+            
+            linha = self._relocalizar(page, requerimento)
+            if not linha:
+                # Busca falhou: a captura pode estar desatualizada, recaptura uma vez
+                self.atualizar(page)
+                linha = self._relocalizar(page, requerimento)
+            
+            if not linha:
+                log_info(f"⚠️ Requerimento {requerimento} não encontrado na lista atualizada, pulando...")
+            return linha
+        except Exception as e:
+            log_erro(f"Erro ao recarregar linhas: {str(e)[:50]}, pulando...")
+            return None
+
+
+def processar_requerimento(page, requerimento, indice, caixa, sessao):
+    """
+    Executa o fluxo completo de um requerimento a partir da caixa de entrada aberta em `page`:
+    abre o detalhe, coleta os dados adicionais, preenche a minuta e baixa os anexos,
+    registrando o resultado no log de downloads
+    
+    Args:
+        page: Página (aba) do Playwright com a caixa de entrada aberta
+        requerimento: Número do requerimento (formato XX/XXXXX)
+        indice: Posição do requerimento na lista (apenas para exibição)
+        caixa: CaixaDeEntrada (cache das linhas) da lista aberta em `page`
+        sessao: ControleSessaoMFA compartilhado entre as abas
+    
+    Returns:
+        bool: True se o requerimento foi concluído sem falhas
+    """
+    concluido = False
+
+    log_info(SEPARADOR_LINHA)
+    log_info(f"▶️  Requerimento {indice}: {requerimento}")
+    log_info(SEPARADOR_LINHA)
+
+    # Marca o requerimento como em progresso no log
+    marcar_requerimento_em_progresso(requerimento)
+
+    # IMPORTANTE: Relocaliza a linha atual a partir do cache da caixa de entrada
+    row_atual = caixa.localizar(page, requerimento)
+    if not row_atual:
+        return False
+
+    # Busca botão "Visualizar em Tela cheia" na linha atual 
+    btn = row_atual.query_selector("button[type='submit'][title='Visualizar em Tela cheia']")
+    if not btn:
+        btn = row_atual.query_selector("button[title*='Tela cheia']")
+
+    if not btn:
+        log_info("⚠️ Botão não encontrado, pulando...")
+        return False
+
+    # Clica no botão
+    if not primefaces_click(page, btn, "Visualizar em Tela cheia"):
+        log_info("⚠️ Não foi possível clicar, pulando...")
+        return False
+
+    # Aguarda o iframe de detalhe, inserido pela resposta AJAX do clique
+    iframe_element = aguardar_elemento(page, CSS_SELECTORS['iframe_detalhe'], "iframe de detalhe",
+                                       estado="attached", timeout=TIMEOUT_LOAD_STATE)
+
+    if iframe_element:
+        detalhes_requerimento = iframe_element.get_attribute("src")
+        if detalhes_requerimento:
+            page.goto(detalhes_requerimento)
+
+            # Recupera dados do solicitante, fabricante, laboratório e OCD
+            log_info("📊 Coletando dados adicionais do requerimento...")
+            solicitante_id = "formAnalise:output-solicitante-requerimento:output-solicitante-requerimento"
+            selector = "#" + solicitante_id.replace(":", "\\:")
+            try:
+                dados_solicitante = page.eval_on_selector(selector, """
+                    (t) => {
+                        const linhas = Array.from(t.querySelectorAll("tr"));
+                        const resultado = {};
+                        for (const tr of linhas) {
+                            const celulas = tr.querySelectorAll("td");
+                            if (celulas.length === 2) {
+                                const chave = celulas[0].innerText.trim().replace(/:$/, '');
+                                const valor = celulas[1].innerText.trim();
+                                resultado[chave] = valor;
+                            }
+                        }
+                        return resultado;
+                    }
+                    """)
+                log_info(f"✅ Dados do solicitante coletados: {len(dados_solicitante)} campo(s)")
+            except Exception as e:
+                log_erro(f"❌ Erro ao coletar dados do solicitante: {str(e)[:50]}")
+                dados_solicitante = {}
+
+            # Validação crítica dos dados do solicitante
+            from core.utils import validar_dados_criticos
+            validar_dados_criticos(
+                dados_solicitante=dados_solicitante,
+                nome_requerimento=requerimento,
+                contexto="coleta de dados do solicitante"
+            )
+
+            fabricante_id = "formAnalise:output-fabricante-requerimento:output-fabricante-requerimento"
+            selector = "#" + fabricante_id.replace(":", "\\:")
+            try:
+                dados_fabricante = page.eval_on_selector(selector, """
+                    (t) => {
+                        const linhas = Array.from(t.querySelectorAll("tr"));
+                        const resultado = {};
+                        for (const tr of linhas) {
+                            const celulas = tr.querySelectorAll("td");
+                            if (celulas.length === 2) {
+                                const chave = celulas[0].innerText.trim().replace(/:$/, '');
+                                const valor = celulas[1].innerText.trim();
+                                resultado[chave] = valor;
+                            }
+                        }
+                        return resultado;
+                    }
+                    """)
+                log_info(f"✅ Dados do fabricante coletados: {len(dados_fabricante)} campo(s)")
+            except Exception as e:
+                log_erro(f"❌ Erro ao coletar dados do fabricante: {str(e)[:50]}")
+                dados_fabricante = {}
+
+            # Validação crítica dos dados do fabricante
+            from core.utils import validar_dados_criticos
+            validar_dados_criticos(
+                dados_fabricante=dados_fabricante,
+                nome_requerimento=requerimento,
+                contexto="coleta de dados do fabricante"
+            )
+
+            lab_id = "formAnalise:output-laboratorio-requerimento:output-laboratorio-requerimento"
+            selector = "#" + lab_id.replace(":", "\\:")
+            try:
+                dados_lab = page.eval_on_selector(selector, """
+                    (t) => {
+                        const linhas = Array.from(t.querySelectorAll("tr"));
+                        const resultado = {};
+                        for (const tr of linhas) {
+                            const celulas = tr.querySelectorAll("td");
+                            if (celulas.length === 2) {
+                                const chave = celulas[0].innerText.trim().replace(/:$/, '');
+                                const valor = celulas[1].innerText.trim();
+                                resultado[chave] = valor;
+                            }
+                        }
+                        return resultado;
+                    }
+                    """)
+                log_info(f"✅ Dados do laboratório coletados: {len(dados_lab)} campo(s)")
+            except Exception as e:
+                log_erro(f"❌ Erro ao coletar dados do laboratório: {str(e)[:50]}")
+                dados_lab = {}	
+
+            # Validação crítica dos dados do laboratório
+            from core.utils import validar_dados_criticos
+            validar_dados_criticos(
+                dados_lab=dados_lab,
+                nome_requerimento=requerimento,
+                contexto="coleta de dados do laboratório"
+            )
+
+            labelOCD = page.locator("text=Dados do Certificado")
+            table = labelOCD.locator("xpath=following::table[1]")
+
+            dados_ocd = table.evaluate("""
+            (t) => {
+                const r = {};
+                for (const tr of t.querySelectorAll("tr")) {
+                    const td = tr.querySelectorAll("td");
+                    if (td.length === 2) r[td[0].innerText.trim().replace(/:$/, '')] = td[1].innerText.trim();
+                }
+                return r;
+            }
+            """)
+
+            if len(dados_ocd) > 0:  
+                log_info(f"✅ Dados do OCD coletados: {len(dados_ocd)} campo(s)")
+            else:
+                log_erro(f"❌ Erro ao coletar dados do OCD")
+
+            # Validação crítica dos dados do OCD
+            from core.utils import validar_dados_criticos
+            validar_dados_criticos(
+                dados_ocd=dados_ocd,
+                nome_requerimento=requerimento,
+                contexto="coleta de dados do OCD"
+            )
+
+            # Salva os dados coletados no JSON do requerimento
+            json_path = req_para_fullpath(requerimento)                
+            nome_json = Path(json_path).name
+
+            # Remove underscore inicial para manter consistência com criação inicial
+            nome_arquivo_json = nome_json[1:] if nome_json.startswith('_') else nome_json
+            caminho_json = os.path.join(json_path, f"{nome_arquivo_json}.json")
+
+            # Verifica se o JSON existe, se não, cria um básico
+            if not os.path.exists(caminho_json):
+                log_info(f"📝 JSON não encontrado, criando arquivo básico: {nome_arquivo_json}.json")
+                # Cria estrutura básica do JSON
+                dados_json = {
+                    "requerimento": {
+                        "num_req": requerimento,
+                        "status": "Em Análise"
+                    }
+                }
+                try:
+                    with open(caminho_json, "w", encoding="utf-8") as f:
+                        json.dump(dados_json, f, ensure_ascii=False, indent=4)
+                except Exception as e:
+                    log_erro(f"❌ Erro ao criar JSON básico: {str(e)[:50]}")
+                    return False
+
+            # Carrega o JSON existente ou recém-criado
+            try:
+                with open(caminho_json, "r", encoding="utf-8") as f:
+                    dados_json = json.load(f)
+            except Exception as e:
+                log_erro(f"❌ Erro ao ler JSON: {str(e)[:50]}")
+                return False
+
+            # Atualiza os dados coletados
+            dados_atualizados = False
+            if dados_ocd != {}:
+                dados_json["ocd"] = dados_ocd
+                dados_atualizados = True
+            if dados_lab != '':
+                dados_json["lab"] = dados_lab
+                dados_atualizados = True
+            if dados_fabricante != '':
+                dados_json["fabricante"] = dados_fabricante
+                dados_atualizados = True
+            if dados_solicitante != '':
+                dados_json["solicitante"] = dados_solicitante
+                dados_atualizados = True
+
+            # Salva apenas se houve atualizações
+            if dados_atualizados: #teogenes
+                try:
+                    with open(caminho_json, "w", encoding="utf-8") as f:
+                        json.dump(dados_json, f, ensure_ascii=False, indent=4)
+                    log_info(f"✅ Dados adicionais salvos no JSON: {nome_arquivo_json}.json")
+                except Exception as e:
+                    log_erro(f"❌ Erro ao salvar JSON: {str(e)[:50]}")
+            else:
+                log_info("ℹ️ Nenhum dado adicional coletado para salvar")
+
+            eh_rad_restrita = testar_radiacao_restrita(dados_json["requerimento"].get("tipo_equipamento", ""))
+            preencher_minuta(page,rad_restrita=eh_rad_restrita)
+
+            # Navega para anexos
+            anexos_btn = page.get_by_role("button", name=BOTOES['anexos'])
+
+            try:
+                if anexos_btn:                        
+                    # Clica e aguarda a resposta AJAX da "tela" de anexos
+                    executar_e_aguardar_ajax(page, lambda: anexos_btn.click(no_wait_after=True), "anexos")
+                    log_info("🔄 Buscando anexos...")
+                else:
+                    log_info("⚠️ Botão 'Anexos' não encontrado.")
+                    wait_primefaces_ajax(page)
+                log_info("✅ Página de Anexos carregada")
+
+                # BAIXA OS PDFs com retry inteligente
+                pdfs_baixados, downloads_sem_erro = baixar_pdfs(page, requerimento, sessao)
+
+                # Marca o requerimento como concluído no log
+                if downloads_sem_erro:
+                    marcar_requerimento_concluido(requerimento, pdfs_baixados)
+                    concluido = True
+                    if pdfs_baixados > 0:
+                        log_info(f"✅ Requerimento {requerimento} marcado como concluído ({pdfs_baixados} arquivos)")
+                    else:
+                        log_info(f"✅ Requerimento {requerimento} marcado como concluído (0 novos arquivos; anexos já existiam)")
+                else:
+                    marcar_requerimento_com_erro(requerimento, "Falhas durante o processamento dos anexos")
+                    log_info(f"⚠️ Requerimento {requerimento} marcado com erro por falhas no processamento dos anexos")
+
+            except Exception as e:
+                erro_msg = f"Erro ao acessar anexos: {str(e)}"
+                log_erro(erro_msg)
+                marcar_requerimento_com_erro(requerimento, erro_msg)
+    else:
+        erro_msg = "iframe_element não encontrado"
+        log_info(f"⚠️ {erro_msg}, pulando...")
+        marcar_requerimento_com_erro(requerimento, erro_msg)
+        return False
+
+    return concluido
+
+
+def processar_requerimento_isolado(page, linha_info, caixa, sessao, numero_aba=None):
+    """
+    Executa processar_requerimento para uma linha da fila, marcando o requerimento com erro
+    se o fluxo levantar exceção, para que a falha de um requerimento não interrompa os demais
+    
+    Args:
+        page: Página (aba) do Playwright com a caixa de entrada aberta
+        linha_info: Requerimento da fila ({'indice', 'requerimento', ...})
+        caixa: CaixaDeEntrada (cache das linhas) da lista aberta em `page`
+        sessao: ControleSessaoMFA compartilhado entre as abas
+        numero_aba: Número da aba, para identificá-la na mensagem de erro (None com uma aba)
+    
+    Returns:
+        bool: True se o requerimento foi concluído sem falhas
+    """
+    requerimento = linha_info['requerimento']
+    try:
+        return processar_requerimento(page, requerimento, linha_info['indice'], caixa, sessao)
+    except Exception as e:
+        erro_msg = f"Erro na aba {numero_aba}: {str(e)}" if numero_aba else f"Erro no processamento: {str(e)}"
+        log_erro(f"Requerimento {requerimento}: {erro_msg}")
+        marcar_requerimento_com_erro(requerimento, erro_msg)
+        return False
+
+
+def baixar_em_abas(contexto, page, linhas_dados, abas, retorno_para_estudo, sessao):
+    """
+    Distribui os requerimentos entre `abas` abas do navegador já autenticado, que consomem
+    uma fila comum.
+    
+    Todas as abas são conduzidas pela mesma instância do Playwright que lançou o navegador,
+    na thread atual: o fluxo de cada aba roda no handler do evento "page" do contexto, que
+    o Playwright síncrono executa em uma fibra (greenlet) própria, alternando entre as abas
+    sempre que uma delas aguarda o navegador. Assim há um único cliente do navegador e os
+    downloads por clique de todas as abas seguem a configuração feita no lançamento.
+    
+    Um erro em um requerimento marca apenas esse requerimento com erro; a aba reabre a
+    caixa de entrada e segue com a fila. A aba só é encerrada se não conseguir reabri-la.
+    
+    Args:
+        contexto: Contexto persistente (sessão MFA) em que as abas são abertas
+        page: Página principal, usada para aguardar o término das abas
+        linhas_dados: Requerimentos pendentes ({'indice', 'requerimento', ...})
+        abas: Número de abas simultâneas
+        retorno_para_estudo: True para a lista "Retorno para Estudo"
+        sessao: ControleSessaoMFA compartilhado entre as abas
+    
+    Returns:
+        tuple: (requerimentos concluídos sem falhas, {número da aba: erro} das abas encerradas por erro)
+    """
+    fila_requerimentos = deque(linhas_dados)
+    requerimentos_processados = []
+    abas_com_falha = {}
+    abas_a_iniciar = deque(range(1, abas + 1))
+    abas_ativas = set()
+    
+    def executar_aba(aba, numero_aba):
+        abas_ativas.add(numero_aba)
+        try:
+            abrir_caixa_de_entrada(aba, retorno_para_estudo=retorno_para_estudo)
+            caixa = CaixaDeEntrada(retorno_para_estudo)
+            caixa.atualizar(aba)
+            
+            while fila_requerimentos:
+                linha_info = fila_requerimentos.popleft()
+                if processar_requerimento_isolado(aba, linha_info, caixa, sessao, numero_aba):
+                    requerimentos_processados.append(linha_info['requerimento'])
+                
+                # Volta para a lista
+                abrir_caixa_de_entrada(aba, retorno_para_estudo=retorno_para_estudo)
+        except Exception as e:
+            log_erro(f"Aba de download {numero_aba} encerrada por erro: {str(e)}")
+            abas_com_falha[numero_aba] = str(e)
+        finally:
+            abas_ativas.discard(numero_aba)
+            try:
+                aba.close()
+            except Exception:
+                pass  # Aba já fechada ou navegador encerrado
+    
+    def ao_abrir_pagina(aba):
+        # Páginas abertas pelo próprio fluxo (popups) não iniciam uma nova aba de download
+        if abas_a_iniciar:
+            executar_aba(aba, abas_a_iniciar.popleft())
+    
+    log_info(f"🗂️ Processando {len(linhas_dados)} requerimento(s) em {abas} abas")
+    contexto.on("page", ao_abrir_pagina)
+    try:
+        for _ in range(abas):
+            contexto.new_page()
+        
+        # A página principal apenas aguarda; cada espera devolve o controle às abas
+        while abas_ativas or abas_a_iniciar:
+            page.wait_for_timeout(INTERVALO_ALTERNANCIA_ABAS)
+    finally:
+        contexto.remove_listener("page", ao_abrir_pagina)
+    
+    if fila_requerimentos:
+        log_erro(f"{len(fila_requerimentos)} requerimento(s) não processado(s): todas as abas foram encerradas")
+    
+    return requerimentos_processados, abas_com_falha
+
+
+def baixar_documentos(RETORNO_PARA_ESTUDO, abas=ABAS_DOWNLOAD_PADRAO):
+    """
+    Função principal que baixa documentos dos requerimentos ORCN
+    
+    Args:
+        RETORNO_PARA_ESTUDO: True para a lista "Retorno para Estudo"
+        abas: Número de abas simultâneas (limitado a ABAS_DOWNLOAD_MAX para não sobrecarregar o servidor)
+    """
     try:
         log_info(MENSAGENS_STATUS['iniciando_automacao'])
         
@@ -695,6 +1320,8 @@ def baixar_documentos(RETORNO_PARA_ESTUDO):
             if concluidos > 0:
                 log_info(f"✅ {concluidos} requerimento(s) já baixado(s) com sucesso")
         
+        abas = max(1, min(abas, ABAS_DOWNLOAD_MAX))
+        
         with sync_playwright() as p:
             browser = p.chromium.launch_persistent_context(
                 PROFILE_DIR,
@@ -707,7 +1334,7 @@ def baixar_documentos(RETORNO_PARA_ESTUDO):
             page = browser.new_page()
             
             # Controle de tempo - inicia apenas após o primeiro download
-            tempo_primeiro_download = None
+            sessao = ControleSessaoMFA()
             
             # Navega para a lista
             page = abrir_caixa_de_entrada(page,retorno_para_estudo=RETORNO_PARA_ESTUDO)
@@ -716,35 +1343,31 @@ def baixar_documentos(RETORNO_PARA_ESTUDO):
             log_info("🤖 AUTOMAÇÃO ORCN - DOWNLOAD DE ANEXOS")
             log_info(SEPARADOR_LINHA)
             
-            # Seleciona todas as linhas
-            if RETORNO_PARA_ESTUDO==False:
-                rows = page.query_selector_all(CSS_SELECTORS['tabela_dados_em_analise'])                
-            else:
-                rows = page.query_selector_all(CSS_SELECTORS['tabela_dados'])
-            log_info(f"🔎 {len(rows)} linhas encontradas na tabela")
+            # Captura todas as linhas de uma só vez, guardando-as no cache da caixa de entrada
+            caixa = CaixaDeEntrada(RETORNO_PARA_ESTUDO)
+            linhas_tabela = caixa.atualizar(page)
+            log_info(f"🔎 {len(linhas_tabela)} linhas encontradas na tabela")
             
-            criar_json_dos_novos_requerimentos(rows)
+            criar_json_dos_novos_requerimentos(linhas_tabela)
 
             # Cria um dicionário com os dados de cada linha ANTES de iterar
             log_info("📋 Mapeando requerimentos...")
             linhas_dados = []
             todos_requerimentos = []
             
-            for i, row in enumerate(reversed(rows), start=1):
+            for i, linha in enumerate(reversed(linhas_tabela), start=1):
                 try:
-                    cols = row.query_selector_all("td")
-                    dados = [col.inner_text().strip() for col in cols]
-                    if (len(cols) < 2):# or (dados[TAB_REQUERIMENTOS['status']] not in STATUS_EM_ANALISE):
+                    dados = linha['celulas']
+                    if (len(dados) < 2):# or (dados[TAB_REQUERIMENTOS['status']] not in STATUS_EM_ANALISE):
                         continue
                     
-                    requerimento = cols[1].inner_text().strip()
+                    requerimento = dados[1]
                     todos_requerimentos.append(requerimento)
                     
                     # Armazena os dados da linha
                     linhas_dados.append({
                         'indice': i,
-                        'requerimento': requerimento,
-                        'row': row
+                        'requerimento': requerimento
                     })
                 except Exception as e:
                     log_erro(f"Erro ao ler linha {i}: {str(e)[:50]}")
@@ -767,314 +1390,31 @@ def baixar_documentos(RETORNO_PARA_ESTUDO):
             linhas_dados = [linha for linha in linhas_dados if linha['requerimento'] in requerimentos_pendentes]
             log_info(f"⏳ {len(linhas_dados)} requerimento(s) serão processados")
 
-            # Processa cada linha dos dados salvos
-            requerimentos_processados = []
-            
-            for linha_info in linhas_dados:
-                i = linha_info['indice']
-                requerimento = linha_info['requerimento']
-                
-                log_info(SEPARADOR_LINHA)
-                log_info(f"▶️  Requerimento {i}: {requerimento}")
-                log_info(SEPARADOR_LINHA)
-                
-                # Marca o requerimento como em progresso no log
-                marcar_requerimento_em_progresso(requerimento)
-                
-                # IMPORTANTE: Recarrega a linha atual usando busca manual
-                row_atual = None
-                try:
-                    # Recarrega todas as linhas da tabela
-                    if RETORNO_PARA_ESTUDO==False:
-                        linhas_atualizadas = page.query_selector_all(CSS_SELECTORS['tabela_dados_em_analise'])
-                    else:
-                        linhas_atualizadas = page.query_selector_all(CSS_SELECTORS['tabela_dados'])
-                                    
-                    
-                    # Procura manualmente pela linha com o requerimento
-                    for idx, linha in enumerate(linhas_atualizadas):
-                        try:
-                            cols = linha.query_selector_all("td")
-                            if len(cols) >= 2:
-                                requerimento_da_linha = cols[1].inner_text().strip()
-                                if requerimento_da_linha == requerimento:
-                                    row_atual = linha
-                                    break
-                        except:
-                            continue
-                    
-                    if not row_atual:
-                        log_info(f"⚠️ Requerimento {requerimento} não encontrado na lista atualizada, pulando...")
-                        continue
-                        
-                except Exception as e:
-                    log_erro(f"Erro ao recarregar linhas: {str(e)[:50]}, pulando...")
-                    continue
-                
-                # Busca botão "Visualizar em Tela cheia" na linha atual 
-                btn = row_atual.query_selector("button[type='submit'][title='Visualizar em Tela cheia']")
-                if not btn:
-                    btn = row_atual.query_selector("button[title*='Tela cheia']")
-                
-                if not btn:
-                    log_info("⚠️ Botão não encontrado, pulando...")
-                    continue
-                
-                # Clica no botão
-                if not primefaces_click(page, btn, "Visualizar em Tela cheia"):
-                    log_info("⚠️ Não foi possível clicar, pulando...")
-                    continue
-                
-                # Aguarda carregar
-                try:
-                    page.wait_for_load_state("networkidle", timeout=10000)
-                except:
-                    pass
-                wait_primefaces_ajax(page)
-                
-                time.sleep(1)
-                
-                iframe_element = page.wait_for_selector("#__frameDetalhe", timeout=10000)
-
-                if iframe_element:
-                    detalhes_requerimento = iframe_element.get_attribute("src")
-                    if detalhes_requerimento:
-                        page.goto(detalhes_requerimento)
-                        
-                        # Recupera dados do solicitante, fabricante, laboratório e OCD
-                        log_info("📊 Coletando dados adicionais do requerimento...")
-                        solicitante_id = "formAnalise:output-solicitante-requerimento:output-solicitante-requerimento"
-                        selector = "#" + solicitante_id.replace(":", "\\:")
-                        try:
-                            dados_solicitante = page.eval_on_selector(selector, """
-                                (t) => {
-                                    const linhas = Array.from(t.querySelectorAll("tr"));
-                                    const resultado = {};
-                                    for (const tr of linhas) {
-                                        const celulas = tr.querySelectorAll("td");
-                                        if (celulas.length === 2) {
-                                            const chave = celulas[0].innerText.trim().replace(/:$/, '');
-                                            const valor = celulas[1].innerText.trim();
-                                            resultado[chave] = valor;
-                                        }
-                                    }
-                                    return resultado;
-                                }
-                                """)
-                            log_info(f"✅ Dados do solicitante coletados: {len(dados_solicitante)} campo(s)")
-                        except Exception as e:
-                            log_erro(f"❌ Erro ao coletar dados do solicitante: {str(e)[:50]}")
-                            dados_solicitante = {}
-                        
-                        # Validação crítica dos dados do solicitante
-                        from core.utils import validar_dados_criticos
-                        validar_dados_criticos(
-                            dados_solicitante=dados_solicitante,
-                            nome_requerimento=requerimento,
-                            contexto="coleta de dados do solicitante"
-                        )
-                        
-                        fabricante_id = "formAnalise:output-fabricante-requerimento:output-fabricante-requerimento"
-                        selector = "#" + fabricante_id.replace(":", "\\:")
-                        try:
-                            dados_fabricante = page.eval_on_selector(selector, """
-                                (t) => {
-                                    const linhas = Array.from(t.querySelectorAll("tr"));
-                                    const resultado = {};
-                                    for (const tr of linhas) {
-                                        const celulas = tr.querySelectorAll("td");
-                                        if (celulas.length === 2) {
-                                            const chave = celulas[0].innerText.trim().replace(/:$/, '');
-                                            const valor = celulas[1].innerText.trim();
-                                            resultado[chave] = valor;
-                                        }
-                                    }
-                                    return resultado;
-                                }
-                                """)
-                            log_info(f"✅ Dados do fabricante coletados: {len(dados_fabricante)} campo(s)")
-                        except Exception as e:
-                            log_erro(f"❌ Erro ao coletar dados do fabricante: {str(e)[:50]}")
-                            dados_fabricante = {}
-                        
-                        # Validação crítica dos dados do fabricante
-                        from core.utils import validar_dados_criticos
-                        validar_dados_criticos(
-                            dados_fabricante=dados_fabricante,
-                            nome_requerimento=requerimento,
-                            contexto="coleta de dados do fabricante"
-                        )
-                        
-                        lab_id = "formAnalise:output-laboratorio-requerimento:output-laboratorio-requerimento"
-                        selector = "#" + lab_id.replace(":", "\\:")
-                        try:
-                            dados_lab = page.eval_on_selector(selector, """
-                                (t) => {
-                                    const linhas = Array.from(t.querySelectorAll("tr"));
-                                    const resultado = {};
-                                    for (const tr of linhas) {
-                                        const celulas = tr.querySelectorAll("td");
-                                        if (celulas.length === 2) {
-                                            const chave = celulas[0].innerText.trim().replace(/:$/, '');
-                                            const valor = celulas[1].innerText.trim();
-                                            resultado[chave] = valor;
-                                        }
-                                    }
-                                    return resultado;
-                                }
-                                """)
-                            log_info(f"✅ Dados do laboratório coletados: {len(dados_lab)} campo(s)")
-                        except Exception as e:
-                            log_erro(f"❌ Erro ao coletar dados do laboratório: {str(e)[:50]}")
-                            dados_lab = {}	
-                        
-                        # Validação crítica dos dados do laboratório
-                        from core.utils import validar_dados_criticos
-                        validar_dados_criticos(
-                            dados_lab=dados_lab,
-                            nome_requerimento=requerimento,
-                            contexto="coleta de dados do laboratório"
-                        )
-                        
-                        labelOCD = page.locator("text=Dados do Certificado")
-                        table = labelOCD.locator("xpath=following::table[1]")
-
-                        dados_ocd = table.evaluate("""
-                        (t) => {
-                            const r = {};
-                            for (const tr of t.querySelectorAll("tr")) {
-                                const td = tr.querySelectorAll("td");
-                                if (td.length === 2) r[td[0].innerText.trim().replace(/:$/, '')] = td[1].innerText.trim();
-                            }
-                            return r;
-                        }
-                        """)
-
-                        if len(dados_ocd) > 0:  
-                            log_info(f"✅ Dados do OCD coletados: {len(dados_ocd)} campo(s)")
-                        else:
-                            log_erro(f"❌ Erro ao coletar dados do OCD")
-                        
-                        # Validação crítica dos dados do OCD
-                        from core.utils import validar_dados_criticos
-                        validar_dados_criticos(
-                            dados_ocd=dados_ocd,
-                            nome_requerimento=requerimento,
-                            contexto="coleta de dados do OCD"
-                        )
-                        
-                        # Salva os dados coletados no JSON do requerimento
-                        json_path = req_para_fullpath(requerimento)                
-                        nome_json = Path(json_path).name
-                        
-                        # Remove underscore inicial para manter consistência com criação inicial
-                        nome_arquivo_json = nome_json[1:] if nome_json.startswith('_') else nome_json
-                        caminho_json = os.path.join(json_path, f"{nome_arquivo_json}.json")
-                        
-                        # Verifica se o JSON existe, se não, cria um básico
-                        if not os.path.exists(caminho_json):
-                            log_info(f"📝 JSON não encontrado, criando arquivo básico: {nome_arquivo_json}.json")
-                            # Cria estrutura básica do JSON
-                            dados_json = {
-                                "requerimento": {
-                                    "num_req": requerimento,
-                                    "status": "Em Análise"
-                                }
-                            }
-                            try:
-                                with open(caminho_json, "w", encoding="utf-8") as f:
-                                    json.dump(dados_json, f, ensure_ascii=False, indent=4)
-                            except Exception as e:
-                                log_erro(f"❌ Erro ao criar JSON básico: {str(e)[:50]}")
-                                continue
-                        
-                        # Carrega o JSON existente ou recém-criado
-                        try:
-                            with open(caminho_json, "r", encoding="utf-8") as f:
-                                dados_json = json.load(f)
-                        except Exception as e:
-                            log_erro(f"❌ Erro ao ler JSON: {str(e)[:50]}")
-                            continue
-                        
-                        # Atualiza os dados coletados
-                        dados_atualizados = False
-                        if dados_ocd != {}:
-                            dados_json["ocd"] = dados_ocd
-                            dados_atualizados = True
-                        if dados_lab != '':
-                            dados_json["lab"] = dados_lab
-                            dados_atualizados = True
-                        if dados_fabricante != '':
-                            dados_json["fabricante"] = dados_fabricante
-                            dados_atualizados = True
-                        if dados_solicitante != '':
-                            dados_json["solicitante"] = dados_solicitante
-                            dados_atualizados = True
+            abas_com_falha = {}
+            if abas == 1:
+                # Processa cada linha dos dados salvos
+                requerimentos_processados = []
+                for linha_info in linhas_dados:
+                    if processar_requerimento_isolado(page, linha_info, caixa, sessao):
+                        requerimentos_processados.append(linha_info['requerimento'])
                     
-                        # Salva apenas se houve atualizações
-                        if dados_atualizados: #teogenes
-                            try:
-                                with open(caminho_json, "w", encoding="utf-8") as f:
-                                    json.dump(dados_json, f, ensure_ascii=False, indent=4)
-                                log_info(f"✅ Dados adicionais salvos no JSON: {nome_arquivo_json}.json")
-                            except Exception as e:
-                                log_erro(f"❌ Erro ao salvar JSON: {str(e)[:50]}")
-                        else:
-                            log_info("ℹ️ Nenhum dado adicional coletado para salvar")
-                        
-                        eh_rad_restrita = testar_radiacao_restrita(dados_json["requerimento"].get("tipo_equipamento", ""))
-                        preencher_minuta(page,rad_restrita=eh_rad_restrita)
-
-                        # Navega para anexos
-                        anexos_btn = page.get_by_role("button", name=BOTOES['anexos'])
-                        
-                        try:
-                            if anexos_btn:                        
-                                anexos_btn.click(no_wait_after=True)
-                                # Aguarda um seletor específico da nova "tela" ou da área que muda
-                                page.wait_for_selector(".ui-blockui", state="detached", timeout=15000)
-                                log_info("🔄 Buscando anexos...")
-                            else:
-                                log_info("⚠️ Botão 'Anexos' não encontrado.")
-                            
-                            wait_primefaces_ajax(page)
-                            log_info("✅ Página de Anexos carregada")
-                            
-                            # BAIXA OS PDFs com retry inteligente
-                            pdfs_baixados, tempo_primeiro_download, downloads_sem_erro = baixar_pdfs(
-                                page, 
-                                requerimento, 
-                                tempo_primeiro_download
-                            )
-                            
-                            # Marca o requerimento como concluído no log
-                            if downloads_sem_erro:
-                                marcar_requerimento_concluido(requerimento, pdfs_baixados)
-                                requerimentos_processados.append(requerimento)
-                                if pdfs_baixados > 0:
-                                    log_info(f"✅ Requerimento {requerimento} marcado como concluído ({pdfs_baixados} arquivos)")
-                                else:
-                                    log_info(f"✅ Requerimento {requerimento} marcado como concluído (0 novos arquivos; anexos já existiam)")
-                            else:
-                                marcar_requerimento_com_erro(requerimento, "Falhas durante o processamento dos anexos")
-                                log_info(f"⚠️ Requerimento {requerimento} marcado com erro por falhas no processamento dos anexos")
-                            
-                        except Exception as e:
-                            erro_msg = f"Erro ao acessar anexos: {str(e)}"
-                            log_erro(erro_msg)
-                            marcar_requerimento_com_erro(requerimento, erro_msg)
-                else:
-                    erro_msg = "iframe_element não encontrado"
-                    log_info(f"⚠️ {erro_msg}, pulando...")
-                    marcar_requerimento_com_erro(requerimento, erro_msg)
-                    continue
-
-                # Volta para a lista
-                page = abrir_caixa_de_entrada(page,retorno_para_estudo=RETORNO_PARA_ESTUDO)
+                    # Volta para a lista
+                    page = abrir_caixa_de_entrada(page,retorno_para_estudo=RETORNO_PARA_ESTUDO)
+            else:
+                requerimentos_processados, abas_com_falha = baixar_em_abas(
+                    browser, page, linhas_dados, abas, RETORNO_PARA_ESTUDO, sessao)
             
             log_info(SEPARADOR_LINHA)
-            log_info("✅ PROCESSAMENTO CONCLUÍDO!")
+            for numero_aba, erro in sorted(abas_com_falha.items()):
+                log_erro(f"Aba {numero_aba} encerrada por erro: {erro[:100]}")
+            if len(abas_com_falha) == abas:
+                log_erro("PROCESSAMENTO INTERROMPIDO: todas as abas foram encerradas por erro")
+            elif abas_com_falha:
+                log_info(f"⚠️ PROCESSAMENTO CONCLUÍDO COM {len(abas_com_falha)} ABA(S) ENCERRADA(S) POR ERRO")
+            else:
+                log_info("✅ PROCESSAMENTO CONCLUÍDO!")
             log_info(SEPARADOR_LINHA)
+            exibir_metricas_espera()
             
             # Verifica se todos os requerimentos foram processados com sucesso e limpa o log
             limpar_log_downloads_se_completo(requerimentos_processados)
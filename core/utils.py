@@ -9,26 +9,49 @@ import sys
 import re
 import json
 import subprocess
+import signal
+import shutil
+import hashlib
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import unicodedata
+from functools import lru_cache
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
-import pandas as pd
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple, Union
 from openpyxl import load_workbook
-from core.const import EXCEL_PATH, REQUERIMENTOS_PATH, TAB_REQUERIMENTOS, EXCEL_SHEET_NAME, DOWNLOAD_LOG_FILENAME
+from core.const import (EXCEL_PATH, REQUERIMENTOS_PATH, TAB_REQUERIMENTOS, EXCEL_SHEET_NAME, DOWNLOAD_LOG_FILENAME, DOWNLOAD_LOG_JSON_LEGADO, PALAVRAS_IGNORADAS_NORMAS, TAMANHO_CACHE_NORMALIZACAO_NORMAS,
+                        TAMANHO_CACHE_NORMALIZACAO, LIMITE_TEXTO_CURTO_NORMALIZACAO)
 from core.log_print import log_info, log_erro
 # Imports opcionais para funcionalidades específicas
 try:
-    from pdf2image import convert_from_path
+    from pdf2image import convert_from_path, pdfinfo_from_path
     import pytesseract
     OCR_DISPONIVEL = True
 except ImportError:
     OCR_DISPONIVEL = False
 
+try:
+    import pymupdf as fitz
+    PYMUPDF_DISPONIVEL = True
+except ImportError:
+    PYMUPDF_DISPONIVEL = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_DISPONIVEL = True
+except ImportError:
+    AHOCORASICK_DISPONIVEL = False
+
 from core.const import (
-    TBN_FILES_FOLDER, CHROME_PROFILE_DIR, REQUERIMENTOS_DIR_INBOX,
+    TBN_FILES_FOLDER, CHROME_PROFILE_DIR, REQUERIMENTOS_DIR_INBOX, UTILS_DIR,
     GIT_COMMANDS, GIT_TIMEOUT, VERSAO_PADRAO, MENSAGENS_STATUS, TIPOS_DOCUMENTOS,
-    TESSERACT_PATH, JSON_FILES
+    TESSERACT_PATH, JSON_FILES, CACHE_EXTRACAO_INDICE, CACHE_EXTRACAO_VERSAO,
+    METODO_EXTRACAO_NATIVO, METODO_EXTRACAO_OCR, METODO_EXTRACAO_HIBRIDO, LATEX_MAX_PASSADAS,
+    OCR_MAX_WORKERS, OCR_IDIOMA, OCR_MIN_CARACTERES_PAGINA, OCR_MIN_COBERTURA_IMAGEM,
+    GLOB_RESULTADOS_JSONL
 )
 from core.log_print import log_info, log_erro, log_erro_critico
 
@@ -235,14 +258,80 @@ def listar_tipos_documento() -> List[str]:
 # FUNÇÕES DE NORMALIZAÇÃO
 # ================================
 
+# Trechos não-ASCII (os únicos que podem conter acentos) e caracteres fora do BMP
+PADRAO_TRECHO_NAO_ASCII = re.compile(r'[^\x00-\x7f]+')
+PADRAO_FORA_BMP = re.compile(r'[\U00010000-\U0010ffff]')
+
+# Tabela de str.translate do BMP (código -> caractere sem acento) e padrão das marcas
+# combinantes que não são Mn (ex.: U+302E, U+1B44), montados no primeiro uso
+_TABELA_REMOCAO_ACENTOS: Optional[Dict[int, Optional[str]]] = None
+_PADRAO_COMBINANTES_NAO_MN: Optional[re.Pattern] = None
+
+
+def _remover_acentos_nfd(s: str) -> str:
+    """Decompõe (NFD) e descarta as marcas combinantes (categoria Mn), caractere a caractere."""
+    return ''.join(
+        c for c in unicodedata.normalize('NFD', s)
+        if unicodedata.category(c) != 'Mn'
+    )
+
+
+def _preparar_remocao_acentos() -> Tuple[Dict[int, Optional[str]], re.Pattern]:
+    """
+    Retorna a tabela com os caracteres do BMP que mudam ao remover os acentos e o padrão
+    das marcas combinantes do BMP que não são Mn (sobrevivem à remoção dos acentos).
+    """
+    global _TABELA_REMOCAO_ACENTOS, _PADRAO_COMBINANTES_NAO_MN
+    if _TABELA_REMOCAO_ACENTOS is None:
+        tabela = {}
+        combinantes_nao_mn = []
+        for codigo in range(0x80, 0x10000):
+            caractere = chr(codigo)
+            sem_acento = _remover_acentos_nfd(caractere)
+            if sem_acento != caractere:
+                tabela[codigo] = sem_acento or None
+            if unicodedata.combining(caractere) and unicodedata.category(caractere) != 'Mn':
+                combinantes_nao_mn.append(re.escape(caractere))
+        _PADRAO_COMBINANTES_NAO_MN = re.compile(f"[{''.join(combinantes_nao_mn)}]")
+        _TABELA_REMOCAO_ACENTOS = tabela
+    return _TABELA_REMOCAO_ACENTOS, _PADRAO_COMBINANTES_NAO_MN
+
+
+def _remover_acentos(s: str) -> str:
+    """
+    Remove os acentos com str.translate aplicado apenas aos trechos não-ASCII.
+    
+    A tradução caractere a caractere não faz o reordenamento canônico da NFD, que só
+    altera o resultado quando há marcas combinantes que não são Mn junto a marcas Mn.
+    Esse texto raro, assim como o com caracteres fora do BMP, segue por _remover_acentos_nfd,
+    de modo que o resultado é sempre o mesmo dela.
+    """
+    if s.isascii():
+        return s
+    if PADRAO_FORA_BMP.search(s):
+        return _remover_acentos_nfd(s)
+    tabela, padrao_combinantes_nao_mn = _preparar_remocao_acentos()
+    if padrao_combinantes_nao_mn.search(s):
+        return _remover_acentos_nfd(s)
+    return PADRAO_TRECHO_NAO_ASCII.sub(lambda trecho: trecho.group().translate(tabela), s)
+
+
+@lru_cache(maxsize=TAMANHO_CACHE_NORMALIZACAO)
+def _normalizar_texto_curto(s: str) -> str:
+    """Normalização memoizada de strings curtas, que se repetem entre documentos."""
+    return _remover_acentos(s.strip().lower())
+
+
 def normalizar(s: Union[str, Any]) -> Union[str, Any]:
-    """Normaliza string removendo acentos e convertendo para lowercase."""
+    """
+    Normaliza string removendo acentos e convertendo para lowercase.
+    Strings curtas passam pelo cache LRU; textos de documentos devem ser normalizados
+    uma vez por documento (ver DocumentoExtraido.texto_normalizado).
+    """
     if isinstance(s, str):
-        s = s.strip().lower()
-        s = ''.join(
-            c for c in unicodedata.normalize('NFD', s)
-            if unicodedata.category(c) != 'Mn'
-        )
+        if len(s) <= LIMITE_TEXTO_CURTO_NORMALIZACAO:
+            return _normalizar_texto_curto(s)
+        return _remover_acentos(s.strip().lower())
     return s
 
 
@@ -256,26 +345,6 @@ def normalizar_dados(dados: Dict[str, Any]) -> Dict[str, Any]:
     return dados
 
 
-# ================================
-# FUNÇÕES DE BUSCA EM JSON
-# ================================
-
-def buscar_valor(json_data: Union[List[Dict], Dict], key_busca: str, valor_busca: Any, key_retorno: str) -> Optional[Any]:
-    """
-    Busca em uma lista de dicionários (ou JSON similar)
-    onde key_busca == valor_busca e retorna o valor de key_retorno.
-    """
-    if isinstance(json_data, list):
-        for item in json_data:
-            if isinstance(item, dict):
-                if item.get(key_busca) == valor_busca:
-                    return item.get(key_retorno)
-    elif isinstance(json_data, dict):
-        if json_data.get(key_busca) == valor_busca:
-            return json_data.get(key_retorno)
-    return None
-
-
 # ================================
 # FUNÇÕES DE VERSIONAMENTO
 # ================================
@@ -507,6 +576,31 @@ def salvar_json(dados: Union[Dict, List], caminho: Union[str, Path], encoding: s
         return False
 
 
+def salvar_json_atomico(dados: Union[Dict, List], caminho: Union[str, Path], indent: Optional[int] = None) -> bool:
+    """
+    Salva dados em JSON de forma atômica: grava em um arquivo temporário e o renomeia
+    sobre o destino, de modo que leitores (inclusive outros processos) nunca veem
+    um arquivo parcialmente escrito.
+    
+    Args:
+        dados: Dados para salvar
+        caminho: Caminho para o arquivo JSON
+        indent: Indentação para formatação (padrão: None, JSON compacto)
+    
+    Returns:
+        True se salvou com sucesso, False caso contrário
+    """
+    caminho = Path(caminho)
+    temporario = caminho.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(dados, f, ensure_ascii=False, indent=indent)
+        os.replace(temporario, caminho)
+        return True
+    except (OSError, TypeError, ValueError):
+        return False
+
+
 # ================================
 # FUNÇÕES DE VALIDAÇÃO
 # ================================
@@ -548,49 +642,210 @@ def validar_caminho_arquivo(caminho: Union[str, Path]) -> bool:
         return False
 
 
+# Norma citada: tipo (ato/resolução) seguido do número
+PADRAO_NORMA = re.compile(
+    r'(ATO|RESOLUÇÃO|RESOLUÇÕES?)\s*(?:\([^)]+\))?\s*(?:da\s+\w+\s+)?(?:|Nº|N°|NO|nº|n°|no|n.|N.)?[\s:]*(\d+)',
+    re.IGNORECASE
+)
+# Início de uma citação de norma, com ou sem número
+PADRAO_TIPO_NORMA = re.compile(r'ATO|RESOLUÇÃO|RESOLUÇÕES?', re.IGNORECASE)
+# Quebra de linha em que o texto pode ser cortado sem alterar a limpeza nem as citações:
+# a linha seguinte não começa com espaço, "(", "." ou palavra ignorada, que a limpeza
+# poderia remover junto com a quebra, colando as duas linhas
+PADRAO_CORTE_NORMAS = re.compile(
+    r'\n(?![\s(.])(?!(?:' + '|'.join(map(re.escape, PALAVRAS_IGNORADAS_NORMAS)) + r')\b)',
+    re.IGNORECASE
+)
+
+# Palavras (separadas por espaço ou ":") examinadas no fim de um trecho e continuações
+# usadas para testar se uma citação ali falhou apenas por falta de texto
+PADRAO_PALAVRA_NORMAS = re.compile(r'[^\s:]+')
+PALAVRAS_CAUDA_NORMAS = 6
+SONDAS_CONTINUACAO_NORMAS = ("0", " 0", "x 0", " x 0", "a x 0")
+
+
+class ExtratorNormas:
+    """
+    Extrator de normas citadas (ex.: "ato77", "resolucao680") em uma única passada.
+    
+    Pode ser alimentado aos poucos (página a página) com adicionar() e encerrado com
+    finalizar(); o resultado é o mesmo de extrair_normas_por_padrao sobre o texto
+    concatenado. O texto só é processado até um ponto de corte seguro: quebra de linha
+    fora de parênteses e sem citação de norma incompleta antes dela.
+    """
+    
+    def __init__(self):
+        self._pendente = ""
+        self._normas: Dict[str, None] = {}  # Conjunto ordenado (ordem de aparição)
+        self._possui_tipo = False
+    
+    def _registrar(self, texto_limpo: str) -> None:
+        """Registra, numa única passada de finditer, as normas de um trecho já limpo."""
+        texto_maiusculo = texto_limpo.upper()
+        self._possui_tipo = self._possui_tipo or 'ATO' in texto_maiusculo or 'RESOLUÇÃO' in texto_maiusculo
+        for match in PADRAO_NORMA.finditer(texto_limpo):
+            tipo, numero = match.groups()
+            tipo_normalizado = 'resolucao' if 'resolu' in tipo.lower() else 'ato'
+            self._normas.setdefault(f"{tipo_normalizado}{numero}", None)
+    
+    @staticmethod
+    def _citacao_em_aberto(texto_limpo: str) -> bool:
+        """
+        Indica se uma citação no fim do trecho limpo ainda pode mudar com o texto seguinte:
+        termina exatamente no fim do trecho ou só falhou por falta de texto.
+        Só as últimas palavras precisam ser verificadas, pois uma citação tem no máximo
+        cinco (tipo, "da", órgão, "nº" e número).
+        """
+        palavras = [m.start() for m in PADRAO_PALAVRA_NORMAS.finditer(texto_limpo)]
+        inicio_cauda = palavras[-PALAVRAS_CAUDA_NORMAS] if len(palavras) >= PALAVRAS_CAUDA_NORMAS else 0
+        for tipo in PADRAO_TIPO_NORMA.finditer(texto_limpo, inicio_cauda):
+            match = PADRAO_NORMA.match(texto_limpo, tipo.start())
+            if match:
+                if match.end() == len(texto_limpo):
+                    return True
+            elif any(PADRAO_NORMA.match(texto_limpo[tipo.start():] + sonda) for sonda in SONDAS_CONTINUACAO_NORMAS):
+                return True
+        return False
+    
+    def adicionar(self, texto: str) -> None:
+        """Acrescenta texto (ex.: uma página) e processa o que já pode ser processado."""
+        self._pendente += texto
+        # O corte só é avaliado com a linha seguinte completa (início dela conhecido)
+        ultima_quebra = self._pendente.rfind('\n')
+        corte = None
+        for candidato in PADRAO_CORTE_NORMAS.finditer(self._pendente):
+            if candidato.start() >= ultima_quebra:
+                break
+            corte = candidato
+        if corte is None:
+            return
+        
+        trecho = self._pendente[:corte.end()]
+        # Parêntese aberto sem fechamento: a limpeza depende do texto seguinte
+        if trecho.rfind('(') > trecho.rfind(')'):
+            return
+        
+        texto_limpo = limpar_texto(trecho, palavras=PALAVRAS_IGNORADAS_NORMAS, simbolos=["."])
+        if self._citacao_em_aberto(texto_limpo):
+            return
+        
+        self._registrar(texto_limpo)
+        self._pendente = self._pendente[corte.end():]
+    
+    def finalizar(self, texto: str = "") -> List[str]:
+        """
+        Processa o texto restante (acrescido de `texto`, se informado) e retorna as
+        normas encontradas, na ordem de aparição.
+        """
+        self._pendente += texto
+        if self._pendente:
+            self._registrar(limpar_texto(self._pendente, palavras=PALAVRAS_IGNORADAS_NORMAS, simbolos=["."]))
+            self._pendente = ""
+        return list(self._normas) if self._possui_tipo else []
+
+
 def extrair_normas_por_padrao(content: str) -> List[str]:
     """
     Extrai normas usando padrões específicos (função utilitária centralizada).
     Baseado no método _extract_normas_by_pattern como modelo integral.
     """
-    normas = []
-    custom_patterns = ['ATO', 'RESOLUÇÃO']
-    
-    normas_section = limpar_texto(content, palavras=["contato","Contato","Nº","N°","NO","nº","n°","n.","N.","no","de","do", "da", "anatel"], simbolos=["."])
-
-    lines = [
-        subcampo.strip()
-        for linha in normas_section.split('\n')
-        for campo in linha.split(';')
-        for subcampo in campo.split(',')
-    ]
-    for line in lines:
-        line = line.strip()
-        for pattern in custom_patterns:
-            if pattern in normas_section.upper():
-                # Regex corrigida - o problema era \s+ que exige pelo menos 1 espaço
-                # Mudei para \s* para permitir zero ou mais espaços
-                norma_matches = re.findall(
-                    r'(ATO|RESOLUÇÃO|RESOLUÇÕES?)\s*(?:\([^)]+\))?\s*(?:da\s+\w+\s+)?(?:|Nº|N°|NO|nº|n°|no|n.|N.)?[\s:]*(\d+)',
-                    normas_section,
-                    re.IGNORECASE
-                )                       
-                
-                # Processar cada match
-                for tipo, numero in norma_matches:
-                    tipo_normalizado = tipo.lower()
-                    if 'resolu' in tipo_normalizado:
-                        tipo_normalizado = 'resolucao'
-                    else:
-                        tipo_normalizado = 'ato'
-                    
-                    norma_formatada = f"{tipo_normalizado}{numero}"
-                    if norma_formatada not in normas:
-                        normas.append(norma_formatada)
-                
-                break
+    return ExtratorNormas().finalizar(content)
+
+
+# Normalização de IDs de normas: (padrão, substituição) em ordem de prioridade
+PADROES_ID_NORMA = [
+    # Atos da ANATEL
+    (re.compile(r'(?:ato|act)\s*n?°?\s*(\d+)', re.IGNORECASE), r'ato\1'),
+    
+    # Resoluções da ANATEL
+    (re.compile(r'(?:resolução|resolution)\s*n?°?\s*(\d+)', re.IGNORECASE), r'resolucao\1'),
+    
+    # ABNT NBR
+    (re.compile(r'abnt\s+nbr\s+(\d+)(?:\:?\d{4})?', re.IGNORECASE), r'abnt_nbr_\1'),
+    
+    # IEC
+    (re.compile(r'iec\s+(\d+)(?:-\d+)?(?:\:?\d{4})?', re.IGNORECASE), r'iec\1'),
+    
+    # CISPR
+    (re.compile(r'cispr\s+(\d+)(?:\:?\d{4})?', re.IGNORECASE), r'cispr\1'),
+    
+    # ITU-T G.xxx
+    (re.compile(r'itu-?t\s+g\.?(\d+)', re.IGNORECASE), r'itu_g\1'),
+    
+    # ITU-R M.xxx
+    (re.compile(r'itu-?r\s+m\.?(\d+)(?:-\d+)?', re.IGNORECASE), r'itu_r_m\1'),
+    
+    # ETSI TS
+    (re.compile(r'etsi\s+ts\s+(\d+)\s+(\d+)-(\d+)', re.IGNORECASE), r'etsi_ts_\1_\2'),
+    
+    # IETF RFC
+    (re.compile(r'(?:ietf\s+)?rfc\s*(\d+)', re.IGNORECASE), r'ietf_rfc\1'),
+    
+    # IEEE
+    (re.compile(r'ieee\s+std\s+([\d\.]+)', re.IGNORECASE), r'ieee_std_\1'),
+]
+
+# Alternância ancorada no início: cada ramo procura um padrão no texto todo e o primeiro
+# ramo que casa vence, preservando a prioridade da lista; o grupo vazio p<i> identifica o ramo
+PADRAO_SELECAO_ID_NORMA = re.compile(
+    '|'.join(f'(?=[\\s\\S]*?{padrao.pattern})(?P<p{indice}>)' for indice, (padrao, _) in enumerate(PADROES_ID_NORMA)),
+    re.IGNORECASE
+)
+PADRAO_NAO_PALAVRA = re.compile(r'[^\w]')
+PADRAO_SUBLINHADOS = re.compile(r'_+')
+PADRAO_SIMBOLOS_ID_NORMA = re.compile(r'[^\w\s]')
+PADRAO_ESPACOS = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=TAMANHO_CACHE_NORMALIZACAO_NORMAS)
+def normalizar_id_norma(norma_original: str) -> Optional[str]:
+    """
+    Converte uma norma encontrada para o formato de ID usado no normas.json
+    (memoizado: as mesmas normas se repetem em quase todos os requerimentos)
+    
+    Exemplos:
+    - "Ato 1234" -> "ato1234"  
+    - "Resolução 715" -> "resolucao715"
+    - "ABNT NBR 7866" -> "abnt_nbr_7866"
+    - "IEC 61300" -> "iec61300"
+    """
+    norma_clean = norma_original.strip()
+    
+    selecao = PADRAO_SELECAO_ID_NORMA.match(norma_clean)
+    if selecao:
+        padrao, substituicao = PADROES_ID_NORMA[int(selecao.lastgroup[1:])]
+        resultado = padrao.sub(substituicao, norma_clean).lower()
+        # Limpar caracteres especiais e espaços
+        resultado = PADRAO_NAO_PALAVRA.sub('_', resultado)
+        resultado = PADRAO_SUBLINHADOS.sub('_', resultado)
+        return resultado.strip('_')
+    
+    # Se não encontrou padrão conhecido, criar ID genérico
+    id_generico = PADRAO_SIMBOLOS_ID_NORMA.sub('', norma_clean)  # Remove caracteres especiais
+    id_generico = PADRAO_ESPACOS.sub('_', id_generico)          # Substitui espaços por underscore
+    id_generico = id_generico.lower().strip('_')
+    
+    if id_generico and len(id_generico) > 2:
+        return id_generico
+    
+    return None
 
-    return normas
+
+def normalizar_ids_normas(normas: List[str]) -> List[Optional[str]]:
+    """Normaliza uma lista de normas de uma vez, na mesma ordem (None onde não há ID)."""
+    return [normalizar_id_norma(norma) for norma in normas]
+
+
+def estatisticas_normalizacao_normas() -> Dict[str, Any]:
+    """Retorna acertos/falhas do cache de normalização de IDs de normas."""
+    info = normalizar_id_norma.cache_info()
+    consultas = info.hits + info.misses
+    return {
+        'acertos': info.hits,
+        'falhas': info.misses,
+        'taxa_acerto': (info.hits / consultas) if consultas else 0.0,
+        'entradas': info.currsize
+    }
 
 
 def validar_caminho_diretorio(caminho: Union[str, Path]) -> bool:
@@ -614,152 +869,164 @@ def validar_caminho_diretorio(caminho: Union[str, Path]) -> bool:
 # FUNÇÕES DE REQUERIMENTOS E EXCEL
 # ================================
 
+class AtualizadorPlanilhaExcel:
+    """
+    Atualizador em lote da planilha Excel ORCN.
+    
+    Lê a coluna de requerimentos uma única vez (openpyxl em modo somente leitura),
+    acumula as novas linhas durante toda a execução e as grava num único
+    load_workbook/save, evitando reabrir e sincronizar a planilha a cada requerimento.
+    """
+    
+    def __init__(self, caminho: Union[str, Path] = EXCEL_PATH):
+        self.caminho = caminho
+        self.requerimentos_existentes: Optional[Set[str]] = None
+        self.novas_linhas: List[List[Any]] = []
+        # Desativado quando a planilha não existe ou não pôde ser lida
+        self.disponivel = os.path.exists(caminho)
+        if not self.disponivel:
+            log_info(f"Erro: Planilha não encontrada: {caminho}")
+    
+    def _carregar_existentes(self) -> Optional[Set[str]]:
+        """Lê, em modo streaming, os requerimentos já presentes na coluna B da aba de análise."""
+        if self.requerimentos_existentes is None and self.disponivel:
+            coluna_req = TAB_REQUERIMENTOS['num_req'] + 1  # Coluna B (openpyxl começa em 1)
+            try:
+                wb = load_workbook(self.caminho, read_only=True, data_only=True)
+                try:
+                    ws = wb[EXCEL_SHEET_NAME]
+                    self.requerimentos_existentes = {
+                        str(valor)
+                        for (valor,) in ws.iter_rows(min_row=2, min_col=coluna_req, max_col=coluna_req, values_only=True)
+                        if valor is not None
+                    }
+                finally:
+                    wb.close()
+            except Exception as e:
+                log_info(f"Erro ao processar planilha: {e}")
+                self.disponivel = False
+        return self.requerimentos_existentes
+    
+    def adicionar(self, req: str) -> bool:
+        """
+        Prepara a linha do requerimento se ele ainda não existir na planilha.
+        
+        Args:
+            req: Número do requerimento no formato "xx.xxxxx"
+            
+        Returns:
+            True se uma nova linha foi acumulada para gravação
+        """
+        try:
+            # Verificar se já existe na planilha (formato pode variar)
+            formatos_possiveis = [
+                req,  # formato 25.06969
+                req.replace('.', '/'),  # formato 25/06969 (como aparece no JSON)
+                f"{req.split('.')[1]}/{req.split('.')[0]}"  # formato 06969/25
+            ]
+            
+            existentes = self._carregar_existentes()
+            if existentes is None:
+                return False
+            if any(fmt in existentes for fmt in formatos_possiveis):
+                log_info(f"Requerimento {req} já existe na planilha")
+                return False
+            
+            # Ler arquivo JSON do requerimento
+            pasta_req = "_" + req
+            arquivo_json = os.path.join(REQUERIMENTOS_PATH, pasta_req, f"{req}.json")
+            
+            if not os.path.exists(arquivo_json):
+                log_info(f"Aviso: Arquivo JSON não encontrado: {arquivo_json}")
+                return False
+            
+            # Carregar dados do JSON
+            with open(arquivo_json, 'r', encoding='utf-8') as f:
+                dados_req = json.load(f)
+            
+            # Mapear dados do JSON para colunas da planilha
+            nova_linha = _mapear_dados_json_para_excel(dados_req.get('requerimento', {}))
+            if not nova_linha:
+                log_info(f"Erro: Não foi possível mapear dados do requerimento {req}")
+                return False
+            
+            self.novas_linhas.append(nova_linha)
+            # Evita duplicar o requerimento se ele for adicionado de novo na mesma execução
+            existentes.update(formatos_possiveis)
+            return True
+        except Exception as e:
+            log_info(f"Erro ao processar requerimento {req}: {e}")
+            return False
+    
+    def salvar(self) -> None:
+        """Grava todas as linhas acumuladas numa única abertura/gravação da planilha."""
+        if not self.disponivel:
+            return
+        if not self.novas_linhas:
+            log_info("Nenhum requerimento novo para adicionar")
+            return
+        
+        try:
+            # Usar openpyxl para preservar todas as abas existentes
+            wb = load_workbook(self.caminho)
+            ws = wb[EXCEL_SHEET_NAME]
+            
+            # Adicionar cada nova linha a partir da próxima linha vazia
+            proxima_linha = ws.max_row + 1
+            for nova_linha in self.novas_linhas:
+                for col_idx, valor in enumerate(nova_linha):
+                    ws.cell(row=proxima_linha, column=col_idx + 1, value=valor)
+                proxima_linha += 1
+            
+            # Salvar preservando todas as abas
+            wb.save(self.caminho)
+            wb.close()
+            self.novas_linhas = []
+        except Exception as e:
+            log_info(f"Erro ao salvar planilha: {e}")
+
+
 def processar_requerimentos_excel(num_req: str) -> None:
     """
     Processa requerimentos para atualização da planilha Excel ORCN.
     
     Lê arquivos JSON de requerimentos e atualiza a planilha Excel se o número
     do requerimento não existir na coluna B da aba "Requerimentos-Análise".
+    Para vários requerimentos numa mesma execução, prefira AtualizadorPlanilhaExcel,
+    que grava a planilha uma única vez.
     
     Args:
         num_req (str): Número do requerimento no formato "xx.xxxxx" ou "*" para todos
-    
-    Raises:
-        ImportError: Se pandas ou openpyxl não estiverem disponíveis
-        FileNotFoundError: Se arquivos necessários não forem encontrados
-        ValueError: Se formato do requerimento for inválido
     """    
     
     
     # Validar se arquivos e diretórios existem
-    if not os.path.exists(EXCEL_PATH):
-        log_info(f"Erro: Planilha não encontrada: {EXCEL_PATH}")
+    atualizador = AtualizadorPlanilhaExcel()
+    if not atualizador.disponivel:
         return
     
     if not os.path.exists(REQUERIMENTOS_PATH):
         log_info(f"Erro: Diretório de requerimentos não encontrado: {REQUERIMENTOS_PATH}")
         return
     
-    try:
-        # Carregar planilha Excel
-        df = pd.read_excel(EXCEL_PATH, sheet_name=EXCEL_SHEET_NAME)
-        #log_info(f"Planilha carregada com {len(df)} linhas")
-        
-        # Obter lista de requerimentos já existentes na coluna B
-        coluna_req = df.columns[TAB_REQUERIMENTOS['num_req']]  # Coluna B (índice 1)
-        requerimentos_existentes = set(df[coluna_req].dropna().astype(str))
-        #log_info(f"Requerimentos existentes na planilha: {len(requerimentos_existentes)}")
-        
-        # Determinar quais requerimentos processar
-        if num_req == "*":
-            # Processar todos os requerimentos do diretório
-            #log_info("Processando todos os requerimentos do diretório...")
-            requerimentos_para_processar = []
-            
-            for item in os.listdir(REQUERIMENTOS_PATH):
-                caminho_item = os.path.join(REQUERIMENTOS_PATH, item)
-                if os.path.isdir(caminho_item) and re.match(r'^\d{2}\.\d{5}$', item):
-                    requerimentos_para_processar.append(item)
-            
-            #log_info(f"Encontrados {len(requerimentos_para_processar)} diretórios de requerimentos")
-        else:
-            # Processar requerimento específico
-            if not re.match(r'^\d{2}\.\d{5}$', num_req):
-                log_info(f"Erro: Formato inválido do requerimento: {num_req}. Use formato xx.xxxxx")
-                return
-            
-            requerimentos_para_processar = [num_req]
-            #log_info(f"Processando requerimento específico: {num_req}")
-        
-        # Processar cada requerimento
-        requerimentos_adicionados = []
-        requerimentos_ja_existentes = []
-        requerimentos_com_erro = []
-        novas_linhas_para_excel = []  # Armazenar linhas para adicionar diretamente no Excel
-        
-        for req in requerimentos_para_processar:
-            try:
-                # Verificar se já existe na planilha (formato pode variar)
-                formatos_possíveis = [
-                    req,  # formato 25.06969
-                    req.replace('.', '/'),  # formato 25/06969 (como aparece no JSON)
-                    f"{req.split('.')[1]}/{req.split('.')[0]}"  # formato 06969/25
-                ]
-                
-                req_existe = any(fmt in requerimentos_existentes for fmt in formatos_possíveis)
-                
-                if req_existe:
-                    log_info(f"Requerimento {req} já existe na planilha")
-                    requerimentos_ja_existentes.append(req)
-                    continue
-                
-                # Ler arquivo JSON do requerimento
-                pasta_req = "_" + req
-                arquivo_json = os.path.join(REQUERIMENTOS_PATH, pasta_req, f"{req}.json")
-                
-                if not os.path.exists(arquivo_json):
-                    log_info(f"Aviso: Arquivo JSON não encontrado: {arquivo_json}")
-                    requerimentos_com_erro.append(req)
-                    continue
-                
-                # Carregar dados do JSON
-                with open(arquivo_json, 'r', encoding='utf-8') as f:
-                    dados_req = json.load(f)
-                
-                # Extrair informações do JSON conforme estrutura esperada
-                req_data = dados_req.get('requerimento', {})
-                
-                # Mapear dados do JSON para colunas da planilha
-                nova_linha = _mapear_dados_json_para_excel(req_data)
-                
-                if nova_linha:
-                    # Armazenar linha para adicionar no Excel
-                    novas_linhas_para_excel.append(nova_linha)
-                    requerimentos_adicionados.append(req)
-                    #log_info(f"Requerimento {req} preparado para adição à planilha")
-                else:
-                    log_info(f"Erro: Não foi possível mapear dados do requerimento {req}")
-                    requerimentos_com_erro.append(req)
-                    
-            except Exception as e:
-                log_info(f"Erro ao processar requerimento {req}: {e}")
-                requerimentos_com_erro.append(req)
-        
-        # Salvar planilha se houver alterações
-        if requerimentos_adicionados and novas_linhas_para_excel:
-            # Usar openpyxl para preservar todas as abas existentes
-            wb = load_workbook(EXCEL_PATH)
-            ws = wb[EXCEL_SHEET_NAME]
-            
-            # Encontrar a próxima linha vazia
-            proxima_linha = ws.max_row + 1
-            
-            # Adicionar cada nova linha diretamente no Excel
-            for nova_linha in novas_linhas_para_excel:
-                for col_idx, valor in enumerate(nova_linha):
-                    ws.cell(row=proxima_linha, column=col_idx + 1, value=valor)
-                proxima_linha += 1
-            
-            # Salvar preservando todas as abas
-            wb.save(EXCEL_PATH)
-            wb.close()
-            #log_info(f"Planilha atualizada com {len(requerimentos_adicionados)} novos requerimentos (todas as abas preservadas)")
-        else:
-            log_info("Nenhum requerimento novo para adicionar")
+    # Determinar quais requerimentos processar
+    if num_req == "*":
+        # Processar todos os requerimentos do diretório
+        requerimentos_para_processar = [
+            item for item in os.listdir(REQUERIMENTOS_PATH)
+            if os.path.isdir(os.path.join(REQUERIMENTOS_PATH, item)) and re.match(r'^\d{2}\.\d{5}$', item)
+        ]
+    else:
+        # Processar requerimento específico
+        if not re.match(r'^\d{2}\.\d{5}$', num_req):
+            log_info(f"Erro: Formato inválido do requerimento: {num_req}. Use formato xx.xxxxx")
+            return
         
-        # Relatório final
-        #log_info("\n=== RELATÓRIO DE PROCESSAMENTO ===")
-        #log_info(f"Requerimentos processados: {len(requerimentos_para_processar)}")
-        #log_info(f"Requerimentos adicionados: {len(requerimentos_adicionados)}")
-        #log_info(f"Requerimentos já existentes: {len(requerimentos_ja_existentes)}")
-        #log_info(f"Requerimentos com erro: {len(requerimentos_com_erro)}")        
-        #if requerimentos_adicionados:
-        #    log_info(f"Novos requerimentos: {', '.join(requerimentos_adicionados)}")        
-        #if requerimentos_com_erro:
-        #    log_info(f"Requerimentos com erro: {', '.join(requerimentos_com_erro)}")
-            
-    except Exception as e:
-        log_info(f"Erro ao processar planilha: {e}")
+        requerimentos_para_processar = [num_req]
+    
+    for req in requerimentos_para_processar:
+        atualizador.adicionar(req)
+    atualizador.salvar()
 
 
 def _converter_para_excel(valor: Any) -> Any:
@@ -858,11 +1125,155 @@ def _mapear_dados_json_para_excel(req_data: Dict[str, Any]) -> Optional[List[Any
 # ================================
 
 def get_download_log_path() -> str:
-    """Retorna o caminho completo para o arquivo de log de downloads."""
+    """Retorna o caminho completo para o banco de dados de log de downloads."""
     files_folder = get_files_folder()
     return os.path.join(files_folder, DOWNLOAD_LOG_FILENAME)
 
 
+class RegistroDownloads:
+    """
+    Registro do status de download dos requerimentos, persistido em SQLite.
+    
+    Cada atualização grava apenas a linha do requerimento em uma transação atômica
+    (modo WAL), e as consultas usam a chave primária, de modo que o custo não cresce
+    com o tamanho do histórico. Na primeira abertura, o log legado em JSON
+    (DOWNLOAD_LOG_JSON_LEGADO) é importado e renomeado para .migrado.
+    A conexão é compartilhada entre threads e protegida por um lock.
+    """
+    
+    # Limite de parâmetros por consulta IN (SQLITE_MAX_VARIABLE_NUMBER em versões antigas é 999)
+    TAMANHO_LOTE_CONSULTA = 500
+    
+    def __init__(self, caminho_db: Union[str, Path]):
+        self.caminho_db = Path(caminho_db)
+        self._lock = threading.Lock()
+        self._conexao = sqlite3.connect(str(self.caminho_db), check_same_thread=False)
+        self._conexao.row_factory = sqlite3.Row
+        
+        with self._lock, self._conexao:
+            self._conexao.execute("PRAGMA journal_mode=WAL")
+            self._conexao.execute(
+                """CREATE TABLE IF NOT EXISTS downloads (
+                    requerimento TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    arquivos_baixados INTEGER NOT NULL DEFAULT 0,
+                    erro TEXT
+                )"""
+            )
+        
+        self._migrar_log_json()
+    
+    def _migrar_log_json(self) -> None:
+        """Importa o log legado em JSON, se existir, em uma única transação."""
+        caminho_json = self.caminho_db.with_name(DOWNLOAD_LOG_JSON_LEGADO)
+        if not caminho_json.exists():
+            return
+        
+        log_data = carregar_json(caminho_json)
+        if isinstance(log_data, dict):
+            registros = [
+                (req, dados.get("status", ""), dados.get("timestamp", ""),
+                 dados.get("arquivos_baixados", 0), dados.get("erro"))
+                for req, dados in log_data.items() if isinstance(dados, dict)
+            ]
+            try:
+                with self._lock, self._conexao:
+                    # Registros já existentes no banco (mais recentes) são preservados
+                    self._conexao.executemany(
+                        "INSERT OR IGNORE INTO downloads VALUES (?, ?, ?, ?, ?)", registros
+                    )
+            except sqlite3.Error as e:
+                log_erro(f"Erro ao migrar log de downloads {caminho_json}: {e}")
+                return
+            log_info(f"📋 Log de downloads migrado para SQLite: {len(registros)} requerimento(s)")
+        
+        try:
+            os.replace(caminho_json, caminho_json.with_suffix(".json.migrado"))
+        except OSError as e:
+            log_erro(f"Erro ao renomear log de downloads legado: {e}")
+    
+    def registrar(self, requerimento: str, status: str, arquivos_baixados: int = 0,
+                  erro: Optional[str] = None) -> bool:
+        """
+        Grava (ou atualiza) o status de um requerimento com o horário atual.
+        
+        Returns:
+            bool: True se gravou com sucesso
+        """
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            with self._lock, self._conexao:
+                # Upsert: mantém a posição original do requerimento no histórico
+                self._conexao.execute(
+                    """INSERT INTO downloads VALUES (?, ?, ?, ?, ?)
+                       ON CONFLICT(requerimento) DO UPDATE SET
+                           status = excluded.status, timestamp = excluded.timestamp,
+                           arquivos_baixados = excluded.arquivos_baixados, erro = excluded.erro""",
+                    (requerimento, status, timestamp, arquivos_baixados, erro)
+                )
+            return True
+        except sqlite3.Error as e:
+            log_erro(f"Erro ao gravar status do requerimento {requerimento}: {e}")
+            return False
+    
+    def obter_status(self, requerimento: str) -> Optional[str]:
+        """Retorna o status gravado para o requerimento ou None se não houver registro."""
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT status FROM downloads WHERE requerimento = ?", (requerimento,)
+            ).fetchone()
+        return linha["status"] if linha else None
+    
+    def filtrar_por_status(self, requerimentos: List[str], status: str) -> Set[str]:
+        """
+        Retorna, dentre os requerimentos informados, os que estão com o status indicado.
+        Consulta em lote, sem uma ida ao banco por requerimento.
+        """
+        encontrados: Set[str] = set()
+        with self._lock:
+            for inicio in range(0, len(requerimentos), self.TAMANHO_LOTE_CONSULTA):
+                lote = requerimentos[inicio:inicio + self.TAMANHO_LOTE_CONSULTA]
+                marcadores = ", ".join("?" * len(lote))
+                linhas = self._conexao.execute(
+                    f"SELECT requerimento FROM downloads WHERE status = ? AND requerimento IN ({marcadores})",
+                    (status, *lote)
+                ).fetchall()
+                encontrados.update(linha["requerimento"] for linha in linhas)
+        return encontrados
+    
+    def todos(self) -> Dict[str, Dict]:
+        """Retorna todos os registros no formato do antigo log em JSON."""
+        with self._lock:
+            linhas = self._conexao.execute("SELECT * FROM downloads ORDER BY rowid").fetchall()
+        
+        log_data = {}
+        for linha in linhas:
+            registro = {
+                "status": linha["status"],
+                "timestamp": linha["timestamp"],
+                "arquivos_baixados": linha["arquivos_baixados"]
+            }
+            if linha["erro"] is not None:
+                registro["erro"] = linha["erro"]
+            log_data[linha["requerimento"]] = registro
+        return log_data
+
+
+# Registro de downloads do processo, aberto na primeira utilização
+_REGISTRO_DOWNLOADS: Optional[RegistroDownloads] = None
+_LOCK_REGISTRO_DOWNLOADS = threading.Lock()
+
+
+def obter_registro_downloads() -> RegistroDownloads:
+    """Retorna o registro de downloads do processo, abrindo o banco na primeira chamada."""
+    global _REGISTRO_DOWNLOADS
+    with _LOCK_REGISTRO_DOWNLOADS:
+        if _REGISTRO_DOWNLOADS is None:
+            _REGISTRO_DOWNLOADS = RegistroDownloads(get_download_log_path())
+        return _REGISTRO_DOWNLOADS
+
+
 def carregar_log_downloads() -> Dict[str, Dict]:
     """
     Carrega o log de status dos downloads dos requerimentos.
@@ -878,26 +1289,7 @@ def carregar_log_downloads() -> Dict[str, Dict]:
                             }
                         }
     """
-    log_path = get_download_log_path()
-    log_data = carregar_json(log_path)
-    # Garantir que sempre retorna um dicionário
-    if isinstance(log_data, dict):
-        return log_data
-    return {}
-
-
-def salvar_log_downloads(log_data: Dict[str, Dict]) -> bool:
-    """
-    Salva o log de status dos downloads dos requerimentos.
-    
-    Args:
-        log_data: Dicionário com status dos downloads por requerimento
-        
-    Returns:
-        bool: True se salvou com sucesso, False caso contrário
-    """
-    log_path = get_download_log_path()
-    return salvar_json(log_data, log_path, indent=2)
+    return obter_registro_downloads().todos()
 
 
 def requerimento_ja_baixado(requerimento: str) -> bool:
@@ -910,9 +1302,7 @@ def requerimento_ja_baixado(requerimento: str) -> bool:
     Returns:
         bool: True se o requerimento já foi baixado completamente
     """
-    log_data = carregar_log_downloads()
-    req_status = log_data.get(requerimento, {})
-    return req_status.get("status") == "completed"
+    return obter_registro_downloads().obter_status(requerimento) == "completed"
 
 
 def marcar_requerimento_em_progresso(requerimento: str) -> bool:
@@ -925,16 +1315,7 @@ def marcar_requerimento_em_progresso(requerimento: str) -> bool:
     Returns:
         bool: True se marcou com sucesso
     """
-    log_data = carregar_log_downloads()
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    log_data[requerimento] = {
-        "status": "in_progress",
-        "timestamp": timestamp,
-        "arquivos_baixados": 0
-    }
-    
-    return salvar_log_downloads(log_data)
+    return obter_registro_downloads().registrar(requerimento, "in_progress")
 
 
 def marcar_requerimento_concluido(requerimento: str, arquivos_baixados: int) -> bool:
@@ -948,16 +1329,7 @@ def marcar_requerimento_concluido(requerimento: str, arquivos_baixados: int) ->
     Returns:
         bool: True se marcou com sucesso
     """
-    log_data = carregar_log_downloads()
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    log_data[requerimento] = {
-        "status": "completed",
-        "timestamp": timestamp,
-        "arquivos_baixados": arquivos_baixados
-    }
-    
-    return salvar_log_downloads(log_data)
+    return obter_registro_downloads().registrar(requerimento, "completed", arquivos_baixados)
 
 
 def marcar_requerimento_com_erro(requerimento: str, erro: str) -> bool:
@@ -971,17 +1343,7 @@ def marcar_requerimento_com_erro(requerimento: str, erro: str) -> bool:
     Returns:
         bool: True se marcou com sucesso
     """
-    log_data = carregar_log_downloads()
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    log_data[requerimento] = {
-        "status": "failed",
-        "timestamp": timestamp,
-        "erro": erro,
-        "arquivos_baixados": 0
-    }
-    
-    return salvar_log_downloads(log_data)
+    return obter_registro_downloads().registrar(requerimento, "failed", erro=erro)
 
 
 def limpar_log_downloads_se_completo(requerimentos_processados: List[str]) -> bool:
@@ -994,15 +1356,9 @@ def limpar_log_downloads_se_completo(requerimentos_processados: List[str]) -> bo
     Returns:
         bool: True se o log foi limpo (todos concluídos), False caso contrário
     """
-    log_data = carregar_log_downloads()
-    
-    # Verifica se todos os requerimentos processados foram concluídos
-    todos_concluidos = True
-    for req in requerimentos_processados:
-        req_status = log_data.get(req, {})
-        if req_status.get("status") != "completed":
-            todos_concluidos = False
-            break
+    # Verifica, em uma única consulta, se todos os requerimentos processados foram concluídos
+    concluidos = obter_registro_downloads().filtrar_por_status(requerimentos_processados, "completed")
+    todos_concluidos = all(req in concluidos for req in requerimentos_processados)
     
     if todos_concluidos and requerimentos_processados:
         # Limpa o log
@@ -1029,11 +1385,14 @@ def obter_requerimentos_pendentes(todos_requerimentos: List[str]) -> List[str]:
     Returns:
         List[str]: Lista apenas com requerimentos que ainda precisam ser baixados
     """
+    # Consulta em lote dos requerimentos já concluídos
+    concluidos = obter_registro_downloads().filtrar_por_status(todos_requerimentos, "completed")
+    
     requerimentos_pendentes = []
     requerimentos_ja_baixados = []
     
     for req in todos_requerimentos:
-        if requerimento_ja_baixado(req):
+        if req in concluidos:
             requerimentos_ja_baixados.append(req)
         else:
             requerimentos_pendentes.append(req)
@@ -1049,16 +1408,37 @@ def obter_requerimentos_pendentes(todos_requerimentos: List[str]) -> List[str]:
     return requerimentos_pendentes
 
 
-def extract_pdf_content_from_ocr(pdf_path: Path) -> Optional[str]:
+def _ocr_pagina(pdf_path: Path, numero_pagina: int) -> str:
     """
-    Extrai conteúdo de PDF usando OCR (Tesseract).
-    Função utilitária reutilizável em todo o projeto.
+    Rasteriza uma única página do PDF e extrai seu texto via OCR.
+    Apenas a imagem desta página fica em memória durante o processamento.
     
     Args:
         pdf_path: Path para o arquivo PDF
+        numero_pagina: Número da página (iniciando em 1)
         
     Returns:
-        str com o texto extraído ou None em caso de erro
+        str com o texto da página
+    """
+    imagens = convert_from_path(pdf_path, first_page=numero_pagina, last_page=numero_pagina)  # type: ignore
+    return "".join(pytesseract.image_to_string(imagem, lang=OCR_IDIOMA) for imagem in imagens)  # type: ignore
+
+
+def extrair_paginas_por_ocr(pdf_path: Path, paginas: Optional[List[int]] = None) -> Optional[List[str]]:
+    """
+    Extrai o texto de páginas de um PDF via OCR, em paralelo e página a página.
+    
+    Cada tarefa rasteriza e reconhece uma única página; o pool limitado a
+    OCR_MAX_WORKERS tarefas simultâneas também limita o pico de memória.
+    Tesseract e pdftoppm rodam como processos externos, então threads bastam
+    para ocupar vários núcleos.
+    
+    Args:
+        pdf_path: Path para o arquivo PDF
+        paginas: Números das páginas (iniciando em 1); None para todas
+        
+    Returns:
+        List[str] com o texto de cada página, na ordem de `paginas`, ou None em caso de erro
     """
     if not OCR_DISPONIVEL:
         log_erro("Dependências de OCR não disponíveis (pdf2image, pytesseract)")
@@ -1071,22 +1451,853 @@ def extract_pdf_content_from_ocr(pdf_path: Path) -> Optional[str]:
         except:
             pass
         
-        # Converte cada página do PDF em imagem
-        paginas = convert_from_path(pdf_path)  # type: ignore
-        texto_completo = ""
-
-        # Extrai texto de cada página via OCR
-        for i, pagina in enumerate(paginas, start=1):
-            texto_pagina = pytesseract.image_to_string(pagina, lang='por')  # type: ignore
-            texto_completo += texto_pagina
-            
-        return texto_completo
+        if paginas is None:
+            total_paginas = pdfinfo_from_path(pdf_path)["Pages"]  # type: ignore
+            paginas = list(range(1, total_paginas + 1))
+        
+        if not paginas:
+            return []
+        
+        workers = min(OCR_MAX_WORKERS, os.cpu_count() or 1, len(paginas))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # executor.map devolve os textos na ordem das páginas
+            return list(executor.map(lambda numero: _ocr_pagina(pdf_path, numero), paginas))
     
     except Exception as e:
         log_erro(f"Falha ao extrair por OCR {pdf_path.name}: {e}")
         return None
 
 
+def extract_pdf_content_from_ocr(pdf_path: Path) -> Optional[str]:
+    """
+    Extrai conteúdo de PDF usando OCR (Tesseract).
+    Função utilitária reutilizável em todo o projeto.
+    
+    Args:
+        pdf_path: Path para o arquivo PDF
+        
+    Returns:
+        str com o texto extraído ou None em caso de erro
+    """
+    textos_paginas = extrair_paginas_por_ocr(pdf_path)
+    return "".join(textos_paginas) if textos_paginas is not None else None
+
+
+# ================================
+# EXTRAÇÃO DE TEXTO E CACHE DE PDFs
+# ================================
+
+class CacheExtracaoPDF:
+    """
+    Cache persistente, endereçado por conteúdo, do texto extraído de PDFs.
+    
+    Cada PDF é identificado pelo hash SHA-256 do seu conteúdo, de modo que o mesmo
+    arquivo em pastas diferentes compartilha a extração. Um índice
+    caminho -> (tamanho, mtime, hash) evita recalcular o hash de arquivos que não
+    mudaram. Cada entrada guarda o texto, o número de páginas e o método de extração.
+    """
+    
+    def __init__(self, pasta_cache: Union[str, Path]):
+        self.pasta_cache = Path(pasta_cache)
+        self.pasta_cache.mkdir(parents=True, exist_ok=True)
+        self.caminho_indice = self.pasta_cache / CACHE_EXTRACAO_INDICE
+        
+        indice = carregar_json(self.caminho_indice)
+        self.indice: Dict[str, Dict[str, Any]] = indice if isinstance(indice, dict) else {}
+        self._indice_modificado = False
+        # Chaves do índice alteradas nesta sessão (repassadas ao processo principal na análise paralela)
+        self._chaves_alteradas: Set[str] = set()
+        
+        # Contadores de acertos e falhas da sessão atual
+        self.acertos = 0
+        self.falhas = 0
+    
+    @staticmethod
+    def _hash_conteudo(caminho: Path) -> str:
+        """Calcula o SHA-256 do conteúdo do arquivo, lendo em blocos de 1 MB."""
+        sha = hashlib.sha256()
+        with open(caminho, 'rb') as f:
+            for bloco in iter(lambda: f.read(1024 * 1024), b''):
+                sha.update(bloco)
+        return sha.hexdigest()
+    
+    def _obter_hash(self, caminho: Path) -> str:
+        """Obtém o hash do arquivo pelo índice, recalculando apenas se tamanho ou mtime mudaram."""
+        chave = str(Path(caminho).resolve())
+        estado = os.stat(caminho)
+        registro = self.indice.get(chave)
+        
+        if registro and registro.get('tamanho') == estado.st_size and registro.get('mtime') == estado.st_mtime_ns:
+            return registro['hash']
+        
+        hash_arquivo = self._hash_conteudo(caminho)
+        self.indice[chave] = {
+            'tamanho': estado.st_size,
+            'mtime': estado.st_mtime_ns,
+            'hash': hash_arquivo
+        }
+        self._indice_modificado = True
+        self._chaves_alteradas.add(chave)
+        return hash_arquivo
+    
+    def _caminho_entrada(self, hash_arquivo: str) -> Path:
+        """Retorna o caminho do arquivo de cache de uma entrada."""
+        return self.pasta_cache / f"{hash_arquivo}.json"
+    
+    def obter(self, caminho: Path, permitir_ocr: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Busca a extração de um PDF no cache.
+        
+        Args:
+            caminho: Path para o arquivo PDF
+            permitir_ocr: Se True, entradas que ficaram sem OCR por falta de permissão
+                          são tratadas como falha, para que o OCR seja executado
+        
+        Returns:
+            Dict com 'texto', 'paginas', 'metodo' e 'ocr_pendente' ou None se não houver entrada válida
+        """
+        try:
+            dados = carregar_json(self._caminho_entrada(self._obter_hash(caminho)))
+        except OSError:
+            dados = None
+        
+        # Entradas gravadas por outra versão do extrator são descartadas
+        if (isinstance(dados, dict) and dados.get('versao') == CACHE_EXTRACAO_VERSAO
+                and not (permitir_ocr and dados.get('ocr_pendente'))):
+            self.acertos += 1
+            return dados
+        
+        self.falhas += 1
+        return None
+    
+    def armazenar(self, caminho: Path, dados: Dict[str, Any]) -> None:
+        """Grava a extração de um PDF no cache (escrita atômica via arquivo temporário)."""
+        try:
+            destino = self._caminho_entrada(self._obter_hash(caminho))
+        except OSError as e:
+            log_erro(f"Falha ao gravar cache de extração de {Path(caminho).name}: {e}")
+            return
+        if not salvar_json_atomico({**dados, 'versao': CACHE_EXTRACAO_VERSAO}, destino):
+            log_erro(f"Falha ao gravar cache de extração de {Path(caminho).name}")
+    
+    def exportar_alteracoes(self) -> Dict[str, Any]:
+        """
+        Retorna as entradas do índice alteradas e os contadores desde a última exportação,
+        zerando-os. Usado pelos processos auxiliares da análise paralela.
+        """
+        alteracoes = {
+            'indice': {chave: self.indice[chave] for chave in self._chaves_alteradas if chave in self.indice},
+            'acertos': self.acertos,
+            'falhas': self.falhas
+        }
+        self._chaves_alteradas.clear()
+        self.acertos = 0
+        self.falhas = 0
+        return alteracoes
+    
+    def incorporar_alteracoes(self, alteracoes: Dict[str, Any]) -> None:
+        """Incorpora ao índice e aos contadores as alterações exportadas por outro processo."""
+        if alteracoes['indice']:
+            self.indice.update(alteracoes['indice'])
+            self._indice_modificado = True
+        self.acertos += alteracoes['acertos']
+        self.falhas += alteracoes['falhas']
+    
+    def remover_orfaos(self) -> int:
+        """
+        Política de expurgo: remove do índice os arquivos que não existem mais e apaga
+        as entradas de conteúdo que deixaram de ser referenciadas por algum arquivo.
+        
+        Returns:
+            int: Quantidade de entradas de conteúdo removidas
+        """
+        for chave in [c for c in self.indice if not os.path.exists(c)]:
+            del self.indice[chave]
+            self._indice_modificado = True
+        
+        hashes_ativos = {registro['hash'] for registro in self.indice.values()}
+        removidas = 0
+        for arquivo in self.pasta_cache.glob("*.json"):
+            if arquivo.name != CACHE_EXTRACAO_INDICE and arquivo.stem not in hashes_ativos:
+                try:
+                    arquivo.unlink()
+                    removidas += 1
+                except OSError as e:
+                    log_erro(f"Falha ao remover entrada do cache {arquivo.name}: {e}")
+        return removidas
+    
+    def salvar(self) -> bool:
+        """Persiste o índice do cache se houve alterações."""
+        if not self._indice_modificado:
+            return True
+        if salvar_json_atomico(self.indice, self.caminho_indice):
+            self._indice_modificado = False
+            return True
+        log_erro(f"Falha ao salvar índice do cache de extração: {self.caminho_indice}")
+        return False
+    
+    def estatisticas(self) -> Dict[str, Any]:
+        """Retorna contadores de acertos/falhas da sessão e o tamanho do índice."""
+        consultas = self.acertos + self.falhas
+        return {
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'taxa_acerto': (self.acertos / consultas) if consultas else 0.0,
+            'arquivos_indexados': len(self.indice)
+        }
+
+
+class CacheResultadosAnalise:
+    """
+    Cache persistente do resultado da análise de cada requerimento, validado por uma
+    impressão digital (hash) das entradas da análise calculada pelo chamador.
+    Uma entrada só é reaproveitada se a impressão gravada for igual à atual.
+    """
+    
+    def __init__(self, pasta_cache: Union[str, Path]):
+        self.pasta_cache = Path(pasta_cache)
+        self.pasta_cache.mkdir(parents=True, exist_ok=True)
+    
+    def _caminho_entrada(self, nome_requerimento: str) -> Path:
+        """Retorna o caminho do arquivo de cache de um requerimento."""
+        return self.pasta_cache / f"{nome_requerimento}.json"
+    
+    def obter(self, nome_requerimento: str, impressao: str) -> Optional[Dict]:
+        """Retorna o resultado em cache se a impressão coincidir, ou None."""
+        entrada = carregar_json(self._caminho_entrada(nome_requerimento))
+        if isinstance(entrada, dict) and entrada.get('impressao') == impressao:
+            return entrada.get('resultado')
+        return None
+    
+    def armazenar(self, nome_requerimento: str, impressao: str, resultado: Dict) -> None:
+        """Grava o resultado da análise de um requerimento com a sua impressão."""
+        entrada = {'impressao': impressao, 'resultado': resultado}
+        if not salvar_json_atomico(entrada, self._caminho_entrada(nome_requerimento)):
+            log_erro(f"Falha ao gravar cache de resultados do requerimento {nome_requerimento}")
+
+
+class ArquivoResultadosJSONL:
+    """
+    Registro append-only dos resultados da análise em JSON Lines: cada requerimento é
+    gravado (com flush e fsync) assim que sua análise termina, de modo que uma interrupção
+    não perde os requerimentos já concluídos e a execução pode ser retomada.
+    
+    Cada linha tem o formato {"requerimento": ..., "resultado": {...}}; se um requerimento
+    aparecer mais de uma vez, prevalece a última linha.
+    """
+    
+    def __init__(self, caminho: Union[str, Path]):
+        self.caminho = Path(caminho)
+        self._arquivo = None
+    
+    @staticmethod
+    def mais_recente(pasta: Union[str, Path]) -> Optional[Path]:
+        """Retorna o registro JSONL mais recente da pasta (pelo timestamp no nome) ou None."""
+        arquivos = sorted(Path(pasta).glob(GLOB_RESULTADOS_JSONL))
+        return arquivos[-1] if arquivos else None
+    
+    def _abrir(self) -> None:
+        """Abre o registro para acréscimo, encerrando uma última linha interrompida no meio."""
+        linha_incompleta = False
+        if self.caminho.exists() and self.caminho.stat().st_size > 0:
+            with open(self.caminho, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                linha_incompleta = f.read(1) != b'\n'
+        self._arquivo = open(self.caminho, 'a', encoding='utf-8')
+        if linha_incompleta:
+            self._arquivo.write('\n')
+    
+    def adicionar(self, requerimento: str, resultado: Dict) -> None:
+        """Acrescenta o resultado de um requerimento e o força para o disco."""
+        if self._arquivo is None:
+            self._abrir()
+        self._arquivo.write(json.dumps({'requerimento': requerimento, 'resultado': resultado}, ensure_ascii=False) + '\n')
+        self._arquivo.flush()
+        os.fsync(self._arquivo.fileno())
+    
+    def fechar(self) -> None:
+        """Fecha o registro, se aberto."""
+        if self._arquivo is not None:
+            self._arquivo.close()
+            self._arquivo = None
+    
+    def carregar(self) -> Dict[str, Dict]:
+        """
+        Lê os resultados gravados, ignorando linhas inválidas (gravação interrompida).
+        
+        Returns:
+            Dict número do requerimento -> resultado, na ordem da primeira gravação
+        """
+        resultados = {}
+        if not self.caminho.exists():
+            return resultados
+        with open(self.caminho, 'r', encoding='utf-8') as f:
+            for numero_linha, linha in enumerate(f, 1):
+                if not linha.strip():
+                    continue
+                try:
+                    registro = json.loads(linha)
+                except json.JSONDecodeError:
+                    log_erro(f"Linha {numero_linha} inválida em {self.caminho.name} ignorada (gravação interrompida?)")
+                    continue
+                resultados[registro['requerimento']] = registro['resultado']
+        return resultados
+    
+    def compactar(self, destino: Union[str, Path], requerimentos: Optional[List[str]] = None) -> bool:
+        """
+        Gera o JSON formatado (lista de resultados) a partir do registro.
+        
+        Args:
+            destino: Caminho do JSON a ser gerado
+            requerimentos: Ordem (e seleção) dos requerimentos; None mantém a ordem do registro
+            
+        Returns:
+            True se o JSON foi salvo com sucesso
+        """
+        resultados = self.carregar()
+        if requerimentos is not None:
+            lista = [resultados[req] for req in requerimentos if req in resultados]
+        else:
+            lista = list(resultados.values())
+        return salvar_json_atomico(lista, destino, indent=2)
+
+
+def _cobertura_imagens(pagina) -> float:
+    """
+    Calcula a fração da área da página coberta por imagens (0.0 a 1.0).
+    
+    Args:
+        pagina: Página PyMuPDF
+        
+    Returns:
+        float com a fração da área coberta
+    """
+    area_pagina = pagina.rect.get_area()
+    if not area_pagina:
+        return 0.0
+    area_imagens = sum((fitz.Rect(info['bbox']) & pagina.rect).get_area() for info in pagina.get_image_info())
+    return min(area_imagens / area_pagina, 1.0)
+
+
+def extrair_texto_pdf(pdf_path: Path, cache: Optional[CacheExtracaoPDF] = None,
+                      permitir_ocr: bool = True) -> Dict[str, Any]:
+    """
+    Extrai o texto de um PDF com PyMuPDF decidindo página a página entre o texto
+    nativo e o OCR, consultando e alimentando o cache de extração.
+    
+    Uma página vai para OCR quando tem menos de OCR_MIN_CARACTERES_PAGINA caracteres
+    nativos e ao menos OCR_MIN_COBERTURA_IMAGEM de sua área coberta por imagens
+    (página escaneada); as demais mantêm o texto nativo.
+    Exceções de leitura do PDF são propagadas para o chamador.
+    
+    Args:
+        pdf_path: Path para o arquivo PDF
+        cache: Cache de extração compartilhado (opcional)
+        permitir_ocr: Se False, nunca executa OCR (páginas escaneadas ficam com o texto nativo)
+    
+    Returns:
+        Dict com 'texto', 'paginas', 'metodo' (nativo/ocr/hibrido), 'paginas_ocr'
+        e 'ocr_pendente' (True quando há páginas escaneadas cujo OCR não foi feito ou falhou)
+    """
+    if cache is not None:
+        dados = cache.obter(pdf_path, permitir_ocr)
+        if dados is not None:
+            return dados
+    
+    if not PYMUPDF_DISPONIVEL:
+        log_erro("PyMuPDF não disponível. Tentando OCR...")
+        texto_ocr = extract_pdf_content_from_ocr(pdf_path) if permitir_ocr else None
+        return {
+            'texto': texto_ocr or "",
+            'paginas': 0,
+            'metodo': METODO_EXTRACAO_OCR,
+            'paginas_ocr': [],
+            'ocr_pendente': not texto_ocr
+        }
+    
+    # Texto nativo de cada página e seleção das páginas escaneadas (numeração a partir de 1)
+    textos_paginas = []
+    paginas_escaneadas = []
+    with fitz.open(pdf_path) as pdf:
+        for numero, pagina in enumerate(pdf, start=1):
+            texto_pagina = str(pagina.get_text("text"))
+            textos_paginas.append(texto_pagina)
+            if (len(texto_pagina.strip()) < OCR_MIN_CARACTERES_PAGINA
+                    and _cobertura_imagens(pagina) >= OCR_MIN_COBERTURA_IMAGEM):
+                paginas_escaneadas.append(numero)
+    
+    ocr_pendente = bool(paginas_escaneadas)
+    paginas_ocr = []
+    if paginas_escaneadas and permitir_ocr:
+        textos_ocr = extrair_paginas_por_ocr(pdf_path, paginas_escaneadas)
+        if textos_ocr is None:
+            # OCR falhou: não guarda no cache para tentar novamente na próxima execução
+            cache = None
+        else:
+            for numero, texto_ocr in zip(paginas_escaneadas, textos_ocr):
+                textos_paginas[numero - 1] = texto_ocr
+            paginas_ocr = paginas_escaneadas
+            ocr_pendente = False
+    
+    if not paginas_ocr:
+        metodo = METODO_EXTRACAO_NATIVO
+    elif len(paginas_ocr) == len(textos_paginas):
+        metodo = METODO_EXTRACAO_OCR
+    else:
+        metodo = METODO_EXTRACAO_HIBRIDO
+    
+    dados = {
+        'texto': "".join(texto_pagina + "\n" for texto_pagina in textos_paginas),
+        'paginas': len(textos_paginas),
+        'metodo': metodo,
+        'paginas_ocr': paginas_ocr,
+        'ocr_pendente': ocr_pendente
+    }
+    
+    if cache is not None:
+        cache.armazenar(pdf_path, dados)
+    return dados
+
+
+class DocumentoExtraido:
+    """
+    PDF de um requerimento lido uma única vez e compartilhado pelas verificações do seu tipo:
+    texto, texto normalizado (calculado sob demanda), páginas e metadados do arquivo.
+
+    Falhas de leitura não são propagadas: ficam em 'erro' para cada verificação reportar
+    no seu próprio formato.
+    """
+
+    def __init__(self, caminho: Path, cache: Optional[CacheExtracaoPDF] = None, permitir_ocr: bool = True):
+        self.caminho = caminho
+        self.texto = ""
+        self.paginas = 0
+        self.metodo = None
+        self.paginas_ocr: List[int] = []
+        self.ocr_pendente = False
+        self.data_modificacao: Optional[datetime] = None
+        self.erro: Optional[Exception] = None
+        self._texto_normalizado: Optional[str] = None
+
+        try:
+            self.data_modificacao = datetime.fromtimestamp(caminho.stat().st_mtime)
+            dados = extrair_texto_pdf(caminho, cache, permitir_ocr)
+            self.texto = dados['texto']
+            self.paginas = dados['paginas']
+            self.metodo = dados['metodo']
+            self.paginas_ocr = dados['paginas_ocr']
+            self.ocr_pendente = dados['ocr_pendente']
+        except Exception as e:
+            log_erro(f"Falha ao extrair {caminho.name}: {e}")
+            self.erro = e
+
+    @property
+    def conteudo_disponivel(self) -> bool:
+        """False se a leitura falhou ou se não há texto nativo e o OCR não trouxe resultado."""
+        return self.erro is None and not (self.ocr_pendente and not self.texto.strip())
+
+    @property
+    def texto_normalizado(self) -> str:
+        """Texto sem acentos e em minúsculas (ver normalizar), calculado uma vez por documento."""
+        if self._texto_normalizado is None:
+            self._texto_normalizado = normalizar(self.texto)
+        return self._texto_normalizado
+
+
+# ================================
+# BUSCA DE MÚLTIPLAS PALAVRAS-CHAVE
+# ================================
+
+class AutomatoPalavrasChave:
+    """
+    Autômato de Aho–Corasick que conta todas as palavras-chave em uma única passada pelo texto.
+    
+    A contagem de cada palavra equivale a `texto.count(palavra)` (ocorrências sem
+    sobreposição, da esquerda para a direita). Com `limite_palavra`, só contam as
+    ocorrências que não estão coladas a letras ou dígitos (ex.: "tv" deixa de casar
+    dentro de "atividade"). Usa o pacote `pyahocorasick` quando instalado e, caso
+    contrário, uma implementação própria em Python.
+    """
+    
+    def __init__(self, palavras: List[str], limite_palavra: bool = False):
+        # Palavras distintas, na ordem de entrada (palavras vazias são ignoradas)
+        self.palavras = [palavra for palavra in dict.fromkeys(palavras) if palavra]
+        self.limite_palavra = limite_palavra
+        
+        if AHOCORASICK_DISPONIVEL:
+            self._automato = ahocorasick.Automaton()
+            for indice, palavra in enumerate(self.palavras):
+                self._automato.add_word(palavra, indice)
+            if self.palavras:
+                self._automato.make_automaton()
+        else:
+            self._construir_automato()
+    
+    def _construir_automato(self) -> None:
+        """Monta a trie das palavras e calcula os links de falha por busca em largura."""
+        self._transicoes: List[Dict[str, int]] = [{}]
+        self._falhas: List[int] = [0]
+        self._saidas: List[List[int]] = [[]]
+        
+        for indice, palavra in enumerate(self.palavras):
+            estado = 0
+            for caractere in palavra:
+                proximo = self._transicoes[estado].get(caractere)
+                if proximo is None:
+                    proximo = len(self._transicoes)
+                    self._transicoes[estado][caractere] = proximo
+                    self._transicoes.append({})
+                    self._falhas.append(0)
+                    self._saidas.append([])
+                estado = proximo
+            self._saidas[estado].append(indice)
+        
+        # Filhos da raiz falham para a raiz; os demais herdam as saídas do estado de falha
+        fila = deque(self._transicoes[0].values())
+        while fila:
+            estado = fila.popleft()
+            for caractere, filho in self._transicoes[estado].items():
+                fila.append(filho)
+                falha = self._falhas[estado]
+                while falha and caractere not in self._transicoes[falha]:
+                    falha = self._falhas[falha]
+                self._falhas[filho] = self._transicoes[falha].get(caractere, 0)
+                self._saidas[filho] = self._saidas[filho] + self._saidas[self._falhas[filho]]
+    
+    def _ocorrencias(self, texto: str) -> Iterator[Tuple[int, int]]:
+        """Gera (posição final exclusiva, índice da palavra) de todas as ocorrências, em ordem de posição final."""
+        if AHOCORASICK_DISPONIVEL:
+            if self.palavras:
+                for fim, indice in self._automato.iter(texto):
+                    yield fim + 1, indice
+            return
+        
+        transicoes, falhas, saidas = self._transicoes, self._falhas, self._saidas
+        estado = 0
+        for posicao, caractere in enumerate(texto):
+            while estado and caractere not in transicoes[estado]:
+                estado = falhas[estado]
+            estado = transicoes[estado].get(caractere, 0)
+            for indice in saidas[estado]:
+                yield posicao + 1, indice
+    
+    def contar(self, texto: str) -> Dict[str, int]:
+        """
+        Conta as ocorrências de todas as palavras-chave no texto.
+        
+        Args:
+            texto: Texto a ser analisado (já normalizado pelo chamador, ex.: em minúsculas)
+            
+        Returns:
+            Dict palavra -> quantidade de ocorrências (inclui as palavras com zero ocorrências)
+        """
+        contagens = [0] * len(self.palavras)
+        # Fim da última ocorrência contada de cada palavra, para não contar sobreposições
+        fim_ultima = [0] * len(self.palavras)
+        
+        for fim, indice in self._ocorrencias(texto):
+            inicio = fim - len(self.palavras[indice])
+            if inicio < fim_ultima[indice]:
+                continue
+            if self.limite_palavra and (
+                (inicio > 0 and texto[inicio - 1].isalnum()) or (fim < len(texto) and texto[fim].isalnum())
+            ):
+                continue
+            contagens[indice] += 1
+            fim_ultima[indice] = fim
+        
+        return dict(zip(self.palavras, contagens))
+
+
+class IndiceEquipamentos:
+    """
+    Índice dos equipamentos de equipamentos.json para busca em textos de certificados.
+    
+    Os nomes são normalizados uma única vez e compilados em um AutomatoPalavrasChave,
+    de modo que cada texto é verificado em uma única passada. O índice é reconstruído
+    apenas quando o mtime do arquivo JSON muda.
+    """
+    
+    def __init__(self, caminho: Union[str, Path]):
+        self.caminho = Path(caminho)
+        self._mtime: Optional[int] = None
+        self._equipamentos: List[Dict] = []
+        # Nome normalizado -> posições das entradas em equipamentos.json
+        self._posicoes_por_nome: Dict[str, List[int]] = {}
+        self._automato: Optional[AutomatoPalavrasChave] = None
+    
+    def _atualizar(self) -> None:
+        """Reconstrói o índice se o arquivo JSON foi modificado desde a última carga."""
+        mtime = os.stat(self.caminho).st_mtime_ns
+        if mtime == self._mtime:
+            return
+        
+        with open(self.caminho, 'r', encoding='utf-8') as f:
+            equipamentos_data = json.load(f)
+        
+        self._equipamentos = [
+            equipamento for equipamento in equipamentos_data
+            if isinstance(equipamento, dict) and 'nome' in equipamento
+        ]
+        self._posicoes_por_nome = {}
+        for posicao, equipamento in enumerate(self._equipamentos):
+            self._posicoes_por_nome.setdefault(normalizar(equipamento['nome']), []).append(posicao)
+        
+        self._automato = AutomatoPalavrasChave(list(self._posicoes_por_nome))
+        self._mtime = mtime
+    
+    def buscar(self, texto: str, ja_normalizado: bool = False) -> List[Dict]:
+        """
+        Retorna os equipamentos cujo nome normalizado aparece no texto normalizado.
+        
+        Args:
+            texto: Texto do certificado
+            ja_normalizado: True se o texto já passou por normalizar() (texto do documento)
+            
+        Returns:
+            List[Dict] com cópias das entradas encontradas, sem repetições,
+            na ordem de equipamentos.json
+        """
+        self._atualizar()
+        
+        texto_normalizado = (texto if ja_normalizado else normalizar(texto)).replace("\n", " ")
+        texto_normalizado = re.sub(r'\s+', ' ', texto_normalizado).strip()
+        
+        contagens = self._automato.contar(texto_normalizado)
+        posicoes = sorted(
+            posicao
+            for nome, contador in contagens.items() if contador
+            for posicao in self._posicoes_por_nome[nome]
+        )
+        return [dict(self._equipamentos[posicao]) for posicao in posicoes]
+
+
+# Índices de equipamentos por caminho de arquivo, mantidos durante todo o processo
+_INDICES_EQUIPAMENTOS: Dict[str, IndiceEquipamentos] = {}
+
+
+def obter_indice_equipamentos(caminho: Union[str, Path]) -> IndiceEquipamentos:
+    """
+    Retorna o índice de equipamentos do arquivo informado, criando-o na primeira chamada.
+    
+    Args:
+        caminho: Caminho para equipamentos.json
+        
+    Returns:
+        IndiceEquipamentos compartilhado pelo processo
+    """
+    chave = str(Path(caminho).resolve())
+    if chave not in _INDICES_EQUIPAMENTOS:
+        _INDICES_EQUIPAMENTOS[chave] = IndiceEquipamentos(caminho)
+    return _INDICES_EQUIPAMENTOS[chave]
+
+
+# ================================
+# DADOS DE REFERÊNCIA
+# ================================
+
+class DadosReferencia:
+    """
+    Registro em memória dos arquivos de referência (ocds, normas, equipamentos e requisitos)
+    com índices em dicionário para as consultas frequentes da análise e do relatório.
+    
+    Os arquivos são lidos uma única vez e recarregados somente quando o mtime de
+    algum deles muda. Nas consultas com mais de um registro correspondente,
+    prevalece o primeiro do arquivo, como nas buscas lineares anteriores.
+    """
+    
+    ARQUIVOS = ('ocds', 'normas', 'equipamentos', 'requisitos')
+    
+    def __init__(self, pasta_utils: Union[str, Path]):
+        self.caminhos = {chave: Path(pasta_utils) / Path(JSON_FILES[chave]).name for chave in self.ARQUIVOS}
+        self._mtimes: Dict[str, Optional[int]] = {}
+        self.recarregar()
+    
+    def _obter_mtimes(self) -> Dict[str, Optional[int]]:
+        """Retorna o mtime de cada arquivo de referência (None se não existir)."""
+        mtimes = {}
+        for chave, caminho in self.caminhos.items():
+            try:
+                mtimes[chave] = os.stat(caminho).st_mtime_ns
+            except OSError:
+                mtimes[chave] = None
+        return mtimes
+    
+    def recarregar(self) -> None:
+        """Lê os arquivos de referência e reconstrói todos os índices."""
+        self._mtimes = self._obter_mtimes()
+        
+        dados = {}
+        for chave, caminho in self.caminhos.items():
+            conteudo = carregar_json_com_fallback(str(caminho)) if self._mtimes[chave] is not None else []
+            dados[chave] = conteudo if isinstance(conteudo, list) else []
+        
+        self.ocds: List[Dict] = dados['ocds']
+        self.normas: List[Dict] = dados['normas']
+        self.equipamentos: List[Dict] = dados['equipamentos']
+        self.requisitos: List[Dict] = dados['requisitos']
+        
+        # CNPJ (apenas dígitos) -> OCD
+        self._ocd_por_cnpj: Dict[str, Dict] = {}
+        for ocd in self.ocds:
+            if ocd.get('cnpj'):
+                self._ocd_por_cnpj.setdefault(desformatar_cnpj(ocd['cnpj']), ocd)
+        
+        # ID da norma -> norma
+        self._norma_por_id: Dict[str, Dict] = {}
+        for norma in self.normas:
+            self._norma_por_id.setdefault(norma.get('id'), norma)
+        
+        # ID do equipamento -> listas de normas de cada registro de requisitos, na ordem do arquivo
+        self._normas_por_equipamento: Dict[str, List[List[str]]] = {}
+        for requisito in self.requisitos:
+            self._normas_por_equipamento.setdefault(requisito.get('equipamento'), []).append(requisito.get('norma', []))
+        
+        # Nome do equipamento (exato e em minúsculas, sem espaços nas pontas) -> ID
+        self._id_por_nome_exato: Dict[str, Optional[str]] = {}
+        self._id_por_nome: Dict[str, Optional[str]] = {}
+        for equipamento in self.equipamentos:
+            self._id_por_nome_exato.setdefault(equipamento.get('nome'), equipamento.get('id'))
+            self._id_por_nome.setdefault(equipamento.get('nome', '').lower().strip(), equipamento.get('id'))
+        
+        # Resultados das buscas aproximadas (por similaridade), que exigem varredura
+        self._buscas_aproximadas_equipamento: Dict[str, Optional[str]] = {}
+        self._buscas_aproximadas_ocd: Dict[str, Optional[str]] = {}
+    
+    def _verificar_atualizacao(self) -> None:
+        """Recarrega os dados se algum arquivo de referência foi modificado."""
+        if self._obter_mtimes() != self._mtimes:
+            self.recarregar()
+    
+    def assinatura(self, chaves: Tuple[str, ...] = ARQUIVOS) -> Dict[str, Optional[int]]:
+        """Retorna os mtimes dos arquivos indicados, identificando a versão dos dados carregados."""
+        self._verificar_atualizacao()
+        return {chave: self._mtimes[chave] for chave in chaves}
+    
+    def arquivo_existe(self, chave: str) -> bool:
+        """Indica se o arquivo de referência `chave` existia na última verificação."""
+        self._verificar_atualizacao()
+        return self._mtimes[chave] is not None
+    
+    def ocd_por_cnpj(self, cnpj: str) -> Optional[Dict]:
+        """Retorna o OCD cadastrado com o CNPJ informado (com ou sem formatação)."""
+        self._verificar_atualizacao()
+        return self._ocd_por_cnpj.get(desformatar_cnpj(cnpj))
+    
+    def nome_completo_ocd(self, nome_ocd: str) -> Optional[str]:
+        """
+        Busca o nome completo cadastrado de um OCD a partir de um nome extraído:
+        primeiro por igualdade ou inclusão no nome cadastrado e, depois, exigindo
+        que todas as palavras com 4 ou mais caracteres estejam no nome cadastrado.
+        
+        Returns:
+            str com o nome cadastrado ou None se não houver correspondência
+        """
+        self._verificar_atualizacao()
+        nome_normalizado = nome_ocd.lower().strip()
+        if nome_normalizado in self._buscas_aproximadas_ocd:
+            return self._buscas_aproximadas_ocd[nome_normalizado]
+        
+        nomes = [ocd.get('nome', '') for ocd in self.ocds if ocd.get('nome', '')]
+        encontrado = next((nome for nome in nomes if nome_normalizado in nome.lower().strip()), None)
+        
+        palavras_extraidas = [p for p in nome_normalizado.split() if len(p) >= 4]
+        if encontrado is None and palavras_extraidas:
+            encontrado = next(
+                (nome for nome in nomes if all(palavra in nome.lower().strip() for palavra in palavras_extraidas)),
+                None
+            )
+        
+        self._buscas_aproximadas_ocd[nome_normalizado] = encontrado
+        return encontrado
+    
+    def norma(self, norma_id: str) -> Optional[Dict]:
+        """Retorna a norma com o ID informado."""
+        self._verificar_atualizacao()
+        return self._norma_por_id.get(norma_id)
+    
+    def ids_normas(self) -> Set[str]:
+        """Retorna o conjunto de IDs das normas cadastradas."""
+        self._verificar_atualizacao()
+        return set(self._norma_por_id)
+    
+    def normas_requeridas(self, equipamento_id: str, todos_registros: bool = False) -> List[str]:
+        """
+        Retorna os IDs das normas exigidas para um equipamento em requisitos.json.
+        
+        Args:
+            equipamento_id: ID do equipamento
+            todos_registros: Se True, concatena as normas de todos os registros do
+                             equipamento; caso contrário, usa apenas o primeiro
+        """
+        self._verificar_atualizacao()
+        registros = self._normas_por_equipamento.get(equipamento_id, [])
+        if todos_registros:
+            return [norma for normas in registros for norma in normas]
+        return list(registros[0]) if registros else []
+    
+    def id_equipamento_por_nome_exato(self, nome_equipamento: str) -> Optional[str]:
+        """Retorna o ID do equipamento cujo nome é exatamente o informado."""
+        self._verificar_atualizacao()
+        return self._id_por_nome_exato.get(nome_equipamento)
+    
+    def id_equipamento_por_nome(self, nome_equipamento: str) -> Optional[str]:
+        """
+        Busca o ID de um equipamento pelo nome: correspondência exata (sem diferenciar
+        maiúsculas), depois inclusão de um nome no outro e, por fim, qualquer palavra
+        com 4 ou mais caracteres contida no nome cadastrado.
+        
+        Returns:
+            str com o ID ou None se não houver correspondência
+        """
+        self._verificar_atualizacao()
+        nome_normalizado = nome_equipamento.lower().strip()
+        if nome_normalizado in self._id_por_nome:
+            return self._id_por_nome[nome_normalizado]
+        if nome_normalizado in self._buscas_aproximadas_equipamento:
+            return self._buscas_aproximadas_equipamento[nome_normalizado]
+        
+        nomes_ids = [(equipamento.get('nome', '').lower().strip(), equipamento.get('id')) for equipamento in self.equipamentos]
+        encontrado = next(
+            (eq_id for nome_json, eq_id in nomes_ids if nome_normalizado in nome_json or nome_json in nome_normalizado),
+            None
+        )
+        
+        palavras_extraidas = [p for p in nome_normalizado.split() if len(p) >= 4]
+        if encontrado is None and palavras_extraidas:
+            encontrado = next(
+                (eq_id for nome_json, eq_id in nomes_ids if any(palavra in nome_json for palavra in palavras_extraidas)),
+                None
+            )
+        
+        self._buscas_aproximadas_equipamento[nome_normalizado] = encontrado
+        return encontrado
+    
+    def equipamentos_no_texto(self, texto: str, ja_normalizado: bool = False) -> List[Dict]:
+        """Retorna os equipamentos cujo nome aparece no texto (ver IndiceEquipamentos)."""
+        return obter_indice_equipamentos(self.caminhos['equipamentos']).buscar(texto, ja_normalizado)
+
+
+# Registros de dados de referência por pasta, mantidos durante todo o processo
+_DADOS_REFERENCIA: Dict[str, DadosReferencia] = {}
+
+
+def obter_dados_referencia(pasta_utils: Union[str, Path] = UTILS_DIR) -> DadosReferencia:
+    """
+    Retorna o registro de dados de referência da pasta informada, criando-o na primeira chamada.
+    
+    Args:
+        pasta_utils: Pasta com os arquivos JSON de referência (padrão: UTILS_DIR)
+        
+    Returns:
+        DadosReferencia compartilhado pelo processo
+    """
+    chave = str(Path(pasta_utils).resolve())
+    if chave not in _DADOS_REFERENCIA:
+        _DADOS_REFERENCIA[chave] = DadosReferencia(pasta_utils)
+    return _DADOS_REFERENCIA[chave]
+
+
 def testar_radiacao_restrita(nome_equipamento: str) -> bool:
     """
     Testa se um equipamento é do tipo "Radiação Restrita" buscando no arquivo equipamentos.json.
@@ -1100,15 +2311,142 @@ def testar_radiacao_restrita(nome_equipamento: str) -> bool:
         bool: True se o equipamento for de radiação restrita (EQ078), False caso contrário
     """
     try:
-        # Carregar dados do arquivo equipamentos.json        
-        equipamentos = carregar_json_com_fallback(JSON_FILES['equipamentos'])
-        
-        # Buscar equipamento por nome exato usando a função utilitária
-        id_equipamento = buscar_valor(equipamentos, 'nome', nome_equipamento, 'id')
+        # Buscar equipamento por nome exato no registro de dados de referência
+        id_equipamento = obter_dados_referencia().id_equipamento_por_nome_exato(nome_equipamento)
         
         # Verificar se o ID encontrado é EQ093 (Radiação Restrita)
         return id_equipamento in ['EQ093', 'EQ088', 'EQ078', 'EQ053'] 
         
     except Exception as e:
         log_erro(f"Erro ao testar radiação restrita para '{nome_equipamento}': {e}")
-        return False
\ No newline at end of file
+        return False
+
+
+# ================================
+# COMPILAÇÃO LATEX
+# ================================
+
+def _hash_arquivo_opcional(caminho: Path) -> Optional[str]:
+    """Retorna o SHA-256 do arquivo ou None se ele não existir."""
+    try:
+        return hashlib.sha256(caminho.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _encerrar_arvore_processos(processo: subprocess.Popen) -> None:
+    """Encerra o processo e todos os seus filhos (o grupo/árvore criado por _executar_compilador)."""
+    if os.name == 'nt':
+        subprocess.run(["taskkill", "/T", "/F", "/PID", str(processo.pid)], capture_output=True)
+    else:
+        try:
+            os.killpg(processo.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+def _executar_compilador(comando: List[str], pasta: Path, timeout: Optional[float]) -> subprocess.CompletedProcess:
+    """
+    Executa o compilador LaTeX em um grupo de processos próprio. Se o timeout expirar, o grupo
+    inteiro é encerrado (inclusive o pdflatex iniciado pelo latexmk, que do contrário continuaria
+    rodando e ocupando a pasta de build) e subprocess.TimeoutExpired é propagada.
+    """
+    if os.name == 'nt':
+        opcoes_processo = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        opcoes_processo = {'start_new_session': True}
+    
+    with subprocess.Popen(comando, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                          cwd=str(pasta), **opcoes_processo) as processo:
+        try:
+            stdout, stderr = processo.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _encerrar_arvore_processos(processo)
+            processo.communicate()
+            raise
+    return subprocess.CompletedProcess(comando, processo.returncode, stdout, stderr)
+
+
+def compilar_latex(caminho_tex: Path, pasta_build: Path, nome_job: str,
+                   rascunho: bool = False, timeout: Optional[float] = None) -> Optional[Path]:
+    """
+    Compila um arquivo LaTeX mantendo os arquivos auxiliares em `pasta_build`.
+    
+    Com um `nome_job` estável, o .aux/.toc da compilação anterior é reaproveitado.
+    Usa o latexmk quando disponível; caso contrário executa o pdflatex novamente apenas
+    enquanto o checksum do .aux mudar (até LATEX_MAX_PASSADAS vezes). No modo rascunho
+    executa uma única passada (referências cruzadas podem ficar desatualizadas).
+    
+    Args:
+        caminho_tex: Path absoluto para o arquivo .tex
+        pasta_build: Pasta para os arquivos gerados e auxiliares
+        nome_job: Nome base dos arquivos gerados (-jobname)
+        rascunho: Se True, compila uma única vez
+        timeout: Tempo máximo (segundos) de cada execução do compilador (ao expirar,
+                 o compilador e seus processos filhos são encerrados)
+        
+    Returns:
+        Path do PDF gerado em `pasta_build` ou None em caso de falha
+    
+    Raises:
+        FileNotFoundError: Se o pdflatex não estiver instalado
+        subprocess.TimeoutExpired: Se uma execução exceder o timeout
+    """
+    pasta_build.mkdir(parents=True, exist_ok=True)
+    opcoes_pdflatex = ["-interaction=nonstopmode", "-halt-on-error", f"-jobname={nome_job}",
+                       f"-output-directory={pasta_build}"]
+    caminho_pdf = pasta_build / f"{nome_job}.pdf"
+    
+    if not rascunho and shutil.which("latexmk"):
+        # latexmk decide sozinho quantas passadas são necessárias
+        resultado = _executar_compilador(
+            ["latexmk", "-pdf", f"-outdir={pasta_build}", f"-jobname={nome_job}",
+             "-interaction=nonstopmode", "-halt-on-error", str(caminho_tex)],
+            caminho_tex.parent, timeout
+        )
+        if resultado.returncode != 0:
+            log_erro(f"Erro na compilação LaTeX (latexmk): {resultado.stdout[-2000:]}{resultado.stderr}")
+            return None
+        return caminho_pdf
+    
+    caminho_aux = pasta_build / f"{nome_job}.aux"
+    hash_aux = _hash_arquivo_opcional(caminho_aux)
+    passadas = 1 if rascunho else LATEX_MAX_PASSADAS
+    
+    for passada in range(1, passadas + 1):
+        resultado = _executar_compilador(["pdflatex", *opcoes_pdflatex, str(caminho_tex)], caminho_tex.parent, timeout)
+        if resultado.returncode != 0:
+            log_erro(f"Erro na compilação LaTeX: {resultado.stdout[-2000:]}{resultado.stderr}")
+            return None
+        
+        # .aux estável: referências cruzadas e sumário já estão resolvidos
+        novo_hash_aux = _hash_arquivo_opcional(caminho_aux)
+        if novo_hash_aux == hash_aux:
+            break
+        hash_aux = novo_hash_aux
+    
+    log_info(f"LaTeX compilado em {passada} passada(s)")
+    return caminho_pdf
+
+
+def mesclar_pdfs(caminhos_pdf: List[Path], destino: Path) -> bool:
+    """
+    Concatena os PDFs indicados, na ordem recebida, em um único arquivo.
+    
+    Args:
+        caminhos_pdf: PDFs a serem concatenados
+        destino: Caminho do PDF resultante
+        
+    Returns:
+        bool: True se o PDF foi gerado, False se o PyMuPDF não estiver disponível
+    """
+    if not PYMUPDF_DISPONIVEL:
+        log_erro("PyMuPDF não disponível - os PDFs não foram mesclados")
+        return False
+    
+    with fitz.open() as documento:
+        for caminho in caminhos_pdf:
+            with fitz.open(caminho) as parte:
+                documento.insert_pdf(parte)
+        documento.save(str(destino))
+    return True
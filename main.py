@@ -1,8 +1,11 @@
+import argparse
+import multiprocessing
+
 from core.downloader import baixar_documentos
 from core.analyzer import analisar_requerimento
 from core.menu import exibir_menu
 from core.log_print import log_info, log_erro, log_erro_critico
-from core.const import OPCOES_MENU, SEPARADOR_MENOR
+from core.const import OPCOES_MENU, SEPARADOR_MENOR, WORKERS_ANALISE_PADRAO, ABAS_DOWNLOAD_PADRAO, ABAS_DOWNLOAD_MAX
 
 def obter_tipo_download():
     """
@@ -38,7 +41,44 @@ def obter_tipo_download():
             log_erro(f"Erro inesperado na seleção de tipo: {str(e)}")
             log_info("Erro inesperado. Tente novamente.")
 
+def obter_argumentos() -> argparse.Namespace:
+    """
+    Lê os argumentos de linha de comando.
+    
+    Returns:
+        argparse.Namespace: Argumentos da execução
+    """
+    parser = argparse.ArgumentParser(description="ORCN Utils - download e análise de requerimentos")
+    parser.add_argument(
+        "--abas", type=int, default=ABAS_DOWNLOAD_PADRAO,
+        help=f"Abas simultâneas no download de documentos (padrão: {ABAS_DOWNLOAD_PADRAO}, máximo: {ABAS_DOWNLOAD_MAX})"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=WORKERS_ANALISE_PADRAO,
+        help=f"Processos paralelos na análise de todos os requerimentos (padrão: {WORKERS_ANALISE_PADRAO})"
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="Reaproveita o resultado dos requerimentos cujos arquivos e dados de referência não mudaram"
+    )
+    parser.add_argument(
+        "--rascunho", action="store_true",
+        help="Compila o relatório LaTeX em uma única passada (pré-visualização rápida)"
+    )
+    parser.add_argument(
+        "--por-requerimento", action="store_true",
+        help="Gera um relatório por requerimento, compilados em paralelo e mesclados em um único PDF"
+    )
+    parser.add_argument(
+        "--retomar", action="store_true",
+        help="Na análise de todos os requerimentos, continua o registro de resultados (.jsonl) mais recente, "
+             "pulando os requerimentos já concluídos"
+    )
+    return parser.parse_args()
+
 def main():
+    argumentos = obter_argumentos()
+    
     while True:
         try:
             opcao = exibir_menu()
@@ -53,14 +93,15 @@ def main():
                 if retorno_para_estudo is None:
                     continue
                 
-                baixar_documentos(retorno_para_estudo)
+                baixar_documentos(retorno_para_estudo, argumentos.abas)
                 print("\n" + SEPARADOR_MENOR)
                 print("Pressione ENTER para voltar ao menu...")
                 input()
                 
             elif opcao == OPCOES_MENU['analise']:
                 log_info("Iniciando análise de requerimentos...")
-                analisar_requerimento()
+                analisar_requerimento(argumentos.workers, argumentos.incremental, argumentos.rascunho,
+                                      argumentos.por_requerimento, argumentos.retomar)
                 print("\n" + SEPARADOR_MENOR)
                 print("Pressione ENTER para voltar ao menu...")
                 input()
@@ -81,4 +122,6 @@ def main():
             input()
 
 if __name__ == "__main__":
+    # Necessário para o ProcessPoolExecutor da análise paralela em executáveis Windows
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file